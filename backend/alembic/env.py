@@ -24,6 +24,7 @@ from app.models.media_queue import MediaQueue
 from app.models.player import Player
 from app.models.player_statistic import PlayerStatistic
 from app.models.media_clip import MediaClip
+from app.models.llm_cache_entry import LLMCacheEntry
 
 config = context.config
 
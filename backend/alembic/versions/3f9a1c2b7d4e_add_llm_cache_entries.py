@@ -0,0 +1,41 @@
+"""add_llm_cache_entries
+
+Revision ID: 3f9a1c2b7d4e
+Revises: a1b2c3d4e5f7
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3f9a1c2b7d4e'
+down_revision: Union[str, None] = 'a1b2c3d4e5f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'llm_cache_entries',
+        sa.Column('key', sa.String(length=64), primary_key=True),
+        sa.Column('provider', sa.String(length=20), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=True),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column(
+            'created_at',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        'ix_llm_cache_entries_created_at', 'llm_cache_entries', ['created_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_llm_cache_entries_created_at', table_name='llm_cache_entries')
+    op.drop_table('llm_cache_entries')
@@ -0,0 +1,75 @@
+"""add_hot_query_indexes
+
+Revision ID: 5d7b9e1f3a2c
+Revises: 8c2e4a6b1d3f
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '5d7b9e1f3a2c'
+down_revision: Union[str, None] = '8c2e4a6b1d3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (Name, Tabelle, Spalten, weitere Optionen) – muss zu den __table_args__ passen
+_INDEXES = [
+    ('ix_events_match_position', 'events', ['match_id', 'position', 'time'], {}),
+    ('ix_events_source_id', 'events', ['source_id'], {}),
+    ('ix_ticker_entries_match_phase', 'ticker_entries', ['match_id', 'phase'], {}),
+    (
+        'ix_ticker_entries_match_synthetic',
+        'ticker_entries',
+        ['match_id', 'synthetic_event_id'],
+        {'postgresql_where': sa.text('synthetic_event_id IS NOT NULL')},
+    ),
+    ('ix_ticker_entries_event_id', 'ticker_entries', ['event_id'], {}),
+    (
+        'ix_synthetic_events_match_type',
+        'synthetic_events',
+        ['match_id', 'type'],
+        {'postgresql_ops': {'type': 'varchar_pattern_ops'}},
+    ),
+    (
+        'ix_media_queue_pending_created',
+        'media_queue',
+        [sa.text('created_at DESC')],
+        {'postgresql_where': sa.text("status = 'pending'")},
+    ),
+    (
+        'ix_media_clips_source_published_created',
+        'media_clips',
+        ['source', 'published', 'created_at'],
+        {},
+    ),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY, damit Ticker/Events während eines Spieltags beschreibbar bleiben
+    with op.get_context().autocommit_block():
+        for name, table, columns, kwargs in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kwargs,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,68 @@
+"""add_ticker_sort_key_and_version
+
+Revision ID: 8c2e4a6b1d3f
+Revises: 3f9a1c2b7d4e
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '8c2e4a6b1d3f'
+down_revision: Union[str, None] = '3f9a1c2b7d4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Muss app.models.ticker_entry.compute_sort_key entsprechen
+_BACKFILL = """
+UPDATE ticker_entries SET sort_key =
+    (CASE phase
+        WHEN 'Before' THEN 0
+        WHEN 'FirstHalf' THEN 1
+        WHEN 'FirstHalfBreak' THEN 2
+        WHEN 'SecondHalf' THEN 3
+        WHEN 'SecondHalfBreak' THEN 4
+        WHEN 'ExtraFirstHalf' THEN 5
+        WHEN 'ExtraBreak' THEN 6
+        WHEN 'ExtraSecondHalf' THEN 7
+        WHEN 'ExtraSecondHalfBreak' THEN 8
+        WHEN 'PenaltyShootout' THEN 9
+        WHEN 'After' THEN 10
+        ELSE 5
+    END) * 100000
+    + COALESCE(LEAST(GREATEST(minute, 0), 9999), 999) * 10
+    + CASE
+        WHEN synthetic_event_id IS NOT NULL AND phase IN (
+            'FirstHalf', 'SecondHalf', 'ExtraFirstHalf', 'ExtraSecondHalf',
+            'PenaltyShootout'
+        ) THEN 0
+        ELSE 1
+    END
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        'ticker_entries',
+        sa.Column('sort_key', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.execute(_BACKFILL)
+    op.create_index(
+        'ix_ticker_entries_match_status_sort',
+        'ticker_entries',
+        ['match_id', 'status', 'sort_key'],
+    )
+    op.add_column(
+        'matches',
+        sa.Column('ticker_version', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('matches', 'ticker_version')
+    op.drop_index('ix_ticker_entries_match_status_sort', table_name='ticker_entries')
+    op.drop_column('ticker_entries', 'sort_key')
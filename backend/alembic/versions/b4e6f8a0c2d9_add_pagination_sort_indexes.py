@@ -0,0 +1,42 @@
+"""add_pagination_sort_indexes
+
+Revision ID: b4e6f8a0c2d9
+Revises: 5d7b9e1f3a2c
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'b4e6f8a0c2d9'
+down_revision: Union[str, None] = '5d7b9e1f3a2c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Sortierschlüssel der Listen-Endpunkte (app.utils.pagination)
+_INDEXES = [
+    ('ix_players_name_sort', 'players', ['last_name', 'first_name', 'id']),
+    ('ix_teams_position_name', 'teams', ['position', 'name', 'id']),
+    ('ix_matches_starts_at_id', 'matches', ['starts_at', 'id']),
+    ('ix_seasons_starts_at_id', 'seasons', ['starts_at', 'id']),
+    ('ix_seasons_title_id', 'seasons', ['title', 'id']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(_INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
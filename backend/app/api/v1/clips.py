@@ -9,18 +9,20 @@ Endpunkte:
 - POST /clips/{clip_id}/draft → KI-Textentwurf generieren
 - POST /clips/{clip_id}/publish → Im Ticker veröffentlichen
 - DELETE /clips/{clip_id}     → Clip löschen
+- POST /clips/cache-thumbnail(s) → Thumbnails lokal cachen (einzeln / Batch)
 """
 
+import asyncio
 import logging
-import os
 from typing import Optional
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
+from sqlalchemy import bindparam, func, literal_column, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
 from app.models.match import Match
 from app.models.media_clip import MediaClip
 from app.schemas.media_clip import (
@@ -31,6 +33,8 @@ from app.schemas.media_clip import (
 from app.schemas.ticker_entry import TickerEntryCreate, TickerEntryResponse
 from app.repositories.ticker_entry_repository import TickerEntryRepository
 from app.services.llm_service import generate_ticker_text
+from app.services.thumbnail_cache import thumbnail_cache
+from app.services.ticker_feed import ticker_feed
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +46,19 @@ router = APIRouter(prefix="/clips", tags=["Clips"])
 # ──────────────────────────────────────────────
 
 
+_DEFAULT_SOURCE = "bundesliga"
+
+# Bei bekannter vid: neuer Wert nur, wenn gesetzt – sonst bestehender bleibt
+_MERGE_FIELDS = (
+    "match_id",
+    "thumbnail_url",
+    "title",
+    "player_name",
+    "team_name",
+    "source",
+)
+
+
 @router.post(
     "/import",
     response_model=list[MediaClipResponse],
@@ -52,39 +69,93 @@ def import_clips(
     data: MediaClipImportRequest,
     db: Session = Depends(get_db),
 ) -> list[MediaClipResponse]:
-    results = []
+    """
+    Set-basierter Import: ein INSERT … ON CONFLICT (vid) DO UPDATE für alle
+    Clips mit vid, ein INSERT für Clips ohne vid – statt SELECT + flush pro
+    Clip und refresh pro Zeile.
+
+    Merge-Regeln wie bisher: bei bekannter vid werden match_id, thumbnail_url,
+    title, player_name, team_name und source nur überschrieben, wenn der neue
+    Wert gesetzt ist; video_url bleibt. Der Default "bundesliga" für source
+    gilt nur für neu angelegte Clips.
+    """
+    # Gleiche vid mehrfach im Batch → vorab zusammenführen (ON CONFLICT darf
+    # eine Zeile nur einmal pro Statement treffen)
+    by_vid: dict[str, dict] = {}
+    without_vid: list[dict] = []
+    order: list[tuple[str, object]] = []
     for c in data.clips:
-        # Upsert: wenn vid bekannt, nur aktualisieren
-        existing = None
-        if c.vid:
-            existing = db.query(MediaClip).filter(MediaClip.vid == c.vid).first()
-
-        if existing:
-            existing.match_id = data.match_id or existing.match_id
-            existing.thumbnail_url = c.thumbnail_url or existing.thumbnail_url
-            existing.title = c.title or existing.title
-            existing.player_name = c.player_name or existing.player_name
-            existing.team_name = c.team_name or existing.team_name
-            existing.source = c.source or existing.source
-            results.append(existing)
+        row = {
+            "match_id": data.match_id,
+            "vid": c.vid,
+            "video_url": c.video_url,
+            "thumbnail_url": c.thumbnail_url,
+            "title": c.title,
+            "player_name": c.player_name,
+            "team_name": c.team_name,
+            "source": c.source or None,
+        }
+        if not c.vid:
+            row["source"] = row["source"] or _DEFAULT_SOURCE
+            order.append(("new", len(without_vid)))
+            without_vid.append(row)
+            continue
+        order.append(("vid", c.vid))
+        known = by_vid.get(c.vid)
+        if known is None:
+            by_vid[c.vid] = row
         else:
-            clip = MediaClip(
-                match_id=data.match_id,
-                vid=c.vid,
-                video_url=c.video_url,
-                thumbnail_url=c.thumbnail_url,
-                title=c.title,
-                player_name=c.player_name,
-                team_name=c.team_name,
-                source=c.source or "bundesliga",
-            )
-            db.add(clip)
-            db.flush()
-            results.append(clip)
+            for field in _MERGE_FIELDS:
+                known[field] = row[field] or known[field]
+
+    upserted: dict[str, MediaClip] = {}
+    created_without_source: list[int] = []
+    if by_vid:
+        stmt = insert(MediaClip).values(list(by_vid.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MediaClip.vid],
+            set_={
+                field: func.coalesce(
+                    func.nullif(stmt.excluded[field], "")
+                    if field != "match_id"
+                    else stmt.excluded[field],
+                    getattr(MediaClip, field),
+                )
+                for field in _MERGE_FIELDS
+            },
+        # xmax = 0 → Zeile wurde eingefügt, nicht aktualisiert
+        ).returning(MediaClip, literal_column("xmax = 0").label("inserted"))
+        for clip, was_inserted in db.execute(
+            stmt, execution_options={"populate_existing": True}
+        ):
+            upserted[clip.vid] = clip
+            if was_inserted and clip.source is None:
+                created_without_source.append(clip.id)
+
+    if created_without_source:
+        # Default nur für neue Clips – im Upsert-Payload würde er eine bereits
+        # gespeicherte source überschreiben
+        db.execute(
+            update(MediaClip)
+            .where(MediaClip.id.in_(created_without_source))
+            .values(source=_DEFAULT_SOURCE)
+        )
 
+    inserted: list[MediaClip] = []
+    if without_vid:
+        stmt = insert(MediaClip).values(without_vid).returning(MediaClip)
+        # IDs werden in VALUES-Reihenfolge vergeben → nach id = Eingangsreihenfolge
+        inserted = sorted(db.scalars(stmt), key=lambda clip: clip.id)
+
+    # Vor dem Commit serialisieren – danach wären alle Objekte expired und
+    # jede Zeile würde einzeln nachgeladen
+    results = [
+        MediaClipResponse.model_validate(
+            upserted[key] if kind == "vid" else inserted[key]
+        )
+        for kind, key in order
+    ]
     db.commit()
-    for r in results:
-        db.refresh(r)
     return results
 
 
@@ -264,6 +335,7 @@ def publish_clip(
 
     clip.published = True
     db.commit()
+    ticker_feed.publish(entry.match_id, "created", entry)
 
     return entry
 
@@ -293,10 +365,7 @@ def delete_clip(
 # CACHE THUMBNAIL
 # ──────────────────────────────────────────────
 
-THUMBNAILS_DIR = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-    "static", "thumbnails"
-)
+_INSTAGRAM_REFERER = "https://www.instagram.com/"
 
 
 class CacheThumbnailRequest(BaseModel):
@@ -304,33 +373,69 @@ class CacheThumbnailRequest(BaseModel):
     thumbnail_url: str
 
 
-@router.post("/cache-thumbnail", summary="Instagram-Thumbnail lokal speichern")
-def cache_thumbnail(
-    req: CacheThumbnailRequest,
-    db: Session = Depends(get_db),
-) -> dict:
-    os.makedirs(THUMBNAILS_DIR, exist_ok=True)
-    ext = ".jpg"
-    filename = f"{req.vid}{ext}"
-    filepath = os.path.join(THUMBNAILS_DIR, filename)
+class CacheThumbnailsBatchRequest(BaseModel):
+    clips: list[CacheThumbnailRequest]
+
+
+def _rewrite_thumbnail_urls(db: Session, urls_by_vid: dict[str, str]) -> None:
+    """Setzt MediaClip.thumbnail_url für alle vids in einem executemany-UPDATE."""
+    if not urls_by_vid:
+        return
+    # Core-UPDATE: update(MediaClip) mit Parameterliste verlangt den Primärschlüssel
+    table = MediaClip.__table__
+    db.connection().execute(
+        update(table)
+        .where(table.c.vid == bindparam("b_vid"))
+        .values(thumbnail_url=bindparam("b_url")),
+        [{"b_vid": vid, "b_url": url} for vid, url in urls_by_vid.items()],
+    )
+    db.commit()
 
+
+def _store_thumbnail_urls(urls_by_vid: dict[str, str]) -> None:
+    """Eigene Session, läuft per asyncio.to_thread – nicht im Event-Loop."""
+    if not urls_by_vid:
+        return
+    db = SessionLocal()
+    try:
+        _rewrite_thumbnail_urls(db, urls_by_vid)
+    finally:
+        db.close()
+
+
+@router.post("/cache-thumbnail", summary="Instagram-Thumbnail lokal speichern")
+async def cache_thumbnail(req: CacheThumbnailRequest) -> dict:
     try:
-        with httpx.Client(follow_redirects=True, timeout=15) as client:
-            resp = client.get(
-                req.thumbnail_url,
-                headers={"Referer": "https://www.instagram.com/"},
-            )
-            resp.raise_for_status()
-            with open(filepath, "wb") as f:
-                f.write(resp.content)
+        filename = await thumbnail_cache.fetch(
+            req.thumbnail_url, referer=_INSTAGRAM_REFERER
+        )
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Download fehlgeschlagen: {e}")
 
-    local_url = f"http://localhost:8001/static/thumbnails/{filename}"
+    await thumbnail_cache.ensure_variants(filename)
+    local_url = thumbnail_cache.public_url(filename)
+    await asyncio.to_thread(_store_thumbnail_urls, {req.vid: local_url})
+    return {"local_url": local_url}
 
-    clip = db.query(MediaClip).filter(MediaClip.vid == req.vid).first()
-    if clip:
-        clip.thumbnail_url = local_url
-        db.commit()
 
-    return {"local_url": local_url}
+@router.post(
+    "/cache-thumbnails",
+    summary="Thumbnails eines ganzen Clip-Batches parallel lokal speichern",
+)
+async def cache_thumbnails_batch(req: CacheThumbnailsBatchRequest) -> dict:
+    outcomes = await thumbnail_cache.prefetch(
+        {c.vid: c.thumbnail_url for c in req.clips}, referer=_INSTAGRAM_REFERER
+    )
+    cached: dict[str, str] = {}
+    failed: dict[str, str] = {}
+    filenames: set[str] = set()
+    for vid, outcome in outcomes.items():
+        if isinstance(outcome, Exception):
+            logger.warning("Thumbnail-Download fehlgeschlagen für vid=%s: %s", vid, outcome)
+            failed[vid] = str(outcome)
+        else:
+            filenames.add(outcome)
+            cached[vid] = thumbnail_cache.public_url(outcome)
+    await asyncio.gather(*(thumbnail_cache.ensure_variants(f) for f in filenames))
+    await asyncio.to_thread(_store_thumbnail_urls, cached)
+    return {"cached": cached, "failed": failed}
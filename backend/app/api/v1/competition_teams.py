@@ -8,6 +8,7 @@ from app.core.database import get_db
 from app.repositories.competition_repository import CompetitionRepository
 from app.repositories.competition_team_repository import CompetitionTeamRepository
 from app.schemas.competition_team import CompetitionTeamAssignResponse
+from app.services.reference_cache import reference_cache
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,7 @@ def assign_team(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="seasonId, competitionId or teamId does not exist.",
         )
+    reference_cache.invalidate("competitions")
 
     return CompetitionTeamAssignResponse(
         uid=entry.uid,
@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -12,6 +12,7 @@ from app.schemas.competition import (
     CompetitionResponse,
     CompetitionUpdate,
 )
+from app.services.reference_cache import reference_cache
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +26,23 @@ router = APIRouter(prefix="/competitions", tags=["Competitions"])
     summary="List competitions",
 )
 def get_competitions(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     hidden: Optional[bool] = Query(None, description="Filter by visibility"),
     db: Session = Depends(get_db),
-) -> list[CompetitionResponse]:
-    return CompetitionRepository(db).get_all(skip=skip, limit=limit, hidden=hidden)
+) -> Response:
+    return reference_cache.respond(
+        request,
+        "competitions",
+        ("list", skip, limit, hidden),
+        lambda: [
+            CompetitionResponse.model_validate(c)
+            for c in CompetitionRepository(db).get_all(
+                skip=skip, limit=limit, hidden=hidden
+            )
+        ],
+    )
 
 
 @router.get(
@@ -63,13 +75,15 @@ def create_competition(
     db: Session = Depends(get_db),
 ) -> CompetitionResponse:
     try:
-        return CompetitionRepository(db).create(data)
+        competition = CompetitionRepository(db).create(data)
     except IntegrityError:
         logger.exception("IntegrityError creating competition: %s", data.title)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A competition with conflicting data already exists.",
         )
+    reference_cache.invalidate("competitions")
+    return competition
 
 
 @router.put(
@@ -100,6 +114,7 @@ def update_competition(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Competition not found"
         )
+    reference_cache.invalidate("competitions")
     return updated
 
 
@@ -116,3 +131,4 @@ def delete_competition(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Competition not found"
         )
+    reference_cache.invalidate("competitions", "matchdays")
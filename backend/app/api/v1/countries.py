@@ -1,12 +1,13 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.repositories.country_repository import CountryRepository
 from app.schemas.country import CountryCreate, CountryResponse
+from app.services.reference_cache import reference_cache
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +21,20 @@ router = APIRouter(prefix="/countries", tags=["Countries"])
     summary="List all countries",
 )
 def get_countries(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(300, ge=1, le=500),
     db: Session = Depends(get_db),
-) -> list[CountryResponse]:
-    return CountryRepository(db).get_all(skip=skip, limit=limit)
+) -> Response:
+    return reference_cache.respond(
+        request,
+        "countries",
+        ("list", skip, limit),
+        lambda: [
+            CountryResponse.model_validate(c)
+            for c in CountryRepository(db).get_all(skip=skip, limit=limit)
+        ],
+    )
 
 
 @router.get(
@@ -57,10 +67,12 @@ def upsert_country(
     db: Session = Depends(get_db),
 ) -> CountryResponse:
     try:
-        return CountryRepository(db).upsert(data)
+        country = CountryRepository(db).upsert(data)
     except IntegrityError:
         logger.exception("IntegrityError upserting country: %s", data.name)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Country '{data.name}' already exists with conflicting data.",
-        )
\ No newline at end of file
+        )
+    reference_cache.invalidate("countries")
+    return country
@@ -1,13 +1,12 @@
+import asyncio
 import logging
 from typing import Optional
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
 from app.models.player_statistic import PlayerStatistic
 from app.models.synthetic_event import SyntheticEvent
 from app.repositories.match_repository import MatchRepository
@@ -22,6 +21,9 @@ from app.schemas.match import (
     StatisticsBulkUpdate,
 )
 from app.schemas.player import PlayerStatisticResponse
+from app.services.api_football import ApiFootballError, api_football
+from app.services.live_sync import fixture_update
+from app.services.reference_cache import reference_cache
 
 logger = logging.getLogger(__name__)
 
@@ -46,24 +48,39 @@ def get_matches(
     competition_id: Optional[int] = Query(None, gt=0, alias="competitionId"),
     matchday: Optional[int] = Query(None, ge=1),
     match_state: Optional[str] = Query(None, alias="matchState"),
+    cursor: Optional[str] = Query(
+        None, description="nextCursor der vorigen Seite (Keyset-Modus, ersetzt page)"
+    ),
+    skip_total: bool = Query(False, alias="skipTotal", description="Kein COUNT(*)"),
     db: Session = Depends(get_db),
 ) -> PaginatedMatchResponse:
-    items, total = MatchRepository(db).get_paginated(
-        page=page,
-        page_size=page_size,
-        team_id=team_id,
-        competition_id=competition_id,
-        matchday=matchday,
-        match_state=match_state,
-    )
-    return PaginatedMatchResponse.create(
-        items=[MatchResponse.model_validate(m) for m in items],
-        total=total,
-        page=page,
-        page_size=page_size,
+    try:
+        result = MatchRepository(db).get_paginated(
+            page=page,
+            page_size=page_size,
+            team_id=team_id,
+            competition_id=competition_id,
+            matchday=matchday,
+            match_state=match_state,
+            cursor=cursor,
+            with_total=not skip_total,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+    return PaginatedMatchResponse.from_page(
+        [MatchResponse.model_validate(m) for m in result.items], result
     )
 
 
+@router.get(
+    "/api-football/stats",
+    summary="API-Football client statistics (upstream calls, cache hits, quota)",
+)
+def get_api_football_stats() -> dict:
+    return api_football.stats()
+
 
 @router.get(
     "/{matchId}",
@@ -95,13 +112,15 @@ def create_match(
     db: Session = Depends(get_db),
 ) -> MatchResponse:
     try:
-        return MatchRepository(db).create(data)
+        match = MatchRepository(db).create(data)
     except IntegrityError:
         logger.exception("IntegrityError creating match")
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A match with this id already exists.",
         )
+    reference_cache.invalidate("competitions", "matchdays")
+    return match
 
 
 @router.patch(
@@ -145,34 +164,24 @@ def delete_match(matchId: int, db: Session = Depends(get_db)) -> None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Match not found"
         )
+    reference_cache.invalidate("competitions", "matchdays")
 
 
 # ------------------------------------------------------------------ #
 # Football API live sync                                               #
 # ------------------------------------------------------------------ #
 
-_PHASE_MAP = {
-    "1H": "FirstHalf",
-    "2H": "SecondHalf",
-    "HT": "FirstHalfBreak",
-    "ET": "SecondHalf",   # extra time – treat as second half for display
-    "BT": "FirstHalfBreak",  # break before extra time
-    "P":  "SecondHalf",
-    "FT": "FullTime",
-    "AET": "FullTime",
-    "PEN": "FullTime",
-}
-
-
 @router.post(
     "/{matchId}/sync-live",
     response_model=MatchResponse,
     response_model_by_alias=True,
-    summary="Sync live minute and phase from Football API",
+    summary="Sync live minute and phase from Football API (manuell; "
+    "Live-Spiele synchronisiert der Live-Sync-Scheduler automatisch)",
 )
-def sync_live(matchId: int, db: Session = Depends(get_db)) -> MatchResponse:
-    repo = MatchRepository(db)
-    match = repo.get_by_id(matchId)
+async def sync_live(matchId: int) -> MatchResponse:
+    # DB-Zugriffe im Thread mit eigener Session (wie LiveSyncScheduler) – die
+    # Route ist async wegen api_football.get und darf den Loop nicht blockieren
+    match = await asyncio.to_thread(_load_match, matchId)
     if not match:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found")
 
@@ -181,45 +190,51 @@ def sync_live(matchId: int, db: Session = Depends(get_db)) -> MatchResponse:
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Match has no external_id – cannot sync with Football API",
         )
-    if not settings.API_FOOTBALL_KEY:
+    if not api_football.configured:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="API_FOOTBALL_KEY not configured",
         )
 
     try:
-        resp = httpx.get(
-            f"{settings.API_FOOTBALL_BASE_URL}/fixtures",
-            params={"id": match.external_id},
-            headers={"x-apisports-key": settings.API_FOOTBALL_KEY},
-            timeout=5,
-        )
-        resp.raise_for_status()
-        fixtures = resp.json().get("response", [])
-    except httpx.HTTPError as exc:
+        fixtures = await api_football.get("/fixtures", {"id": match.external_id})
+    except ApiFootballError as exc:
         logger.error("Football API request failed: %s", exc)
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Football API unavailable")
 
     if not fixtures:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Fixture not found in Football API")
 
-    fixture_status = fixtures[0].get("fixture", {}).get("status", {})
-    elapsed: Optional[int] = fixture_status.get("elapsed")
-    short: Optional[str] = fixture_status.get("short")
-
-    update_data: dict = {}
-    if elapsed is not None:
-        update_data["minute"] = elapsed
-    if short and short in _PHASE_MAP:
-        update_data["match_phase"] = _PHASE_MAP[short]
+    update_data = fixture_update(fixtures[0])
 
     if update_data:
-        updated = repo.update(matchId, MatchUpdate(**update_data))
+        updated = await asyncio.to_thread(_apply_live_update, matchId, update_data)
+        if updated is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found")
         return updated
 
     return match
 
 
+def _load_match(match_id: int) -> Optional[MatchResponse]:
+    db = SessionLocal()
+    try:
+        match = MatchRepository(db).get_by_id(match_id)
+        # Noch in der Session serialisieren – Relationen werden hier geladen
+        return MatchResponse.model_validate(match) if match else None
+    finally:
+        db.close()
+
+
+def _apply_live_update(match_id: int, update_data: dict) -> Optional[MatchResponse]:
+    db = SessionLocal()
+    try:
+        match = MatchRepository(db).update(match_id, MatchUpdate(**update_data))
+        return MatchResponse.model_validate(match) if match else None
+    finally:
+        db.close()
+
+
 # ------------------------------------------------------------------ #
 # Lineup sub-resource                                                  #
 # ------------------------------------------------------------------ #
@@ -11,18 +11,24 @@ Flow:
   5. WS   /ws/media        → Echtzeit-Push neuer Bilder ans Dashboard
 """
 
+import asyncio
 import logging
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
 from pydantic import BaseModel
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
+from app.core.broadcast import Subscription, broadcast
 from app.core.database import get_db
+from app.core.websocket import ClientConnection, ConnectionGroup, encode
 from app.models.media_queue import MediaQueue
 from app.models.ticker_entry import TickerEntry
 from app.schemas.media_queue import MediaItemIn, MediaItemResponse, PublishMediaRequest
 from app.schemas.ticker_entry import TickerEntryResponse
 from app.services.llm_service import generate_ticker_text
+from app.services.ticker_feed import ticker_feed
 
 logger = logging.getLogger(__name__)
 
@@ -32,37 +38,60 @@ logger = logging.getLogger(__name__)
 
 
 class MediaConnectionManager:
-    """Hält alle aktiven WebSocket-Verbindungen und broadcasted Nachrichten."""
+    """
+    Hält die WebSocket-Verbindungen dieses Workers.
 
-    def __init__(self) -> None:
-        self.active_connections: list[WebSocket] = []
+    broadcast() geht über den Broadcast-Bus (core/broadcast), damit auch die
+    Clients anderer Worker die Nachricht bekommen; die Auslieferung an die
+    lokalen Verbindungen übernimmt der in start() gestartete Konsument.
+    Jeder Client hat eine eigene Ausgangs-Queue (core/websocket).
+    """
 
-    async def connect(self, websocket: WebSocket) -> None:
-        await websocket.accept()
-        self.active_connections.append(websocket)
+    CHANNEL = "media"
+
+    def __init__(self) -> None:
+        self.active_connections = ConnectionGroup("media")
+        self._consumer: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        subscription = broadcast.subscribe(self.CHANNEL)
+        self._consumer = asyncio.create_task(self._consume(subscription))
+
+    async def stop(self) -> None:
+        if self._consumer:
+            self._consumer.cancel()
+            self._consumer = None
+
+    async def _consume(self, subscription: Subscription) -> None:
+        try:
+            while True:
+                message = await subscription.get()
+                self.send_local(message)
+        finally:
+            subscription.close()
+
+    async def connect(self, websocket: WebSocket) -> ClientConnection:
+        client = await self.active_connections.connect(websocket)
         logger.info(
             "Media WS client connected. Active connections: %d",
             len(self.active_connections),
         )
+        return client
 
-    def disconnect(self, websocket: WebSocket) -> None:
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+    async def disconnect(self, client: ClientConnection) -> None:
+        await self.active_connections.disconnect(client)
         logger.info(
             "Media WS client disconnected. Active connections: %d",
             len(self.active_connections),
         )
 
     async def broadcast(self, data: dict) -> None:
-        """Sendet JSON an alle verbundenen Clients. Entfernt tote Verbindungen."""
-        dead: list[WebSocket] = []
-        for ws in self.active_connections:
-            try:
-                await ws.send_json(data)
-            except Exception:
-                dead.append(ws)
-        for ws in dead:
-            self.disconnect(ws)
+        """Sendet JSON an alle verbundenen Clients aller Worker."""
+        await broadcast.publish(self.CHANNEL, encode(data))
+
+    def send_local(self, message: str) -> None:
+        """Reiht die (bereits kodierte) Nachricht bei allen lokalen Clients ein."""
+        self.active_connections.broadcast_text(message)
 
 
 # Singleton – wird in main.py gestartet
@@ -81,6 +110,9 @@ ws_router = APIRouter(tags=["Media WebSocket"])
 # ──────────────────────────────────────────────
 
 
+_BROADCAST_FIELDS = tuple(MediaItemIn.model_fields)
+
+
 @router.post(
     "/incoming",
     status_code=status.HTTP_200_OK,
@@ -92,37 +124,37 @@ async def media_incoming(
 ) -> dict:
     """
     Empfängt ein Array von Bildobjekten aus n8n.
-    Speichert neue Bilder (ON CONFLICT wird über unique-Check gelöst),
-    broadcasted sie via WebSocket an alle verbundenen Redakteur-Clients.
+    Speichert neue Bilder mit einem INSERT … ON CONFLICT (media_id) DO NOTHING
+    (ein Roundtrip pro Batch) und broadcasted genau die tatsächlich
+    eingefügten Zeilen via WebSocket an alle verbundenen Redakteur-Clients.
     """
-    saved: list[MediaItemIn] = []
-
+    # Duplikate innerhalb des Batches: erstes Vorkommen gewinnt
+    unique: dict[int, MediaItemIn] = {}
     for item in items:
-        exists = (
-            db.query(MediaQueue)
-            .filter(MediaQueue.media_id == item.media_id)
-            .first()
+        unique.setdefault(item.media_id, item)
+
+    saved: list[dict] = []
+    if unique:
+        stmt = (
+            insert(MediaQueue)
+            .values(
+                [
+                    {**item.model_dump(), "status": "pending"}
+                    for item in unique.values()
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[MediaQueue.media_id])
+            .returning(*(getattr(MediaQueue, f) for f in _BROADCAST_FIELDS))
         )
-        if exists:
-            continue
-
-        entry = MediaQueue(
-            media_id=item.media_id,
-            name=item.name,
-            thumbnail_url=item.thumbnail_url,
-            compressed_url=item.compressed_url,
-            original_url=item.original_url,
-            event_id=item.event_id,
-            status="pending",
-        )
-        db.add(entry)
-        saved.append(item)
+        inserted = {row.media_id: dict(row._mapping) for row in db.execute(stmt)}
+        db.commit()
+        # RETURNING garantiert keine Reihenfolge → in Eingangsreihenfolge bringen
+        saved = [inserted[mid] for mid in unique if mid in inserted]
 
     if saved:
-        db.commit()
         payload = {
             "type": "new_media",
-            "items": [i.model_dump() for i in saved],
+            "items": saved,
         }
         await manager.broadcast(payload)
         logger.info("Saved %d new media items and broadcasted to WS clients.", len(saved))
@@ -217,6 +249,7 @@ def media_publish(
 
     db.commit()
     db.refresh(ticker)
+    ticker_feed.publish(ticker.match_id, "created", ticker)
     return ticker
 
 
@@ -267,10 +300,10 @@ async def websocket_media(websocket: WebSocket) -> None:
     Clients verbinden sich und empfangen neue Bilder sobald n8n welche liefert.
     Der Client kann beliebige Nachrichten senden (z.B. ping) – werden ignoriert.
     """
-    await manager.connect(websocket)
+    client = await manager.connect(websocket)
     try:
         while True:
             # Verbindung offen halten; Client-Nachrichten (ping) werden verworfen
             await websocket.receive_text()
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        await manager.disconnect(client)
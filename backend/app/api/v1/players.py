@@ -13,11 +13,15 @@ from app.schemas.player import (
     PlayerStatisticsUpdate,
     PlayerUpdate,
 )
+from app.utils.pagination import paginate
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/players", tags=["Players"])
 
+# Listen-Reihenfolge; id macht sie eindeutig (Keyset-Cursor)
+_SORT_KEY = [(Player.last_name, False), (Player.first_name, False), (Player.id, False)]
+
 
 # ------------------------------------------------------------------ #
 # GET /players                                                         #
@@ -34,23 +38,23 @@ def list_players(
     team_id: Optional[int] = Query(None, alias="teamId"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=500, alias="pageSize"),
+    cursor: Optional[str] = Query(
+        None, description="nextCursor der vorigen Seite (Keyset-Modus, ersetzt page)"
+    ),
+    skip_total: bool = Query(False, alias="skipTotal", description="Kein COUNT(*)"),
     db: Session = Depends(get_db),
 ) -> PaginatedPlayerResponse:
     q = db.query(Player).filter(Player.hidden == False)  # noqa: E712
     if team_id is not None:
         q = q.filter(Player.team_id == team_id)
-    total = q.count()
-    items = (
-        q.order_by(Player.last_name, Player.first_name)
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
-    )
-    return PaginatedPlayerResponse.create(
-        items=[PlayerResponse.model_validate(p) for p in items],
-        total=total,
-        page=page,
-        page_size=page_size,
+    try:
+        result = paginate(
+            q, _SORT_KEY, page_size, page=page, cursor=cursor, with_total=not skip_total
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    return PaginatedPlayerResponse.from_page(
+        [PlayerResponse.model_validate(p) for p in result.items], result
     )
 
 
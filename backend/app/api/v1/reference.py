@@ -0,0 +1,38 @@
+import logging
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Body
+from pydantic import BaseModel
+
+from app.services.reference_cache import reference_cache
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/reference-cache", tags=["Reference Cache"])
+
+Scope = Literal["countries", "teams", "competitions", "seasons", "matchdays"]
+
+
+class InvalidateRequest(BaseModel):
+    scopes: Optional[list[Scope]] = None  # None → alle Scopes
+
+
+@router.get(
+    "/stats",
+    summary="Hit-Rate und Einträge des Stammdaten-Caches pro Scope",
+)
+def get_reference_cache_stats() -> dict:
+    return reference_cache.stats()
+
+
+@router.post(
+    "/invalidate",
+    summary="Stammdaten-Cache leeren (z.B. nach n8n-Imports)",
+)
+def invalidate_reference_cache(
+    data: InvalidateRequest = Body(default_factory=InvalidateRequest),
+) -> dict:
+    scopes = data.scopes or []
+    reference_cache.invalidate(*scopes)
+    logger.info("Reference-Cache invalidiert: %s", scopes or "alle")
+    return {"status": "ok", "scopes": scopes or "all"}
@@ -1,7 +1,7 @@
 import logging
-from typing import Literal
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -13,6 +13,7 @@ from app.schemas.season import (
     SeasonResponse,
     SeasonUpdate,
 )
+from app.services.reference_cache import reference_cache
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +27,33 @@ router = APIRouter(prefix="/seasons", tags=["Seasons"])
     summary="List seasons (paginated)",
 )
 def get_seasons(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     order_by: Literal[
         "starts_at_asc", "starts_at_desc", "title_asc", "title_desc"
     ] = Query("starts_at_desc", description="Sort order"),
+    cursor: Optional[str] = Query(
+        None, description="nextCursor of the previous page (keyset mode, replaces page)"
+    ),
+    skip_total: bool = Query(False, description="Skip COUNT(*) (total/pageCount empty)"),
     db: Session = Depends(get_db),
-) -> PaginatedSeasonResponse:
-    return SeasonRepository(db).get_paginated(
-        page=page, page_size=page_size, order_by=order_by
-    )
+) -> Response:
+    try:
+        return reference_cache.respond(
+            request,
+            "seasons",
+            ("list", page, page_size, order_by, cursor, skip_total),
+            lambda: SeasonRepository(db).get_paginated(
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                cursor=cursor,
+                with_total=not skip_total,
+            ),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
 
 
 @router.get(
@@ -68,13 +86,15 @@ def create_season(
     db: Session = Depends(get_db),
 ) -> SeasonResponse:
     try:
-        return SeasonRepository(db).create(data)
+        season = SeasonRepository(db).create(data)
     except IntegrityError:
         logger.exception("IntegrityError creating season: %s", data.title)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A season with conflicting data already exists.",
         )
+    reference_cache.invalidate("seasons")
+    return season
 
 
 @router.put(
@@ -105,6 +125,7 @@ def update_season(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Season not found"
         )
+    reference_cache.invalidate("seasons")
     return updated
 
 
@@ -121,3 +142,4 @@ def delete_season(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Season not found"
         )
+    reference_cache.invalidate("seasons", "competitions")
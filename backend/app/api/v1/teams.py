@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -15,6 +15,7 @@ from app.schemas.competition import CompetitionResponse
 from app.schemas.competition_team import CompetitionTeamAssignResponse
 from app.schemas.match import MatchResponse
 from app.schemas.team import PaginatedTeamResponse, TeamCreate, TeamResponse, TeamUpdate
+from app.services.reference_cache import reference_cache
 
 logger = logging.getLogger(__name__)
 
@@ -39,11 +40,23 @@ def get_teams(
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     is_partner: Optional[bool] = Query(None, description="Filter by partner status"),
     hidden: Optional[bool] = Query(None, description="Filter by visibility"),
+    cursor: Optional[str] = Query(
+        None, description="nextCursor of the previous page (keyset mode, replaces page)"
+    ),
+    skip_total: bool = Query(False, description="Skip COUNT(*) (total/pageCount empty)"),
     db: Session = Depends(get_db),
 ) -> PaginatedTeamResponse:
-    return TeamRepository(db).get_paginated(
-        page=page, page_size=page_size, is_partner=is_partner, hidden=hidden
-    )
+    try:
+        return TeamRepository(db).get_paginated(
+            page=page,
+            page_size=page_size,
+            is_partner=is_partner,
+            hidden=hidden,
+            cursor=cursor,
+            with_total=not skip_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
 
 
 # ------------------------------------------------------------------ #
@@ -55,8 +68,13 @@ def get_teams(
     response_model=list[str],
     summary="List country names",
 )
-def get_countries(db: Session = Depends(get_db)) -> list[str]:
-    return [c.name for c in CountryRepository(db).get_all()]
+def get_countries(request: Request, db: Session = Depends(get_db)) -> Response:
+    return reference_cache.respond(
+        request,
+        "countries",
+        "names",
+        lambda: [c.name for c in CountryRepository(db).get_all()],
+    )
 
 
 # ------------------------------------------------------------------ #
@@ -72,11 +90,20 @@ def get_countries(db: Session = Depends(get_db)) -> list[str]:
 def get_partner_teams(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    skip_total: bool = Query(False),
     db: Session = Depends(get_db),
 ) -> PaginatedTeamResponse:
-    return TeamRepository(db).get_paginated(
-        page=page, page_size=page_size, is_partner=True
-    )
+    try:
+        return TeamRepository(db).get_paginated(
+            page=page,
+            page_size=page_size,
+            is_partner=True,
+            cursor=cursor,
+            with_total=not skip_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
 
 
 # ------------------------------------------------------------------ #
@@ -117,13 +144,15 @@ def create_team(
     db: Session = Depends(get_db),
 ) -> TeamResponse:
     try:
-        return TeamRepository(db).create(data)
+        team = TeamRepository(db).create(data)
     except IntegrityError:
         logger.exception("IntegrityError creating team: %s", data.name)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A team with conflicting data already exists.",
         )
+    reference_cache.invalidate("teams")
+    return team
 
 
 # ------------------------------------------------------------------ #
@@ -158,6 +187,7 @@ def update_team(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
         )
+    reference_cache.invalidate("teams")
     return updated
 
 
@@ -178,6 +208,7 @@ def delete_team(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
         )
+    reference_cache.invalidate("teams", "competitions", "matchdays")
 
 
 # ------------------------------------------------------------------ #
@@ -192,9 +223,18 @@ def delete_team(
 )
 def get_teams_by_country(
     country: str,
+    request: Request,
     db: Session = Depends(get_db),
-) -> list[TeamResponse]:
-    return TeamRepository(db).get_by_country(country)
+) -> Response:
+    return reference_cache.respond(
+        request,
+        "teams",
+        country,
+        lambda: [
+            TeamResponse.model_validate(t)
+            for t in TeamRepository(db).get_by_country(country)
+        ],
+    )
 
 
 # ------------------------------------------------------------------ #
@@ -209,16 +249,20 @@ def get_teams_by_country(
 )
 def get_team_competitions(
     teamId: int,
+    request: Request,
     db: Session = Depends(get_db),
-) -> list[CompetitionResponse]:
-    if not TeamRepository(db).exists(teamId):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
-        )
-    ct_comps = CompetitionTeamRepository(db).get_competitions_for_team(teamId)
-    if ct_comps:
-        return ct_comps
-    return MatchRepository(db).get_competitions_for_team(teamId)
+) -> Response:
+    def _load() -> list[CompetitionResponse]:
+        if not TeamRepository(db).exists(teamId):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
+            )
+        competitions = CompetitionTeamRepository(db).get_competitions_for_team(
+            teamId
+        ) or MatchRepository(db).get_competitions_for_team(teamId)
+        return [CompetitionResponse.model_validate(c) for c in competitions]
+
+    return reference_cache.respond(request, "competitions", ("team", teamId), _load)
 
 
 # ------------------------------------------------------------------ #
@@ -233,9 +277,15 @@ def get_team_competitions(
 def get_team_matchdays(
     teamId: int,
     competitionId: int,
+    request: Request,
     db: Session = Depends(get_db),
-) -> list[int]:
-    return MatchRepository(db).get_matchdays(teamId, competitionId)
+) -> Response:
+    return reference_cache.respond(
+        request,
+        "matchdays",
+        (teamId, competitionId),
+        lambda: MatchRepository(db).get_matchdays(teamId, competitionId),
+    )
 
 
 # ------------------------------------------------------------------ #
@@ -290,6 +340,7 @@ def assign_team(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="seasonId, competitionId or teamId does not exist.",
         )
+    reference_cache.invalidate("competitions")
 
     return CompetitionTeamAssignResponse(
         uid=entry.uid,
@@ -0,0 +1,62 @@
+"""
+Thumbnails Router
+=================
+Auslieferung lokal gecachter Vorschaubilder samt Varianten.
+
+- GET /thumbnails/{filename}              → Original
+- GET /thumbnails/{filename}?size=small   → 160 px (Kacheln)
+- GET /thumbnails/{filename}?size=medium  → 480 px (Karten)
+
+Dateinamen sind Content-Hashes, der Inhalt ändert sich also nie: ETag aus
+Name + Größe, Cache-Control immutable, If-None-Match → 304.
+
+Konnte die Variante nicht erzeugt werden (kein Pillow, Fehler beim Rendern),
+kommt das Original mit dessen ETag und nur kurz cachebar – sonst hielten
+Browser und Proxies es ein Jahr lang als "small"/"medium".
+"""
+
+import os
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import FileResponse
+
+from app.services.thumbnail_cache import thumbnail_cache
+from app.utils.http import etag_matches
+
+router = APIRouter(prefix="/thumbnails", tags=["Thumbnails"])
+
+_IMMUTABLE = "public, max-age=31536000, immutable"
+# Original anstelle einer Variante: später erneut nach der Variante fragen
+_FALLBACK = "public, max-age=300"
+
+
+def _etag(filename: str, size: Optional[str]) -> str:
+    return f'"{filename}-{size or "original"}"'
+
+
+@router.get("/{filename}", summary="Gecachtes Thumbnail (optional als Variante)")
+async def get_thumbnail(
+    filename: str,
+    request: Request,
+    size: Optional[Literal["small", "medium"]] = None,
+) -> Response:
+    if_none_match = request.headers.get("if-none-match")
+    etag = _etag(filename, size)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": _IMMUTABLE},
+        )
+
+    path = await thumbnail_cache.resolve(filename, size)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Thumbnail nicht gefunden")
+
+    headers = {"ETag": etag, "Cache-Control": _IMMUTABLE}
+    if size and path == os.path.join(thumbnail_cache.directory, filename):
+        # Variante fehlt → Original unter eigenem ETag, nicht immutable
+        headers = {"ETag": _etag(filename, None), "Cache-Control": _FALLBACK}
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FileResponse(path, headers=headers)
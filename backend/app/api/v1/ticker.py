@@ -8,6 +8,12 @@ Modi:
 - Modus 2 (vollautomatisch): POST /ticker/generate/{event_id}
 - Modus 3 (hybrid):      POST /ticker/generate/{event_id} → status=draft → PATCH /{id}/publish
 
+Batch-Generierung (generate-bulk, generate-synthetic-batch) gibt es zusätzlich als
+NDJSON-Stream (…/stream): ein Eintrag pro Zeile, sobald er gespeichert ist.
+
+Änderungen an Einträgen werden als Deltas über WS /ws/ticker/{match_id}
+gepusht (siehe services/ticker_feed) – Clients müssen nicht mehr pollen.
+
 Instanzen:
 - generic:       neutral, kein Vereinsbezug
 - ef_whitelabel: Eintracht-Stil, Few-Shot aus style_references
@@ -15,24 +21,44 @@ Instanzen:
 
 import json
 import logging
-from typing import Optional, Literal
-
-from fastapi import APIRouter, Depends, HTTPException, Query, Body, status
+import time
+from typing import Any, AsyncIterator, Callable, Optional, Literal
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
 from app.models.event import Event
 from app.models.match import Match
 from app.models.synthetic_event import SyntheticEvent
 from app.models.ticker_entry import TickerEntry
+from app.repositories.event_repository import EventRepository
+from app.repositories.match_repository import MatchRepository
 from app.repositories.ticker_entry_repository import TickerEntryRepository
 from app.schemas.ticker_entry import (
     TickerEntryCreate,
     TickerEntryUpdate,
     TickerEntryResponse,
 )
-from app.services.llm_service import generate_ticker_text
+from app.services.generation_engine import generation_engine
+from app.services.llm_cache import llm_cache
+from app.services.llm_service import generate_ticker_text, get_llm_service
+from app.services.ticker_feed import ticker_feed
+from app.utils.http import etag_matches
+from app.utils.stats import latency_summary
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +83,9 @@ class GenerateEventRequest(BaseModel):
     auto_publish: bool = Field(
         default=False, description="Modus 2: direkt publizieren ohne Review"
     )
+    bypass_cache: bool = Field(
+        default=False, description="LLM-Prompt-Cache umgehen (z.B. Neu generieren)"
+    )
 
 
 class GenerateSyntheticRequest(BaseModel):
@@ -67,6 +96,7 @@ class GenerateSyntheticRequest(BaseModel):
     provider: Optional[str] = None
     model: Optional[str] = None
     auto_publish: bool = False
+    bypass_cache: bool = False
 
 
 class ManualEntryRequest(BaseModel):
@@ -89,38 +119,9 @@ class ManualEntryRequest(BaseModel):
 def _score_at_event(db: Session, event: Event, match: Optional[Match]) -> Optional[str]:
     if not match or not match.home_team or not match.away_team:
         return None
-    home_ext = match.home_team.external_id
-    away_ext = match.away_team.external_id
-
-    order_col = Event.position if event.position is not None else Event.id
-    cutoff = event.position if event.position is not None else event.id
-    goals = (
-        db.query(Event)
-        .filter(
-            Event.match_id == match.id,
-            Event.event_type.in_(["goal", "own_goal"]),
-            order_col <= cutoff,
-        )
-        .all()
+    return EventRepository(db).score_at(
+        event, match.home_team.external_id, match.away_team.external_id
     )
-    home_score = away_score = 0
-    for g in goals:
-        try:
-            d = json.loads(g.description or "{}")
-        except (ValueError, TypeError):
-            continue
-        tid = d.get("team_id")
-        if g.event_type == "own_goal":
-            if tid == home_ext:
-                away_score += 1
-            elif tid == away_ext:
-                home_score += 1
-        else:
-            if tid == home_ext:
-                home_score += 1
-            elif tid == away_ext:
-                away_score += 1
-    return f"{home_score}:{away_score}"
 
 
 def _build_match_context(match: Optional[Match], event_minute: Optional[int]) -> dict:
@@ -137,6 +138,68 @@ def _build_match_context(match: Optional[Match], event_minute: Optional[int]) ->
     }
 
 
+def _push(op: str, *entries: TickerEntry) -> None:
+    """Deltas an den Ticker-Feed des jeweiligen Matches."""
+    for entry in entries:
+        ticker_feed.publish(entry.match_id, op, entry)
+
+
+def _ndjson(payload: dict) -> str:
+    return json.dumps(payload, ensure_ascii=False) + "\n"
+
+
+async def _stream_generation(
+    db: Session,
+    provider: str,
+    items: list,
+    jobs: list,
+    build_entry: Callable[[Any, str, str], TickerEntryCreate],
+) -> AsyncIterator[str]:
+    """
+    Führt die Jobs über die Generation Engine aus und streamt NDJSON:
+    eine `start`-Zeile mit der Gesamtzahl,
+    eine `entry`-Zeile pro gespeichertem Eintrag (sofort nach Insert),
+    eine `error`-Zeile pro Fehlschlag, zum Schluss eine `summary`-Zeile.
+    """
+    repo = TickerEntryRepository(db)
+    started = time.perf_counter()
+    latencies: list[float] = []
+    failed = 0
+    yield _ndjson({"type": "start", "total": len(jobs)})
+
+    async for index, outcome, latency in generation_engine.as_completed(
+        provider, jobs
+    ):
+        item = items[index]
+        if isinstance(outcome, Exception):
+            failed += 1
+            logger.error("Stream generation failed for id=%s", item.id, exc_info=outcome)
+            yield _ndjson({"type": "error", "id": item.id, "detail": str(outcome)})
+            continue
+        text, model_used = outcome
+        entry = repo.create(build_entry(item, text, model_used))
+        _push("created", entry)
+        latencies.append(latency)
+        yield _ndjson(
+            {
+                "type": "entry",
+                "entry": TickerEntryResponse.model_validate(entry).model_dump(
+                    mode="json"
+                ),
+            }
+        )
+
+    yield _ndjson(
+        {
+            "type": "summary",
+            "ok": len(latencies),
+            "failed": failed,
+            "latency_ms": latency_summary(latencies),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+    )
+
+
 # ──────────────────────────────────────────────
 # GET
 # ──────────────────────────────────────────────
@@ -149,12 +212,34 @@ def _build_match_context(match: Optional[Match], event_minute: Optional[int]) ->
 )
 def get_match_ticker(
     match_id: int,
+    request: Request,
+    response: Response,
     all_entries: bool = Query(False, description="Auch Drafts und abgelehnte Einträge"),
     db: Session = Depends(get_db),
 ) -> list[TickerEntryResponse]:
-    return TickerEntryRepository(db).get_by_match(
-        match_id, published_only=not all_entries
-    )
+    """
+    Antwortet mit ETag (matches.ticker_version); bei passendem If-None-Match
+    kommt 304, ohne die Einträge zu lesen.
+    """
+    repo = TickerEntryRepository(db)
+    version = repo.get_version(match_id)
+    if version is None:
+        return []
+    scope = "all" if all_entries else "pub"
+    etag = f'W/"ticker-{match_id}-{version}-{scope}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return repo.get_by_match(match_id, published_only=not all_entries)
+
+
+@router.get(
+    "/llm-cache/stats",
+    summary="Hit/Miss-Zähler des LLM-Prompt-Caches",
+)
+def get_llm_cache_stats() -> dict:
+    return llm_cache.stats()
 
 
 @router.get(
@@ -188,11 +273,15 @@ def delete_ticker_entry(
     entry_id: int,
     db: Session = Depends(get_db),
 ) -> None:
-    deleted = TickerEntryRepository(db).delete(entry_id)
-    if not deleted:
+    repo = TickerEntryRepository(db)
+    entry = repo.get_by_id(entry_id)
+    if not entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found"
         )
+    snapshot = TickerEntryResponse.model_validate(entry).model_dump(mode="json")
+    repo.delete(entry_id)
+    ticker_feed.publish(snapshot["match_id"], "deleted", snapshot)
 
 
 # ──────────────────────────────────────────────
@@ -220,6 +309,7 @@ def update_ticker_entry(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found"
         )
+    _push("updated", entry)
     return entry
 
 
@@ -240,7 +330,9 @@ def publish_ticker_entry(
         )
     if entry.status == "published":
         return entry
-    return repo.update(entry_id, TickerEntryUpdate(status="published"))
+    entry = repo.update(entry_id, TickerEntryUpdate(status="published"))
+    _push("published", entry)
+    return entry
 
 
 @router.patch(
@@ -258,7 +350,9 @@ def reject_ticker_entry(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found"
         )
-    return repo.update(entry_id, TickerEntryUpdate(status="rejected"))
+    entry = repo.update(entry_id, TickerEntryUpdate(status="rejected"))
+    _push("rejected", entry)
+    return entry
 
 
 # ──────────────────────────────────────────────
@@ -288,7 +382,7 @@ def create_manual_entry(
         if existing:
             return existing
 
-    return TickerEntryRepository(db).create(
+    entry = TickerEntryRepository(db).create(
         TickerEntryCreate(
             match_id=data.match_id,
             event_id=data.event_id,
@@ -303,6 +397,8 @@ def create_manual_entry(
             status="published",
         )
     )
+    _push("created", entry)
+    return entry
 
 
 # ──────────────────────────────────────────────
@@ -332,7 +428,7 @@ async def generate_for_event(
     if existing:
         return existing
 
-    match = db.query(Match).filter(Match.id == event.match_id).first()
+    match = MatchRepository(db).get_by_id(event.match_id)
     match_context = _build_match_context(match, event.time)
 
     try:
@@ -381,6 +477,7 @@ async def generate_for_event(
             model=data.model,
             db=db,
             instance=data.instance,
+            use_cache=not data.bypass_cache,
         )
     except Exception as e:
         logger.exception("LLM generation failed for event_id=%s", event_id)
@@ -388,7 +485,7 @@ async def generate_for_event(
             status_code=status.HTTP_502_BAD_GATEWAY, detail=f"LLM error: {e}"
         )
 
-    return repo.create(
+    entry = repo.create(
         TickerEntryCreate(
             match_id=event.match_id,
             event_id=event_id,
@@ -399,6 +496,8 @@ async def generate_for_event(
             status="published" if data.auto_publish else "draft",
         )
     )
+    _push("created", entry)
+    return entry
 
 
 # ──────────────────────────────────────────────
@@ -426,7 +525,7 @@ async def generate_for_synthetic_event(
             status_code=status.HTTP_404_NOT_FOUND, detail="SyntheticEvent not found"
         )
 
-    match = db.query(Match).filter(Match.id == synthetic.match_id).first()
+    match = MatchRepository(db).get_by_id(synthetic.match_id)
     match_context = _build_match_context(match, synthetic.minute)
 
     try:
@@ -442,6 +541,7 @@ async def generate_for_synthetic_event(
             model=data.model,
             db=db,
             instance=data.instance,
+            use_cache=not data.bypass_cache,
         )
     except Exception as e:
         logger.exception(
@@ -478,7 +578,7 @@ async def generate_for_synthetic_event(
     except Exception:
         pass
 
-    return TickerEntryRepository(db).create(
+    entry = TickerEntryRepository(db).create(
         TickerEntryCreate(
             match_id=synthetic.match_id,
             synthetic_event_id=synthetic.id,
@@ -491,6 +591,8 @@ async def generate_for_synthetic_event(
             status="published" if data.auto_publish else "draft",
         )
     )
+    _push("created", entry)
+    return entry
 
 
 # ──────────────────────────────────────────────
@@ -505,25 +607,21 @@ class GenerateSyntheticBatchRequest(BaseModel):
     auto_publish: bool = True
 
 
-@router.post(
-    "/generate-synthetic-batch/{match_id}",
-    response_model=list[TickerEntryResponse],
-    status_code=status.HTTP_201_CREATED,
-    summary="Alle ungenierierten Synthetic Events eines Spiels generieren",
-)
-async def generate_synthetic_batch(
-    match_id: int,
-    data: GenerateSyntheticBatchRequest = Body(
-        default_factory=GenerateSyntheticBatchRequest
-    ),
-    db: Session = Depends(get_db),
-) -> list[TickerEntryResponse]:
+_BATCH_PHASE_MAP = {
+    "match_kickoff": "FirstHalf",
+    "match_halftime": "FirstHalfBreak",
+    "match_second_half": "SecondHalf",
+    "match_fulltime": "After",
+}
+
+
+def _pending_synthetics(db: Session, match_id: int) -> list[SyntheticEvent]:
+    """Synthetic Events des Spiels, für die noch kein Ticker-Eintrag existiert."""
     synthetics = (
         db.query(SyntheticEvent).filter(SyntheticEvent.match_id == match_id).all()
     )
     if not synthetics:
         return []
-
     existing_ids = {
         r.synthetic_event_id
         for r in db.query(TickerEntry.synthetic_event_id)
@@ -533,63 +631,125 @@ async def generate_synthetic_batch(
         )
         .all()
     }
+    return [s for s in synthetics if s.id not in existing_ids]
 
-    match = db.query(Match).filter(Match.id == match_id).first()
-    repo = TickerEntryRepository(db)
-    results = []
 
-    for synthetic in synthetics:
-        if synthetic.id in existing_ids:
-            continue
+def _synthetic_batch_job(
+    db: Session,
+    match: Optional[Match],
+    synthetic: SyntheticEvent,
+    data: GenerateSyntheticBatchRequest,
+):
+    match_context = _build_match_context(match, synthetic.minute)
+    return lambda: generate_ticker_text(
+        event_type=synthetic.type or "comment",
+        event_detail="",
+        minute=synthetic.minute,
+        style=data.style,
+        language=data.language,
+        context_data=synthetic.data or {},
+        match_context=match_context,
+        db=db,
+        instance=data.instance,
+    )
 
-        match_context = _build_match_context(match, synthetic.minute)
-        try:
-            text, model_used = await generate_ticker_text(
-                event_type=synthetic.type or "comment",
-                event_detail="",
-                minute=synthetic.minute,
-                style=data.style,
-                language=data.language,
-                context_data=synthetic.data or {},
-                match_context=match_context,
-                db=db,
-                instance=data.instance,
-            )
-        except Exception:
-            logger.exception(
-                "Batch synthetic generation failed for id=%s", synthetic.id
+
+def _synthetic_batch_entry(
+    synthetic: SyntheticEvent,
+    text: str,
+    model_used: str,
+    data: GenerateSyntheticBatchRequest,
+) -> TickerEntryCreate:
+    event_type = synthetic.type or ""
+    if event_type.startswith("pre_match"):
+        phase = "Before"
+    elif event_type.startswith("post_match"):
+        phase = "After"
+    else:
+        phase = _BATCH_PHASE_MAP.get(event_type)
+
+    return TickerEntryCreate(
+        match_id=synthetic.match_id,
+        synthetic_event_id=synthetic.id,
+        text=text,
+        source="ai",
+        style=data.style,
+        llm_model=model_used,
+        phase=phase,
+        status="published" if data.auto_publish else "draft",
+    )
+
+
+@router.post(
+    "/generate-synthetic-batch/{match_id}",
+    response_model=list[TickerEntryResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Alle ungenierierten Synthetic Events eines Spiels generieren",
+)
+async def generate_synthetic_batch(
+    match_id: int,
+    data: GenerateSyntheticBatchRequest = Body(
+        default_factory=GenerateSyntheticBatchRequest
+    ),
+    db: Session = Depends(get_db),
+) -> list[TickerEntryResponse]:
+    pending = _pending_synthetics(db, match_id)
+    if not pending:
+        return []
+
+    match = MatchRepository(db).get_by_id(match_id)
+    outcomes = await generation_engine.run(
+        get_llm_service().provider,
+        [_synthetic_batch_job(db, match, s, data) for s in pending],
+    )
+
+    creates = []
+    for synthetic, outcome in zip(pending, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(
+                "Batch synthetic generation failed for id=%s",
+                synthetic.id,
+                exc_info=outcome,
             )
             continue
+        text, model_used = outcome
+        creates.append(_synthetic_batch_entry(synthetic, text, model_used, data))
 
-        _phase_map = {
-            "match_kickoff": "FirstHalf",
-            "match_halftime": "FirstHalfBreak",
-            "match_second_half": "SecondHalf",
-            "match_fulltime": "After",
-        }
-        event_type = synthetic.type or ""
-        if event_type.startswith("pre_match"):
-            phase = "Before"
-        elif event_type.startswith("post_match"):
-            phase = "After"
-        else:
-            phase = _phase_map.get(event_type)
+    entries = TickerEntryRepository(db).create_many(creates)
+    _push("created", *entries)
+    return entries
 
-        entry = repo.create(
-            TickerEntryCreate(
-                match_id=match_id,
-                synthetic_event_id=synthetic.id,
-                text=text,
-                source="ai",
-                style=data.style,
-                llm_model=model_used,
-                phase=phase,
-                status="published" if data.auto_publish else "draft",
-            )
-        )
-        results.append(entry)
 
-    return results
+@router.post(
+    "/generate-synthetic-batch/{match_id}/stream",
+    summary="Synthetic-Batch als NDJSON-Stream (ein Eintrag pro Zeile, sobald fertig)",
+)
+async def stream_synthetic_batch(
+    match_id: int,
+    data: GenerateSyntheticBatchRequest = Body(
+        default_factory=GenerateSyntheticBatchRequest
+    ),
+) -> StreamingResponse:
+    async def _stream() -> AsyncIterator[str]:
+        # Eigene Session: get_db wird vor dem Senden der Response geschlossen
+        db = SessionLocal()
+        try:
+            pending = _pending_synthetics(db, match_id)
+            match = MatchRepository(db).get_by_id(match_id)
+            async for line in _stream_generation(
+                db,
+                get_llm_service().provider,
+                pending,
+                [_synthetic_batch_job(db, match, s, data) for s in pending],
+                lambda s, text, model_used: _synthetic_batch_entry(
+                    s, text, model_used, data
+                ),
+            ):
+                yield line
+        finally:
+            db.close()
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
 
 
 # ──────────────────────────────────────────────
@@ -617,7 +777,7 @@ async def generate_match_phases(
     ),
     db: Session = Depends(get_db),
 ) -> list[TickerEntryResponse]:
-    match = db.query(Match).filter(Match.id == match_id).first()
+    match = MatchRepository(db).get_by_id(match_id)
     if not match:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Match not found"
@@ -683,6 +843,7 @@ async def generate_match_phases(
                 status="published" if data.auto_publish else "draft",
             )
         )
+        _push("created", entry)
         results.append(entry)
 
     db.commit()
@@ -694,6 +855,54 @@ async def generate_match_phases(
 # ──────────────────────────────────────────────
 
 
+def _bulk_job(
+    db: Session, match: Optional[Match], event: Event, data: GenerateEventRequest
+):
+    match_context = _build_match_context(match, event.time)
+    return lambda: generate_ticker_text(
+        event_type=event.event_type or "comment",
+        event_detail=event.description or "",
+        minute=event.time,
+        style=data.style,
+        language=data.language,
+        context_data={
+            "home_team": match_context.get("home_team"),
+            "away_team": match_context.get("away_team"),
+        }
+        if data.instance == "ef_whitelabel"
+        else {},
+        match_context=match_context,
+        provider=data.provider,
+        model=data.model,
+        db=db,
+        instance=data.instance,
+        use_cache=not data.bypass_cache,
+    )
+
+
+def _bulk_entry(
+    event: Event, text: str, model_used: str, data: GenerateEventRequest
+) -> TickerEntryCreate:
+    return TickerEntryCreate(
+        match_id=event.match_id,
+        event_id=event.id,
+        text=text,
+        source="ai",
+        style=data.style,
+        llm_model=model_used,
+        status="draft",
+    )
+
+
+def _bulk_provider(data: GenerateEventRequest) -> str:
+    try:
+        return get_llm_service(data.provider, data.model).provider
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+
+
 @router.post(
     "/generate-bulk/{match_id}",
     response_model=list[TickerEntryResponse],
@@ -712,45 +921,102 @@ async def generate_bulk_for_match(
             detail="Keine Events für dieses Spiel",
         )
 
-    match = db.query(Match).filter(Match.id == match_id).first()
-    repo = TickerEntryRepository(db)
-    results = []
+    match = MatchRepository(db).get_by_id(match_id)
+    outcomes = await generation_engine.run(
+        _bulk_provider(data), [_bulk_job(db, match, e, data) for e in events]
+    )
 
-    for event in events:
-        match_context = _build_match_context(match, event.time)
-        try:
-            text, model_used = await generate_ticker_text(
-                event_type=event.event_type or "comment",
-                event_detail=event.description or "",
-                minute=event.time,
-                style=data.style,
-                language=data.language,
-                context_data={
-                    "home_team": match_context.get("home_team"),
-                    "away_team": match_context.get("away_team"),
-                }
-                if data.instance == "ef_whitelabel"
-                else {},
-                match_context=match_context,
-                provider=data.provider,
-                model=data.model,
-                db=db,
-                instance=data.instance,
-            )
-            entry = repo.create(
-                TickerEntryCreate(
-                    match_id=match_id,
-                    event_id=event.id,
-                    text=text,
-                    source="ai",
-                    style=data.style,
-                    llm_model=model_used,
-                    status="draft",
-                )
+    creates = []
+    for event, outcome in zip(events, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(
+                "Bulk generation failed for event_id=%s", event.id, exc_info=outcome
             )
-            results.append(entry)
-        except Exception:
-            logger.exception("Bulk generation failed for event_id=%s", event.id)
             continue
+        text, model_used = outcome
+        creates.append(_bulk_entry(event, text, model_used, data))
 
-    return results
+    entries = TickerEntryRepository(db).create_many(creates)
+    _push("created", *entries)
+    return entries
+
+
+@router.post(
+    "/generate-bulk/{match_id}/stream",
+    summary="Evaluation: Bulk-Generierung als NDJSON-Stream",
+)
+async def stream_bulk_for_match(
+    match_id: int,
+    data: GenerateEventRequest = Body(default_factory=GenerateEventRequest),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    if not db.query(Event.id).filter(Event.match_id == match_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Keine Events für dieses Spiel",
+        )
+    provider = _bulk_provider(data)
+
+    async def _stream() -> AsyncIterator[str]:
+        # Eigene Session: get_db wird vor dem Senden der Response geschlossen
+        stream_db = SessionLocal()
+        try:
+            events = stream_db.query(Event).filter(Event.match_id == match_id).all()
+            match = MatchRepository(stream_db).get_by_id(match_id)
+            async for line in _stream_generation(
+                stream_db,
+                provider,
+                events,
+                [_bulk_job(stream_db, match, e, data) for e in events],
+                lambda e, text, model_used: _bulk_entry(e, text, model_used, data),
+            ):
+                yield line
+        finally:
+            stream_db.close()
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
+# ──────────────────────────────────────────────
+# WebSocket /ws/ticker/{match_id}
+# ──────────────────────────────────────────────
+
+ws_router = APIRouter(tags=["Ticker WebSocket"])
+
+
+@ws_router.websocket("/ws/ticker/{match_id}")
+async def websocket_ticker(
+    websocket: WebSocket,
+    match_id: int,
+    since: Optional[int] = None,
+    epoch: Optional[str] = None,
+) -> None:
+    """
+    Push-Kanal für Ticker-Deltas eines Spiels.
+
+    Nach dem Verbinden kommt {"type": "hello", "epoch", "seq"}. Mit ?since=&epoch=
+    werden verpasste Deltas nachgeliefert oder – falls nicht mehr im Puffer –
+    {"type": "resync"} gesendet (Client lädt GET /ticker/match/{id} neu).
+    Client-Nachrichten (ping) werden ignoriert.
+    """
+    client = await ticker_feed.connect(websocket, match_id)
+    try:
+        client.send_json(
+            {
+                "type": "hello",
+                "match_id": match_id,
+                "epoch": ticker_feed.epoch,
+                "seq": ticker_feed.current_seq(match_id),
+            }
+        )
+        if since is not None:
+            missed = ticker_feed.replay(match_id, since, epoch)
+            if missed is None:
+                client.send_json({"type": "resync", "match_id": match_id})
+            else:
+                for message in missed:
+                    client.send_json(message)
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        await ticker_feed.disconnect(client, match_id)
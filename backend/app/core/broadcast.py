@@ -0,0 +1,283 @@
+"""
+Broadcast Bus
+=============
+Fan-out von Echtzeit-Nachrichten (Media-Queue, Ticker-Feed) über Worker-Grenzen.
+
+Ein WebSocket-Client hängt immer an genau einem uvicorn-Worker. Damit ein
+POST auf Worker A auch die Clients auf Worker B erreicht, laufen Nachrichten
+über diesen Bus statt direkt an die lokalen Verbindungen:
+
+- "memory"   (Default): nur innerhalb des Prozesses – ein Worker, Entwicklung
+- "postgres": LISTEN/NOTIFY auf der bestehenden Datenbank – mehrere Worker
+              und Nodes, keine zusätzliche Infrastruktur
+
+Konsumenten abonnieren einen Kanal (subscribe) und bekommen eine eigene,
+begrenzte Queue. publish() wartet nie auf Konsumenten: ist eine Queue voll,
+wird die älteste Nachricht verworfen und die Subscription als `overflowed`
+markiert – ein langsamer Konsument bremst keinen anderen aus.
+
+Fire-and-forget-Publishes (Task ohne await) hängen log_publish_errors als
+done-Callback an, damit ein fehlgeschlagener Publish im Log landet.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Optional
+
+from app.core.config import settings
+from app.core.metrics import BROADCAST_ENQUEUE
+
+logger = logging.getLogger(__name__)
+
+
+def log_publish_errors(task: asyncio.Task) -> None:
+    """done-Callback für Publish-Tasks, auf die niemand wartet."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Broadcast: Publish fehlgeschlagen", exc_info=task.exception())
+
+
+class Subscription:
+    """Begrenzte Queue eines Konsumenten für einen Kanal."""
+
+    def __init__(self, bus: "MemoryBroadcast", channel: str, maxsize: int) -> None:
+        self.bus = bus
+        self.channel = channel
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+        self.overflowed = False
+
+    def put_nowait(self, message: str) -> None:
+        if self._queue.full():
+            # Älteste verwerfen – neue Nachrichten sind wichtiger
+            self._queue.get_nowait()
+            self.dropped += 1
+            self.overflowed = True
+        self._queue.put_nowait(message)
+
+    async def get(self) -> str:
+        return await self._queue.get()
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def close(self) -> None:
+        self.bus.unsubscribe(self)
+
+
+class MemoryBroadcast:
+    """In-Process-Bus (ein Worker)."""
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self._subscriptions: dict[str, set[Subscription]] = {}
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    def subscribe(self, channel: str) -> Subscription:
+        sub = Subscription(self, channel, self.queue_size)
+        self._subscriptions.setdefault(channel, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subscriptions.get(sub.channel)
+        if subs:
+            subs.discard(sub)
+            if not subs:
+                self._subscriptions.pop(sub.channel, None)
+
+    def _deliver(self, channel: str, message: str) -> None:
+        for sub in list(self._subscriptions.get(channel, ())):
+            sub.put_nowait(message)
+
+    async def publish(self, channel: str, message: str) -> None:
+        with BROADCAST_ENQUEUE.time(channel=channel):
+            await self._publish(channel, message)
+
+    async def _publish(self, channel: str, message: str) -> None:
+        self._deliver(channel, message)
+
+    def queue_stats(self) -> dict[str, tuple[int, int]]:
+        """(Nachrichten in Queues, verworfene Nachrichten) pro Kanal."""
+        return {
+            channel: (
+                sum(sub.qsize() for sub in subs),
+                sum(sub.dropped for sub in subs),
+            )
+            for channel, subs in list(self._subscriptions.items())
+        }
+
+
+# NOTIFY-Payloads sind auf knapp 8000 Bytes begrenzt
+_PG_CHANNEL = "liveticker_broadcast"
+_PG_CHUNK_BYTES = 7000
+_PG_FRAGMENT_TTL = 30.0
+
+
+class PostgresBroadcast(MemoryBroadcast):
+    """
+    Cross-Worker-Bus über Postgres LISTEN/NOTIFY.
+
+    Alle Kanäle teilen sich einen NOTIFY-Kanal; der Bus-Kanal steht im Payload.
+    Auch der publizierende Worker bekommt seine Nachricht über NOTIFY zurück,
+    dadurch sehen alle Worker dieselbe Reihenfolge. Große Nachrichten werden
+    in Fragmente zerlegt und beim Empfänger wieder zusammengesetzt.
+    """
+
+    def __init__(self, dsn: str, queue_size: int) -> None:
+        super().__init__(queue_size)
+        self.dsn = dsn
+        self._listen_conn = None
+        self._notify_conn = None
+        self._notify_lock = asyncio.Lock()
+        self._fragments: dict[str, tuple[float, list[Optional[str]]]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _open(self):
+        import psycopg2
+        import psycopg2.extensions
+
+        conn = psycopg2.connect(self.dsn)
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    async def connect(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._listen_conn = await asyncio.to_thread(self._open)
+        self._notify_conn = await asyncio.to_thread(self._open)
+        with self._listen_conn.cursor() as cur:
+            cur.execute(f"LISTEN {_PG_CHANNEL};")
+        self._loop.add_reader(self._listen_conn.fileno(), self._on_readable)
+        logger.info("Broadcast: Postgres LISTEN %s aktiv", _PG_CHANNEL)
+
+    async def disconnect(self) -> None:
+        if self._listen_conn is not None:
+            self._loop.remove_reader(self._listen_conn.fileno())
+            self._listen_conn.close()
+            self._listen_conn = None
+        if self._notify_conn is not None:
+            self._notify_conn.close()
+            self._notify_conn = None
+
+    def _on_readable(self) -> None:
+        try:
+            self._listen_conn.poll()
+        except Exception:
+            logger.exception("Broadcast: LISTEN-Verbindung verloren, verbinde neu")
+            self._loop.remove_reader(self._listen_conn.fileno())
+            self._loop.create_task(self._reconnect())
+            return
+        while self._listen_conn.notifies:
+            notify = self._listen_conn.notifies.pop(0)
+            self._on_payload(notify.payload)
+
+    async def _reconnect(self) -> None:
+        delay = 1.0
+        while True:
+            try:
+                await self.disconnect()
+            except Exception:
+                pass
+            try:
+                await self.connect()
+                return
+            except Exception:
+                logger.warning("Broadcast: Reconnect fehlgeschlagen, neuer Versuch in %.0fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+    def _on_payload(self, payload: str) -> None:
+        try:
+            envelope = json.loads(payload)
+        except ValueError:
+            logger.warning("Broadcast: ungültiger NOTIFY-Payload verworfen")
+            return
+        if "f" not in envelope:
+            self._deliver(envelope["c"], envelope["m"])
+            return
+
+        # Fragment: {"f": id, "i": index, "n": anzahl, "d": teilstring}
+        now = time.monotonic()
+        for key in [
+            k for k, (ts, _) in self._fragments.items() if now - ts > _PG_FRAGMENT_TTL
+        ]:
+            del self._fragments[key]
+        _, parts = self._fragments.setdefault(
+            envelope["f"], (now, [None] * envelope["n"])
+        )
+        parts[envelope["i"]] = envelope["d"]
+        if all(p is not None for p in parts):
+            del self._fragments[envelope["f"]]
+            self._on_payload("".join(parts))
+
+    def _notify(self, payloads: list[str]) -> None:
+        import psycopg2
+
+        try:
+            self._send_notifies(payloads)
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            # NOTIFY-Verbindung tot (Neustart, Idle-Timeout) – neu öffnen und
+            # einmal wiederholen; der LISTEN-Reconnect merkt davon nichts
+            logger.warning("Broadcast: NOTIFY-Verbindung verloren, verbinde neu")
+            self._close_notify_conn()
+            self._send_notifies(payloads)
+
+    def _send_notifies(self, payloads: list[str]) -> None:
+        if self._notify_conn is None or self._notify_conn.closed:
+            self._notify_conn = self._open()
+        with self._notify_conn.cursor() as cur:
+            for payload in payloads:
+                cur.execute("SELECT pg_notify(%s, %s)", (_PG_CHANNEL, payload))
+
+    def _close_notify_conn(self) -> None:
+        try:
+            self._notify_conn.close()
+        except Exception:
+            pass
+        self._notify_conn = None
+
+    async def _publish(self, channel: str, message: str) -> None:
+        payload = json.dumps({"c": channel, "m": message}, ensure_ascii=False)
+        if len(payload.encode("utf-8")) <= _PG_CHUNK_BYTES:
+            payloads = [payload]
+        else:
+            # Zeichenweise teilen; Worst Case 4 Bytes/Zeichen + JSON-Escaping
+            step = _PG_CHUNK_BYTES // 8
+            chunks = [payload[i : i + step] for i in range(0, len(payload), step)]
+            fragment_id = uuid.uuid4().hex
+            payloads = [
+                json.dumps(
+                    {"f": fragment_id, "i": i, "n": len(chunks), "d": chunk},
+                    ensure_ascii=False,
+                )
+                for i, chunk in enumerate(chunks)
+            ]
+        # Lock hält die Reihenfolge der Nachrichten dieses Workers stabil
+        async with self._notify_lock:
+            await asyncio.to_thread(self._notify, payloads)
+
+
+def _build_broadcast() -> MemoryBroadcast:
+    backend = settings.BROADCAST_BACKEND.lower()
+    if backend == "postgres":
+        from sqlalchemy.engine import make_url
+
+        dsn = (
+            make_url(settings.DATABASE_URL)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        return PostgresBroadcast(dsn, settings.BROADCAST_QUEUE_SIZE)
+    if backend != "memory":
+        raise ValueError(f"Unbekanntes BROADCAST_BACKEND: {settings.BROADCAST_BACKEND}")
+    return MemoryBroadcast(settings.BROADCAST_QUEUE_SIZE)
+
+
+# Singleton – connect/disconnect im lifespan (main.py)
+broadcast = _build_broadcast()
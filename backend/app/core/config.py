@@ -23,6 +23,15 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
+    # SQL-Instrumentierung pro Request (Server-Timing, N+1-Warnung ab n
+    # gleichen Statements)
+    SQL_STATS_ENABLED: bool = True
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10
+
+    # Monitoring: Latenz pro Route für GET /metrics (Prometheus) und
+    # Cache-Dauer des DB-Checks für /health bzw. /health/ready
+    METRICS_ENABLED: bool = True
+    HEALTH_CHECK_TTL_SECONDS: float = 5.0
 
     # API Keys
     API_FOOTBALL_KEY: Optional[str] = None
@@ -34,18 +43,103 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000"]
 
+    # Öffentliche Basis-URL des Backends (für lokal gecachte Thumbnails)
+    PUBLIC_BASE_URL: str = "http://localhost:8001"
+
+    # Thumbnail-Cache
+    THUMBNAIL_MAX_CONCURRENCY: int = 8
+    THUMBNAIL_MAX_BYTES: int = 10 * 1024 * 1024
+    THUMBNAIL_DISK_QUOTA_MB: int = 512
+    THUMBNAIL_VARIANT_WORKERS: int = 2
+
     # WebSocket
-    WS_HEARTBEAT_INTERVAL: int = 30
+    WS_HEARTBEAT_INTERVAL: int = 30  # Sekunden ohne Verkehr bis zum Server-Ping
+    WS_SEND_QUEUE_SIZE: int = 100  # Ausgangs-Queue pro Client
+
+    # Broadcast-Bus für WebSocket-Fan-out: "memory" (ein Worker) oder
+    # "postgres" (LISTEN/NOTIFY, mehrere Worker/Nodes)
+    BROADCAST_BACKEND: str = "memory"
+    BROADCAST_QUEUE_SIZE: int = 1000
 
     # LLM Settings
     LLM_MODEL: str = "gpt-4"
     LLM_TEMPERATURE: float = 0.7
     LLM_MAX_TOKENS: int = 100
     OPENROUTER_MODEL: Optional[str] = "google/gemini-2.0-flash-lite"
+    LLM_TIMEOUT: float = 30.0  # Sekunden pro Provider-Call
+    LLM_MAX_CONNECTIONS: int = 20  # Connection-Pool pro Provider
+    LLM_MAX_RETRIES: int = 2
+    LLM_MAX_CONCURRENCY: int = 4  # parallele Calls pro Provider (Batch-Generierung)
+    LLM_RATE_LIMIT_PER_MINUTE: int = 120
+
+    # Simulierter Provider für Last-/Chaos-Tests (services/llm_simulator);
+    # LLM_SIMULATED=true ersetzt die echten Provider im Singleton
+    LLM_SIMULATED: bool = False
+    LLM_SIMULATED_SEED: int = 0
+    # Median Time-to-first-Token in ms pro (normalisiertem) Event-Typ
+    LLM_SIMULATED_LATENCY_MS: dict[str, float] = {
+        "default": 600,
+        "goal": 700,
+        "pre_match": 1200,
+        "pre_match_prediction": 1200,
+        "pre_match_injuries": 1000,
+        "pre_match_h2h": 1000,
+        "pre_match_team_stats": 1000,
+        "post_match": 1400,
+        "live_stats_update": 900,
+    }
+    LLM_SIMULATED_LATENCY_SIGMA: float = 0.4  # Streuung (Lognormal)
+    # mittlere Completion-Länge in Tokens pro Event-Typ
+    LLM_SIMULATED_COMPLETION_TOKENS: dict[str, float] = {
+        "default": 45,
+        "goal": 70,
+        "pre_match": 150,
+        "pre_match_prediction": 150,
+        "post_match": 180,
+        "live_stats_update": 90,
+    }
+    LLM_SIMULATED_TOKENS_PER_SECOND: float = 80.0
+    LLM_SIMULATED_PROMPT_TOKENS_PER_SECOND: float = 4000.0
+    # Fehler-Injektion (Anteil der Calls)
+    LLM_SIMULATED_TIMEOUT_RATE: float = 0.0
+    LLM_SIMULATED_RATE_LIMIT_RATE: float = 0.0
+    LLM_SIMULATED_SERVER_ERROR_RATE: float = 0.0
+    LLM_SIMULATED_RETRY_AFTER_SECONDS: float = 1.0
+
+    # LLM Prompt-Cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 2048
+    LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    LLM_CACHE_DB_ENABLED: bool = False  # zweite Stufe in Tabelle llm_cache_entries
+    LLM_CACHE_DB_MAX_ENTRIES: int = 50_000
+
+    # Few-Shot Stilreferenzen (In-Memory-Index)
+    STYLE_REFERENCE_INDEX_TTL_SECONDS: int = 600
+
+    # Spielstand-Zeitleiste pro Match (Neuaufbau fängt Schreibzugriffe ab,
+    # die nicht über EventRepository laufen)
+    SCORE_TRACKER_TTL_SECONDS: int = 300
+
+    # Stammdaten-Cache (Länder, Teams, Wettbewerbe, Saisons, Spieltage);
+    # TTL nur als Sicherheitsnetz, invalidiert wird explizit
+    REFERENCE_CACHE_TTL_SECONDS: int = 3600
 
     # API-Football Settings
     API_FOOTBALL_BASE_URL: str = "https://v3.football.api-sports.io"
-    API_FOOTBALL_RATE_LIMIT: int = 100
+    API_FOOTBALL_RATE_LIMIT: int = 100  # Requests pro Minute
+    # Cache-TTL in Sekunden: laufende Fixtures/Events/Statistiken vs. Stammdaten
+    API_FOOTBALL_TTL_LIVE: int = 15
+    API_FOOTBALL_TTL_STATIC: int = 3600
+
+    # Live-Sync-Scheduler (Minute/Phase aller Live-Spiele)
+    LIVE_SYNC_ENABLED: bool = True
+    LIVE_SYNC_INTERVAL_SECONDS: int = 60
+
+    # Live-Stats-Monitor (Statistik-Abgleich + live_stats_update pro Live-Spiel)
+    LIVE_STATS_ENABLED: bool = True
+    LIVE_STATS_INTERVAL_SECONDS: int = 300
+    LIVE_STATS_STYLE: str = "neutral"
+    LIVE_STATS_AUTO_PUBLISH: bool = False
 
     # n8n Webhooks
     N8N_WEBHOOK_LINEUP: str = "http://localhost:5678/webhook/lineups"
@@ -14,12 +14,15 @@ Date: 2025-02-14
 """
 
 import logging
+import threading
+import time
 from typing import Generator
 from sqlalchemy import create_engine, event, Engine, text
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
 from sqlalchemy.pool import QueuePool
 
 from app.core.config import settings
+from app.core.query_stats import instrument
 
 # Logger
 logger = logging.getLogger(__name__)
@@ -34,6 +37,10 @@ engine = create_engine(
     echo=settings.DEBUG,  # Log SQL queries in debug mode
 )
 
+# Query-Zählung/-Zeit pro Request (siehe query_stats)
+if settings.SQL_STATS_ENABLED:
+    instrument(engine)
+
 # Session Factory
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -89,8 +96,28 @@ def check_database_connection() -> bool:
     try:
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
-        logger.info("Database health check: OK")
+        logger.debug("Database health check: OK")
         return True
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
         return False
+
+
+class _HealthCache:
+    """Ergebnis des DB-Checks für ttl Sekunden – Probes treffen die DB selten."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._ok = False
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def database_ok(self) -> bool:
+        with self._lock:
+            if time.monotonic() - self._checked_at >= self.ttl:
+                self._ok = check_database_connection()
+                self._checked_at = time.monotonic()
+            return self._ok
+
+
+health_cache = _HealthCache(ttl=settings.HEALTH_CHECK_TTL_SECONDS)
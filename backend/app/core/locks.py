@@ -0,0 +1,84 @@
+"""
+Advisory Locks
+==============
+Leader-Auswahl über Postgres Advisory Locks für Hintergrund-Jobs.
+
+Jeder uvicorn-Worker startet dieselben Scheduler; damit ein Job nur einmal
+läuft, hält genau ein Worker den Lock auf einer eigenen Verbindung. Stirbt der
+Worker, schließt Postgres die Verbindung und gibt den Lock frei – beim nächsten
+Versuch übernimmt ein anderer Worker.
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+# Feste Schlüssel pro Job (beliebige, projektweit eindeutige int64)
+LIVE_SYNC_LOCK = 7_201_001
+LIVE_STATS_LOCK = 7_201_002
+
+
+class LeaderLock:
+    """Session-Level Advisory Lock auf einer dedizierten Verbindung."""
+
+    def __init__(self, key: int) -> None:
+        self.key = key
+        self._conn: Optional[Connection] = None
+
+    @property
+    def held(self) -> bool:
+        return self._conn is not None
+
+    def try_acquire(self) -> bool:
+        """Blockiert nicht; True solange dieser Prozess Leader ist."""
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT 1"))
+                self._conn.commit()
+                return True
+            except Exception:
+                logger.warning("Leader-Lock %s: Verbindung verloren", self.key)
+                self._drop()
+        conn = engine.connect()
+        try:
+            got = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}
+            ).scalar()
+            conn.commit()
+        except Exception:
+            conn.close()
+            raise
+        if not got:
+            conn.close()
+            return False
+        self._conn = conn
+        logger.info("Leader-Lock %s übernommen", self.key)
+        return True
+
+    def release(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": self.key}
+            )
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+        except Exception:
+            self._drop()
+
+    def _drop(self) -> None:
+        # invalidate statt close: die DBAPI-Verbindung wird wirklich geschlossen,
+        # ein evtl. noch gehaltener Lock landet so nicht im Pool
+        try:
+            self._conn.invalidate()
+        except Exception:
+            pass
+        self._conn = None
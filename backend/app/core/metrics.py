@@ -0,0 +1,295 @@
+"""
+Metrics
+=======
+Kleine Prometheus-Registry (Text-Format 0.0.4) ohne Zusatzpaket.
+
+Erfasst werden:
+- LLM: Latenz-Histogramm, Requests nach Ergebnis (ok/error/timeout) und
+  Tokens pro Request – jeweils pro Provider/Modell
+- HTTP: Latenz pro Route (Template, nicht Pfad → begrenzte Kardinalität)
+- Broadcast-Bus: Dauer von publish() pro Kanal (nur Einreihen/NOTIFY)
+- WebSocket-Fan-out: Dauer eines Broadcasts an alle Clients einer Gruppe
+- Laufzeit-Gauges (DB-Pool, WebSocket-Verbindungen, Bus-Queues) werden beim
+  Abruf über Callbacks gelesen, siehe register_gauge() in main.py
+
+GET /metrics rendert alles in einem Durchgang.
+"""
+
+import math
+import threading
+import time
+from typing import Callable, Iterable, Optional, TypeVar, Union
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LabelValues = tuple[str, ...]
+GaugeValue = Union[float, dict[LabelValues, float]]
+M = TypeVar("M", bound="_Metric")
+
+# Sekunden – von Cache-Treffern bis zu langsamen LLM-Calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> LabelValues:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_labels(self.labelnames, key)} {_number(v)}" for key, v in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # pro Label-Kombination: [Zähler je Bucket …, Summe, Anzahl]
+        self._values: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    def time(self, **labels: str) -> "_Timer":
+        return _Timer(self, labels)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = [(key, list(row)) for key, row in self._values.items()]
+        lines = []
+        for key, row in items:
+            for bound, count in zip(self.buckets, row):
+                le = f'le="{_number(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.labelnames, key, le)} {_number(count)}"
+                )
+            inf = 'le="+Inf"'
+            lines.append(
+                f"{self.name}_bucket{_labels(self.labelnames, key, inf)} {_number(row[-1])}"
+            )
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(row[-2])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {_number(row[-1])}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: dict) -> None:
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+
+class Gauge(_Metric):
+    """Wert wird beim Rendern über den Callback gelesen."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        callback: Callable[[], GaugeValue],
+        labelnames: Iterable[str] = (),
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.callback = callback
+
+    def samples(self) -> list[str]:
+        value = self.callback()
+        if not isinstance(value, dict):
+            value = {(): value}
+        return [
+            f"{self.name}{_labels(self.labelnames, key)} {_number(v)}"
+            for key, v in value.items()
+        ]
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: M) -> M:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            try:
+                samples = metric.samples()
+            except Exception:
+                # Ein defekter Gauge-Callback darf /metrics nicht abschießen
+                continue
+            lines.extend(metric.header())
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def register_gauge(
+    name: str,
+    help: str,
+    callback: Callable[[], GaugeValue],
+    labelnames: Iterable[str] = (),
+) -> None:
+    registry.register(Gauge(name, help, callback, labelnames))
+
+
+# ──────────────────────────────────────────
+# Metriken
+# ──────────────────────────────────────────
+
+LLM_REQUESTS = registry.register(
+    Counter(
+        "llm_requests_total",
+        "LLM-Requests nach Ergebnis (ok|error|timeout)",
+        ("provider", "model", "outcome"),
+    )
+)
+LLM_LATENCY = registry.register(
+    Histogram(
+        "llm_request_duration_seconds",
+        "Dauer eines LLM-Calls (ohne Prompt-Cache-Treffer)",
+        ("provider", "model"),
+    )
+)
+LLM_TOKENS = registry.register(
+    Histogram(
+        "llm_tokens_per_request",
+        "Tokens pro LLM-Request (kind=prompt|completion)",
+        ("provider", "model", "kind"),
+        buckets=TOKEN_BUCKETS,
+    )
+)
+HTTP_LATENCY = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Dauer eines HTTP-Requests pro Route",
+        ("method", "route", "status"),
+    )
+)
+BROADCAST_ENQUEUE = registry.register(
+    Histogram(
+        "broadcast_enqueue_duration_seconds",
+        "Dauer von publish() auf dem Broadcast-Bus (Einreihen bzw. NOTIFY, "
+        "ohne Zustellung an die Clients)",
+        ("channel",),
+    )
+)
+WS_FANOUT = registry.register(
+    Histogram(
+        "websocket_fanout_duration_seconds",
+        "Dauer eines Broadcasts an alle Clients einer Verbindungsgruppe "
+        "(Einreihen in die Ausgangs-Queues)",
+        ("group",),
+    )
+)
+
+
+# ──────────────────────────────────────────
+# Middleware
+# ──────────────────────────────────────────
+
+
+class MetricsMiddleware:
+    """Latenz pro Route-Template; nicht gematchte Pfade landen unter "unmatched"."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code: Optional[int] = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            HTTP_LATENCY.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=f"{status_code // 100}xx" if status_code else "error",
+            )
@@ -0,0 +1,175 @@
+"""
+Query Stats
+===========
+SQL-Instrumentierung pro Request: Anzahl Queries, DB-Zeit und wiederholte
+Statement-Formen (N+1-Erkennung).
+
+- Engine-Hooks (before/after_cursor_execute) messen jede Query und zählen sie
+  auf den QueryStats des aktuellen Kontexts (ContextVar)
+- QueryStatsMiddleware öffnet pro HTTP-Request einen Kontext, setzt den
+  Server-Timing-Header (sichtbar in den Browser-DevTools) und loggt auf
+  DEBUG; Statement-Formen ab SQL_N_PLUS_ONE_THRESHOLD Wiederholungen werden
+  als mögliches N+1 gewarnt
+- assert_max_queries() für Tests/Skripte: schlägt fehl, sobald ein Block mehr
+  Queries ausführt als erlaubt
+
+Sync-Routen laufen im Threadpool; Starlette kopiert den Kontext dorthin,
+die Zählung landet also im selben QueryStats-Objekt.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+# Platzhalter und Literale → "?", damit gleiche Abfragen gleich aussehen
+_NORMALIZE = [
+    (re.compile(r"%\(\w+\)s|\$\d+|:\w+"), "?"),
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\b\d+\b"), "?"),
+    (re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)"), "(?)"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def normalize_statement(statement: str) -> str:
+    for pattern, replacement in _NORMALIZE:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+class QueryStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration_ms = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.duration_ms += duration_ms
+        self.shapes[normalize_statement(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement-Formen, die mindestens threshold-mal liefen (N+1-Verdacht)."""
+        return [(s, n) for s, n in self.shapes.most_common() if n >= threshold]
+
+
+# ──────────────────────────────────────────
+# Kontext
+# ──────────────────────────────────────────
+
+
+@contextmanager
+def track() -> Iterator[QueryStats]:
+    """Zählt alle Queries im Block (auch verschachtelt: der innerste gewinnt)."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """
+    Test-Helfer: AssertionError, wenn der Block mehr als limit Queries ausführt.
+
+        with assert_max_queries(3):
+            client.get("/api/v1/ticker/match/1")
+    """
+    with track() as stats:
+        yield stats
+    if stats.count > limit:
+        top = "\n".join(f"  {n}× {s[:200]}" for s, n in stats.shapes.most_common(5))
+        raise AssertionError(
+            f"{stats.count} Queries ausgeführt, erlaubt sind {limit}:\n{top}"
+        )
+
+
+# ──────────────────────────────────────────
+# Engine-Hooks
+# ──────────────────────────────────────────
+
+
+def instrument(engine: Engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = _current.get()
+        starts = conn.info.get("query_stats_start")
+        if stats is None or not starts:
+            return
+        stats.record(statement, (time.perf_counter() - starts.pop()) * 1000)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_stats_start"):
+            conn.info["query_stats_start"].pop()
+
+
+# ──────────────────────────────────────────
+# Middleware
+# ──────────────────────────────────────────
+
+
+class QueryStatsMiddleware:
+    """Reine ASGI-Middleware (kein BaseHTTPMiddleware: Streaming bleibt unberührt)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.threshold = settings.SQL_N_PLUS_ONE_THRESHOLD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with track() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    total_ms = (time.perf_counter() - started) * 1000
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration_ms:.1f};desc="{stats.count} queries", '
+                        f"app;dur={total_ms:.1f}",
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        self._report(scope, stats, (time.perf_counter() - started) * 1000)
+
+    def _report(self, scope: Scope, stats: QueryStats, total_ms: float) -> None:
+        route = f"{scope['method']} {scope['path']}"
+        logger.debug(
+            "%s: %d Queries, %.1f ms DB, %.1f ms gesamt",
+            route,
+            stats.count,
+            stats.duration_ms,
+            total_ms,
+        )
+        for shape, n in stats.repeated(self.threshold):
+            logger.warning("Mögliches N+1 in %s: %d× %s", route, n, shape[:300])
@@ -0,0 +1,167 @@
+"""
+WebSocket Connections
+=====================
+Nicht-blockierender Versand an viele WebSocket-Clients.
+
+Jede Verbindung bekommt eine begrenzte Ausgangs-Queue und einen eigenen
+Writer-Task. broadcast() legt die Nachricht nur in die Queues – ein langsamer
+Browser verzögert damit keinen anderen Client und nicht den Aufrufer.
+
+- Serialize-once: die JSON-Nachricht wird pro Broadcast einmal kodiert und
+  als Text an alle Queues verteilt.
+- Coalesce: Nachrichten mit gleichem Schlüssel ersetzen eine noch nicht
+  gesendete ältere Nachricht in der Queue (z.B. mehrere match_update-Notices).
+  Die ältere fliegt raus, die neue kommt ans Ende – die Reihenfolge der Queue
+  bleibt damit die Reihenfolge der Broadcasts. Nachrichten mit Sequenznummer
+  nicht coalescen: der Client sähe eine Lücke.
+- Drop: ist die Queue voll, wird die älteste Nachricht verworfen – oder, falls
+  overflow_message gesetzt ist, die Queue geleert und stattdessen diese
+  Nachricht gesendet (z.B. "resync").
+- Heartbeat: ohne Verkehr sendet der Writer alle WS_HEARTBEAT_INTERVAL
+  Sekunden {"type": "ping"}; tote Verbindungen fallen so auch ohne Broadcast auf.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Optional
+
+from fastapi import WebSocket
+
+from app.core.config import settings
+from app.core.metrics import WS_FANOUT
+
+logger = logging.getLogger(__name__)
+
+_PING = json.dumps({"type": "ping"})
+
+
+def encode(data: dict) -> str:
+    return json.dumps(data, ensure_ascii=False)
+
+
+class ClientConnection:
+    """Eine WebSocket-Verbindung mit Ausgangs-Queue und Writer-Task."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        queue_size: int,
+        heartbeat_interval: float,
+        overflow_message: Optional[str] = None,
+    ) -> None:
+        self.websocket = websocket
+        self.queue_size = queue_size
+        self.heartbeat_interval = heartbeat_interval
+        self.overflow_message = overflow_message
+        self.dropped = 0
+        self.closed = False
+        # Einträge: [coalesce_key, text]
+        self._queue: deque[list] = deque()
+        self._wakeup = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def send(self, text: str, coalesce_key: Optional[str] = None) -> None:
+        """Nachricht einreihen, ohne zu warten."""
+        if self.closed:
+            return
+        if coalesce_key is not None:
+            for item in self._queue:
+                if item[0] == coalesce_key:
+                    self._queue.remove(item)
+                    break
+        if len(self._queue) >= self.queue_size:
+            self.dropped += 1
+            if self.overflow_message is not None:
+                self._queue.clear()
+                self._queue.append([None, self.overflow_message])
+                self._wakeup.set()
+                return
+            self._queue.popleft()
+        self._queue.append([coalesce_key, text])
+        self._wakeup.set()
+
+    def send_json(self, data: dict, coalesce_key: Optional[str] = None) -> None:
+        self.send(encode(data), coalesce_key)
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                if not self._queue:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(
+                            self._wakeup.wait(), timeout=self.heartbeat_interval
+                        )
+                    except asyncio.TimeoutError:
+                        await self.websocket.send_text(_PING)
+                        continue
+                _, text = self._queue.popleft()
+                await self.websocket.send_text(text)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Senden fehlgeschlagen → Verbindung schließen; der Receive-Loop
+            # des Endpoints bekommt WebSocketDisconnect und meldet ab.
+            logger.debug("WS writer stopped, closing connection", exc_info=True)
+            self.closed = True
+            try:
+                await self.websocket.close()
+            except Exception:
+                pass
+
+    async def close(self) -> None:
+        self.closed = True
+        if self._writer:
+            self._writer.cancel()
+            self._writer = None
+
+
+class ConnectionGroup:
+    """Menge von ClientConnections, die gemeinsam Broadcasts empfangen."""
+
+    def __init__(
+        self,
+        name: str = "default",
+        queue_size: Optional[int] = None,
+        heartbeat_interval: Optional[float] = None,
+        overflow_message: Optional[str] = None,
+    ) -> None:
+        # Label für websocket_fanout_duration_seconds
+        self.name = name
+        self.queue_size = queue_size or settings.WS_SEND_QUEUE_SIZE
+        self.heartbeat_interval = heartbeat_interval or settings.WS_HEARTBEAT_INTERVAL
+        self.overflow_message = overflow_message
+        self.clients: set[ClientConnection] = set()
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    async def connect(self, websocket: WebSocket) -> ClientConnection:
+        await websocket.accept()
+        client = ClientConnection(
+            websocket,
+            queue_size=self.queue_size,
+            heartbeat_interval=self.heartbeat_interval,
+            overflow_message=self.overflow_message,
+        )
+        client.start()
+        self.clients.add(client)
+        return client
+
+    async def disconnect(self, client: ClientConnection) -> None:
+        self.clients.discard(client)
+        await client.close()
+
+    def broadcast_text(self, text: str, coalesce_key: Optional[str] = None) -> None:
+        with WS_FANOUT.time(group=self.name):
+            for client in list(self.clients):
+                client.send(text, coalesce_key)
+
+    def broadcast(self, data: dict, coalesce_key: Optional[str] = None) -> None:
+        """JSON einmal kodieren und an alle Clients einreihen."""
+        self.broadcast_text(encode(data), coalesce_key)
@@ -1,5 +1,8 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 import os
 
@@ -14,9 +17,21 @@ from app.api.v1 import (
     media,
     players,
     clips,
+    thumbnails,
+    reference,
 )
+from app.core.broadcast import broadcast
 from app.core.config import settings
-from app.core.database import Base, engine, check_database_connection
+from app.core.database import Base, engine, health_cache
+from app.core.metrics import MetricsMiddleware, register_gauge, registry
+from app.core.query_stats import QueryStatsMiddleware
+from app.services.api_football import api_football
+from app.services.live_stats import live_stats
+from app.services.live_sync import live_sync
+from app.services.reference_cache import reference_cache
+from app.services.llm_service import close_llm_services
+from app.services.thumbnail_cache import thumbnail_cache
+from app.services.ticker_feed import ticker_feed
 
 from app.models import (  # noqa: F401
     country,
@@ -35,6 +50,7 @@ from app.models import (  # noqa: F401
     player,
     player_statistic,
     media_clip,
+    llm_cache_entry,
 )
 
 Base.metadata.create_all(bind=engine)
@@ -42,12 +58,34 @@ Base.metadata.create_all(bind=engine)
 STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
 os.makedirs(os.path.join(STATIC_DIR, "thumbnails"), exist_ok=True)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await broadcast.connect()
+    await media.manager.start()
+    await ticker_feed.start()
+    await reference_cache.start()
+    await live_sync.start()
+    await live_stats.start()
+    yield
+    await live_stats.stop()
+    await live_sync.stop()
+    await reference_cache.stop()
+    await ticker_feed.stop()
+    await media.manager.stop()
+    await broadcast.disconnect()
+    await close_llm_services()
+    await thumbnail_cache.aclose()
+    await api_football.aclose()
+
+
 app = FastAPI(
     title="Liveticker AI Backend",
     description="KI-gestütztes Redaktionssystem für automatisierte Liveticker-Generierung",
     version="0.3.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -66,6 +104,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.SQL_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 PREFIX = "/api/v1"
 
 app.include_router(countries.router, prefix=PREFIX)
@@ -76,10 +119,13 @@ app.include_router(teams.assignment_router, prefix=PREFIX)
 app.include_router(matches.router, prefix=PREFIX)
 app.include_router(events.router, prefix=PREFIX)
 app.include_router(ticker.router, prefix=PREFIX)
+app.include_router(ticker.ws_router)  # → /ws/ticker/{match_id}
 app.include_router(media.router, prefix=PREFIX)
 app.include_router(media.ws_router)  # WebSocket ohne /api/v1 Prefix → /ws/media
 app.include_router(players.router, prefix=PREFIX)
 app.include_router(clips.router, prefix=PREFIX)
+app.include_router(thumbnails.router, prefix=PREFIX)
+app.include_router(reference.router, prefix=PREFIX)
 
 
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
@@ -90,10 +136,78 @@ def read_root() -> dict:
     return {"status": "ok", "app": "Liveticker AI Backend", "version": "0.3.0"}
 
 
+def _scheduler_status() -> dict:
+    # Inaktive Scheduler ersetzt das Frontend durch seine n8n-Trigger
+    return {"live_sync": live_sync.active, "live_stats": live_stats.active}
+
+
 @app.get("/health", tags=["Meta"])
 def health_check() -> dict:
-    db_ok = check_database_connection()
+    db_ok = health_cache.database_ok()
     return {
         "status": "healthy" if db_ok else "degraded",
         "database": "connected" if db_ok else "disconnected",
+        "schedulers": _scheduler_status(),
     }
+
+
+@app.get("/health/live", tags=["Meta"])
+async def liveness() -> dict:
+    """Prozess lebt – ohne Datenbank."""
+    return {"status": "ok"}
+
+
+@app.get("/health/ready", tags=["Meta"])
+def readiness() -> JSONResponse:
+    """Bereit für Traffic, wenn die DB erreichbar ist (Ergebnis gecacht)."""
+    db_ok = health_cache.database_ok()
+    return JSONResponse(
+        {
+            "status": "ready" if db_ok else "unavailable",
+            "schedulers": _scheduler_status(),
+        },
+        status_code=status.HTTP_200_OK if db_ok else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
+# ──────────────────────────────────────────────
+# Metrics
+# ──────────────────────────────────────────────
+
+register_gauge(
+    "db_pool_checked_out", "Ausgeliehene DB-Verbindungen", lambda: engine.pool.checkedout()
+)
+register_gauge(
+    "db_pool_overflow",
+    "Verbindungen über pool_size hinaus (negativ: noch freie Pool-Plätze)",
+    lambda: engine.pool.overflow(),
+)
+register_gauge("db_pool_size", "Konfigurierte Pool-Größe", lambda: engine.pool.size())
+register_gauge(
+    "websocket_connections",
+    "Aktive WebSocket-Verbindungen dieses Workers",
+    lambda: {
+        ("media",): len(media.manager.active_connections),
+        ("ticker",): sum(len(g) for g in ticker_feed.active_connections.values()),
+    },
+    labelnames=("feed",),
+)
+register_gauge(
+    "broadcast_queue_depth",
+    "Wartende Nachrichten in den Bus-Queues pro Kanal",
+    lambda: {(c,): depth for c, (depth, _) in broadcast.queue_stats().items()},
+    labelnames=("channel",),
+)
+register_gauge(
+    "broadcast_dropped_messages",
+    "Wegen voller Queue verworfene Bus-Nachrichten (aktive Abos)",
+    lambda: {(c,): dropped for c, (_, dropped) in broadcast.queue_stats().items()},
+    labelnames=("channel",),
+)
+
+
+@app.get("/metrics", tags=["Meta"], include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
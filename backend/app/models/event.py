@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Text, TIMESTAMP, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -30,5 +30,12 @@ class Event(Base):
     source = Column(String(20), nullable=False, default="partner")
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # Events eines Spiels in Ticker-Reihenfolge (EventRepository.get_by_match)
+        Index("ix_events_match_position", "match_id", "position", "time"),
+        # Upsert/Update/Delete per sourceId (Partner-API, n8n)
+        Index("ix_events_source_id", "source_id"),
+    )
+
     match = relationship("Match", back_populates="events")
     ticker_entries = relationship("TickerEntry", back_populates="event")
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Boolean, TIMESTAMP, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -52,6 +52,8 @@ class Match(Base):
         String(30), nullable=True
     )  # Undefined|PreMatch|FullTime|PostPoned|FirstHalf|SecondHalf
     minute = Column(Integer, nullable=True)  # current live minute
+    # Zählt bei jeder Änderung an ticker_entries hoch (ETag für den Ticker)
+    ticker_version = Column(Integer, nullable=False, default=0, server_default="0")
     is_scheduled = Column(Boolean, nullable=False, default=False)
     is_kickoff_confirmed = Column(Boolean, nullable=False, default=False)
     number_of_goal_scorers = Column(Integer, nullable=True)
@@ -73,6 +75,11 @@ class Match(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        # GET /matches: starts_at DESC, id DESC (Rückwärts-Scan, inkl. Keyset-Cursor)
+        Index("ix_matches_starts_at_id", "starts_at", "id"),
+    )
+
     # Relationships
     season = relationship("Season", back_populates="matches", lazy="select")
     competition = relationship("Competition", back_populates="matches", lazy="select")
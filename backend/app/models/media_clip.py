@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Text, Boolean, TIMESTAMP, ForeignKey
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -10,7 +10,7 @@ class MediaClip(Base):
     match_id = Column(
         Integer, ForeignKey("matches.id", ondelete="SET NULL"), nullable=True, index=True
     )
-    vid = Column(String(100), nullable=True)          # JW Player video ID
+    vid = Column(String(100), nullable=True, unique=True, index=True)  # JW Player video ID
     video_url = Column(Text, nullable=False)           # iframe embed URL
     thumbnail_url = Column(Text, nullable=True)
     title = Column(Text, nullable=True)
@@ -19,3 +19,10 @@ class MediaClip(Base):
     source = Column(String(50), nullable=True, default="bundesliga")  # "bundesliga" | "youtube"
     published = Column(Boolean, nullable=False, default=False)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # Clip-Listen pro Quelle (youtube/twitter/instagram), optional nur unveröffentlicht
+        Index(
+            "ix_media_clips_source_published_created", "source", "published", "created_at"
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, Column, Integer, Text, TIMESTAMP
+from sqlalchemy import BigInteger, Column, Index, Integer, Text, TIMESTAMP
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -18,3 +18,12 @@ class MediaQueue(Base):
     description = Column(Text, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Offene Bilder, neueste zuerst (GET /media/queue)
+        Index(
+            "ix_media_queue_pending_created",
+            created_at.desc(),
+            postgresql_where=status == "pending",
+        ),
+    )
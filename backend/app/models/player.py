@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, Date, Float, Text, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Boolean, Date, Float, Text, TIMESTAMP, ForeignKey
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -40,4 +40,9 @@ class Player(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        # Listen-Reihenfolge inkl. Keyset-Cursor (GET /players)
+        Index("ix_players_name_sort", "last_name", "first_name", "id"),
+    )
+
     team = relationship("Team", lazy="select")
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, Integer, String, Date, TIMESTAMP
+from sqlalchemy import Column, Index, Integer, String, Date, TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -32,6 +32,12 @@ class Season(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        # GET /seasons: order_by starts_at/title, inkl. Keyset-Cursor
+        Index("ix_seasons_starts_at_id", "starts_at", "id"),
+        Index("ix_seasons_title_id", "title", "id"),
+    )
+
     matches = relationship("Match", back_populates="season", lazy="select")
     standings = relationship("Standing", back_populates="season", lazy="select")
     competition_teams = relationship(
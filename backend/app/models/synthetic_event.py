@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, TIMESTAMP, ForeignKey
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -17,4 +17,14 @@ class SyntheticEvent(Base):
     data = Column(JSONB, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # match_id + type (=) und type LIKE 'pre_match_injuries%' (Präfix)
+        Index(
+            "ix_synthetic_events_match_type",
+            "match_id",
+            "type",
+            postgresql_ops={"type": "varchar_pattern_ops"},
+        ),
+    )
+
     match = relationship("Match", back_populates="synthetic_events")
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Boolean, TIMESTAMP, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -39,6 +39,11 @@ class Team(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        # Listen-Reihenfolge inkl. Keyset-Cursor (GET /teams)
+        Index("ix_teams_position_name", "position", "name", "id"),
+    )
+
     country = relationship("Country", back_populates="teams", lazy="select")
     home_matches = relationship(
         "Match",
@@ -1,7 +1,51 @@
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, ForeignKey
-from sqlalchemy.orm import relationship
+from typing import Optional
+
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    String,
+    Text,
+    TIMESTAMP,
+    ForeignKey,
+    event,
+    update,
+)
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.models.match import Match
+
+# Anzeige-Reihenfolge der Phasen; Einträge ohne/mit unbekannter Phase → 5
+PHASE_ORDER = {
+    "Before":               0,
+    "FirstHalf":            1,
+    "FirstHalfBreak":       2,
+    "SecondHalf":           3,
+    "SecondHalfBreak":      4,
+    "ExtraFirstHalf":       5,
+    "ExtraBreak":           6,
+    "ExtraSecondHalf":      7,
+    "ExtraSecondHalfBreak": 8,
+    "PenaltyShootout":      9,
+    "After":               10,
+}
+# Phase-Start-Events (Anpfiff, 2. HZ …) stehen zuerst in ihrer Minute
+PHASE_FIRST = {"FirstHalf", "SecondHalf", "ExtraFirstHalf", "ExtraSecondHalf", "PenaltyShootout"}
+
+
+def compute_sort_key(
+    phase: Optional[str], minute: Optional[int], synthetic_event_id: Optional[int]
+) -> int:
+    """
+    (Phase, Minute, Phase-Start zuerst) als eine Zahl – ORDER BY sort_key,
+    created_at liefert die Anzeige-Reihenfolge direkt aus dem Index.
+    Muss zur Backfill-Formel in Migration 8c2e4a6b1d3f passen.
+    """
+    order = PHASE_ORDER.get(phase, 5) if phase else 5
+    minute = min(max(minute, 0), 9999) if minute is not None else 999
+    first = 0 if (synthetic_event_id is not None and phase in PHASE_FIRST) else 1
+    return order * 100_000 + minute * 10 + first
 
 
 class TickerEntry(Base):
@@ -27,9 +71,59 @@ class TickerEntry(Base):
     source = Column(String(20), nullable=False, default="ai")  # ai|manual
     minute = Column(Integer, nullable=True)
     phase = Column(String(50), nullable=True)
+    sort_key = Column(Integer, nullable=False, default=0)  # siehe compute_sort_key
     image_url = Column(Text, nullable=True)
     video_url = Column(Text, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_ticker_entries_match_status_sort", "match_id", "status", "sort_key"),
+        # Phasen-Einträge (manuell, generate-match-phases)
+        Index("ix_ticker_entries_match_phase", "match_id", "phase"),
+        # Bereits generierte Synthetic Events eines Spiels
+        Index(
+            "ix_ticker_entries_match_synthetic",
+            "match_id",
+            "synthetic_event_id",
+            postgresql_where=synthetic_event_id.isnot(None),
+        ),
+        Index("ix_ticker_entries_event_id", "event_id"),
+    )
+
     match = relationship("Match", back_populates="ticker_entries")
     event = relationship("Event", back_populates="ticker_entries")
+
+
+@event.listens_for(TickerEntry, "before_insert")
+@event.listens_for(TickerEntry, "before_update")
+def _set_sort_key(mapper, connection, target: TickerEntry) -> None:
+    target.sort_key = compute_sort_key(
+        target.phase, target.minute, target.synthetic_event_id
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_ticker_version(session: Session, flush_context) -> None:
+    """
+    matches.ticker_version in derselben Transaktion hochzählen, sobald sich
+    Einträge eines Spiels ändern – Grundlage für ETag/304 auf
+    GET /ticker/match/{id}, ohne die Einträge selbst zu lesen.
+    """
+    match_ids = {
+        obj.match_id
+        for obj in (*session.new, *session.deleted)
+        if isinstance(obj, TickerEntry)
+    }
+    match_ids.update(
+        obj.match_id
+        for obj in session.dirty
+        if isinstance(obj, TickerEntry) and session.is_modified(obj)
+    )
+    if not match_ids:
+        return
+    session.connection().execute(
+        update(Match)
+        .where(Match.id.in_(match_ids))
+        # updated_at explizit setzen, sonst greift dessen onupdate
+        .values(ticker_version=Match.ticker_version + 1, updated_at=Match.updated_at)
+    )
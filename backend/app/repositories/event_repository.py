@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.models.event import Event
 from app.schemas.event import EventCreate, EventUpdate
+from app.services.score_tracker import GOAL_TYPES, score_tracker
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,26 @@ class EventRepository:
     def get_by_source_id(self, source_id: str) -> Optional[Event]:
         return self.db.query(Event).filter(Event.source_id == source_id).first()
 
+    def get_goals(self, match_id: int) -> list[Event]:
+        return (
+            self.db.query(Event)
+            .filter(Event.match_id == match_id, Event.event_type.in_(GOAL_TYPES))
+            .all()
+        )
+
+    def score_at(
+        self, event: Event, home_ext: Optional[int], away_ext: Optional[int]
+    ) -> str:
+        """Spielstand zum Zeitpunkt des Events (aus dem Score-Tracker)."""
+        return score_tracker.score_at(
+            event.match_id,
+            home_ext,
+            away_ext,
+            event.position,
+            event.id,
+            loader=self.get_goals,
+        )
+
     def upsert(self, match_id: int, data: EventCreate) -> tuple[Event, bool]:
         """Insert or update by source_id. Falls back to insert if no source_id."""
         if data.source_id:
@@ -48,6 +69,7 @@ class EventRepository:
                 except IntegrityError:
                     self.db.rollback()
                     raise
+                score_tracker.apply(existing)
                 return existing, False
 
         data_dict = data.model_dump(exclude_unset=True, by_alias=False)
@@ -61,6 +83,7 @@ class EventRepository:
         except IntegrityError:
             self.db.rollback()
             raise
+        score_tracker.apply(event)
         return event, True
 
     def update_by_source_id(self, source_id: str, data: EventUpdate) -> Optional[Event]:
@@ -73,13 +96,16 @@ class EventRepository:
             setattr(event, field, value)
         self.db.commit()
         self.db.refresh(event)
+        score_tracker.apply(event)
         return event
 
     def delete_by_source_id(self, source_id: str) -> bool:
         event = self.get_by_source_id(source_id)
         if not event:
             return False
+        match_id, event_id = event.match_id, event.id
         self.db.delete(event)
         self.db.commit()
+        score_tracker.remove(match_id, event_id)
         logger.debug("Event deleted: source_id=%s", source_id)
         return True
\ No newline at end of file
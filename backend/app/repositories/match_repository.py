@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from sqlalchemy import distinct, func, or_
+from sqlalchemy import bindparam, distinct, func, or_, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
@@ -17,9 +17,14 @@ from app.schemas.match import (
     StatisticsBulkUpdate,
     TeamStatisticsInput,
 )
+from app.services.score_tracker import score_tracker
+from app.utils.pagination import Page, paginate
 
 logger = logging.getLogger(__name__)
 
+# Neueste zuerst; id macht die Reihenfolge eindeutig (Keyset-Cursor)
+_SORT_KEY = [(Match.starts_at, True), (Match.id, True)]
+
 
 class MatchRepository:
     def __init__(self, db: Session) -> None:
@@ -49,7 +54,10 @@ class MatchRepository:
         competition_id: Optional[int] = None,
         matchday: Optional[int] = None,
         match_state: Optional[str] = None,
-    ) -> tuple[list[Match], int]:
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> Page:
+        """Raises ValueError bei ungültigem cursor."""
         q = self._base_query()
         if team_id:
             q = q.filter(
@@ -61,14 +69,9 @@ class MatchRepository:
             q = q.filter(Match.matchday == matchday)
         if match_state:
             q = q.filter(Match.match_state == match_state)
-        total = q.count()
-        items = (
-            q.order_by(Match.starts_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-            .all()
+        return paginate(
+            q, _SORT_KEY, page_size, page=page, cursor=cursor, with_total=with_total
         )
-        return items, total
 
     def get_by_id(self, match_id: int) -> Optional[Match]:
         return self._base_query().filter(Match.id == match_id).first()
@@ -196,12 +199,70 @@ class MatchRepository:
             raise
         return match
 
+    def get_live_for_sync(self) -> list[Match]:
+        """Alle Live-Spiele mit external_id (für den Live-Sync-Scheduler)."""
+        return (
+            self.db.query(Match)
+            .filter(Match.match_state == "Live", Match.external_id.isnot(None))
+            .all()
+        )
+
+    def get_for_stats_monitor(self, extra_ids: Optional[set[int]] = None) -> list[Match]:
+        """
+        Live-Spiele mit external_id plus extra_ids (gerade beendete Spiele für
+        einen letzten Statistik-Abgleich), inkl. Teams und Wettbewerb.
+        """
+        condition = Match.match_state == "Live"
+        if extra_ids:
+            condition = or_(condition, Match.id.in_(extra_ids))
+        return (
+            self.db.query(Match)
+            .options(
+                joinedload(Match.home_team),
+                joinedload(Match.away_team),
+                joinedload(Match.competition),
+            )
+            .filter(condition, Match.external_id.isnot(None))
+            .all()
+        )
+
+    def get_statistics_by_team(self, match_id: int) -> dict[int, MatchStatistic]:
+        return {
+            s.team_id: s
+            for s in self.db.query(MatchStatistic)
+            .filter(MatchStatistic.match_id == match_id)
+            .all()
+        }
+
+    def bulk_update_live(self, updates: list[dict]) -> None:
+        """
+        minute/match_phase für viele Spiele in einem executemany-UPDATE.
+        updates: [{"id": ..., "minute": ..., "match_phase": ...}, ...]
+        """
+        if not updates:
+            return
+        # Core-UPDATE über die Tabelle: ein ORM-update(Match) mit Parameterliste
+        # liefe in den "Bulk UPDATE by Primary Key"-Pfad und ignorierte das WHERE
+        table = Match.__table__
+        self.db.connection().execute(
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(minute=bindparam("b_minute"), match_phase=bindparam("b_phase")),
+            [
+                {"b_id": u["id"], "b_minute": u["minute"], "b_phase": u["match_phase"]}
+                for u in updates
+            ],
+        )
+        self.db.commit()
+        logger.debug("Live-Sync: %d Matches aktualisiert", len(updates))
+
     def delete(self, match_id: int) -> bool:
         match = self.get_by_id(match_id)
         if not match:
             return False
         self.db.delete(match)
         self.db.commit()
+        score_tracker.forget(match_id)
         logger.debug("Match deleted: id=%s", match_id)
         return True
 
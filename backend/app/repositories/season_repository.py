@@ -1,5 +1,4 @@
 import logging
-import math
 from typing import Literal, Optional
 from uuid import UUID
 
@@ -13,16 +12,18 @@ from app.schemas.season import (
     SeasonResponse,
     SeasonUpdate,
 )
+from app.utils.pagination import paginate
 
 logger = logging.getLogger(__name__)
 
 OrderByField = Literal["starts_at_asc", "starts_at_desc", "title_asc", "title_desc"]
 
+# Sortierschlüssel je order_by; id macht sie eindeutig (Keyset-Cursor)
 _ORDER_MAP = {
-    "starts_at_asc": Season.starts_at.asc(),
-    "starts_at_desc": Season.starts_at.desc(),
-    "title_asc": Season.title.asc(),
-    "title_desc": Season.title.desc(),
+    "starts_at_asc": [(Season.starts_at, False), (Season.id, False)],
+    "starts_at_desc": [(Season.starts_at, True), (Season.id, True)],
+    "title_asc": [(Season.title, False), (Season.id, False)],
+    "title_desc": [(Season.title, True), (Season.id, True)],
 }
 
 
@@ -39,25 +40,22 @@ class SeasonRepository:
         page: int = 1,
         page_size: int = 20,
         order_by: OrderByField = "starts_at_desc",
+        cursor: Optional[str] = None,
+        with_total: bool = True,
     ) -> PaginatedSeasonResponse:
-        order_clause = _ORDER_MAP.get(order_by, Season.starts_at.desc())
-        total = self.db.query(Season).count()
-        items = (
-            self.db.query(Season)
-            .order_by(order_clause)
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-            .all()
+        """Raises ValueError bei ungültigem cursor."""
+        sort_key = _ORDER_MAP.get(order_by, _ORDER_MAP["starts_at_desc"])
+        result = paginate(
+            self.db.query(Season),
+            sort_key,
+            page_size,
+            page=page,
+            cursor=cursor,
+            with_total=with_total,
         )
-        page_count = math.ceil(total / page_size) if page_size else 1
         return PaginatedSeasonResponse(
-            items=[SeasonResponse.model_validate(s) for s in items],
-            total=total,
-            page=page,
-            page_size=page_size,
-            page_count=page_count,
-            has_previous_page=page > 1,
-            has_next_page=page < page_count,
+            items=[SeasonResponse.model_validate(s) for s in result.items],
+            **result.meta(),
         )
 
     def get_by_id(self, season_id: int) -> Optional[Season]:
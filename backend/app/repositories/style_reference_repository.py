@@ -1,6 +1,10 @@
+import random
+from typing import Optional
+
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 from app.models.style_reference import StyleReference
+from app.services.style_reference_index import IndexRow, style_reference_index
 
 
 class StyleReferenceRepository:
@@ -13,44 +17,32 @@ class StyleReferenceRepository:
         instance: str = "ef_whitelabel",
         limit: int = 3,
         league: str | None = None,
-        min_text_length: int = 20,
-    ) -> list[StyleReference]:
+        rng: Optional[random.Random] = None,
+    ) -> list[str]:
         """
-        Holt zufällige Stilreferenzen für einen event_type.
+        Holt zufällige Stilreferenz-Texte für einen event_type.
 
-        Falls league angegeben und genug Treffer vorhanden → league-spezifisch filtern.
-        Fallback: ohne league-Filter (alle Ligen).
+        Sampling läuft über den In-Memory-Index (siehe style_reference_index),
+        die Tabelle wird nur beim (Neu-)Laden des Index gelesen.
         """
-        base_filters = [
-            StyleReference.event_type == event_type,
-            StyleReference.instance == instance,
-            func.length(StyleReference.text) >= min_text_length,
-        ]
-
-        if league:
-            results = (
-                self.db.query(StyleReference)
-                .filter(*base_filters, StyleReference.league == league)
-                .order_by(func.random())
-                .limit(limit)
-                .all()
-            )
-            if len(results) >= limit:
-                return results
-            # Fallback: ohne League-Filter
-            return (
-                self.db.query(StyleReference)
-                .filter(*base_filters)
-                .order_by(func.random())
-                .limit(limit)
-                .all()
-            )
+        return style_reference_index.sample(
+            self._index_rows,
+            event_type=event_type,
+            instance=instance,
+            limit=limit,
+            league=league,
+            rng=rng,
+        )
 
+    def _index_rows(self, min_text_length: int) -> list[IndexRow]:
         return (
-            self.db.query(StyleReference)
-            .filter(*base_filters)
-            .order_by(func.random())
-            .limit(limit)
+            self.db.query(
+                StyleReference.instance,
+                StyleReference.event_type,
+                StyleReference.league,
+                StyleReference.text,
+            )
+            .filter(func.length(StyleReference.text) >= min_text_length)
             .all()
         )
 
@@ -59,4 +51,5 @@ class StyleReferenceRepository:
         objs = [StyleReference(**r) for r in records]
         self.db.bulk_save_objects(objs)
         self.db.commit()
+        style_reference_index.invalidate()
         return len(objs)
@@ -1,5 +1,4 @@
 import logging
-import math
 from typing import Optional
 from uuid import UUID
 
@@ -9,9 +8,13 @@ from sqlalchemy.orm import Session
 from app.models.country import Country
 from app.models.team import Team
 from app.schemas.team import PaginatedTeamResponse, TeamCreate, TeamResponse, TeamUpdate
+from app.utils.pagination import paginate
 
 logger = logging.getLogger(__name__)
 
+# Listen-Reihenfolge; id macht sie eindeutig (Keyset-Cursor)
+_SORT_KEY = [(Team.position, False), (Team.name, False), (Team.id, False)]
+
 
 class TeamRepository:
     def __init__(self, db: Session) -> None:
@@ -27,28 +30,21 @@ class TeamRepository:
         page_size: int = 20,
         is_partner: Optional[bool] = None,
         hidden: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
     ) -> PaginatedTeamResponse:
+        """Raises ValueError bei ungültigem cursor."""
         q = self.db.query(Team)
         if is_partner is not None:
             q = q.filter(Team.is_partner_team == is_partner)
         if hidden is not None:
             q = q.filter(Team.hidden == hidden)
-        total = q.count()
-        items = (
-            q.order_by(Team.position, Team.name)
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-            .all()
+        result = paginate(
+            q, _SORT_KEY, page_size, page=page, cursor=cursor, with_total=with_total
         )
-        page_count = math.ceil(total / page_size) if page_size else 1
         return PaginatedTeamResponse(
-            items=[TeamResponse.model_validate(t) for t in items],
-            total=total,
-            page=page,
-            page_size=page_size,
-            page_count=page_count,
-            has_previous_page=page > 1,
-            has_next_page=page < page_count,
+            items=[TeamResponse.model_validate(t) for t in result.items],
+            **result.meta(),
         )
 
     def get_by_id(self, team_id: int) -> Optional[Team]:
@@ -3,6 +3,7 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from app.models.match import Match
 from app.models.ticker_entry import TickerEntry
 from app.schemas.ticker_entry import TickerEntryCreate, TickerEntryUpdate
 
@@ -13,41 +14,24 @@ class TickerEntryRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    _PHASE_ORDER = {
-        "Before":               0,
-        "FirstHalf":            1,
-        "FirstHalfBreak":       2,
-        "SecondHalf":           3,
-        "SecondHalfBreak":      4,
-        "ExtraFirstHalf":       5,
-        "ExtraBreak":           6,
-        "ExtraSecondHalf":      7,
-        "ExtraSecondHalfBreak": 8,
-        "PenaltyShootout":      9,
-        "After":               10,
-    }
-
     def get_by_match(
         self, match_id: int, published_only: bool = True
     ) -> list[TickerEntry]:
+        # Reihenfolge (Phase, Minute, Phase-Start zuerst, created_at) steckt in
+        # sort_key (siehe models.ticker_entry.compute_sort_key) → Index-Scan
+        # auf (match_id, status, sort_key) statt Sortierung in Python
         q = self.db.query(TickerEntry).filter(TickerEntry.match_id == match_id)
         if published_only:
             q = q.filter(TickerEntry.status == "published")
-        entries = q.order_by(TickerEntry.created_at.desc()).all()
-        # Primär nach Phase-Reihenfolge sortieren, sekundär nach created_at desc
-        # Phase-Start-Events (Anpfiff, 2. HZ) → zuerst in ihrer Minute (0)
-        # Phase-End-Events (HZ, Abpfiff) haben eigene Phase-Order → already correct
-        # Alle anderen Events → 1
-        _PHASE_FIRST = {"FirstHalf", "SecondHalf", "ExtraFirstHalf", "ExtraSecondHalf", "PenaltyShootout"}
-        entries.sort(
-            key=lambda e: (
-                self._PHASE_ORDER.get(e.phase, 5) if e.phase else 5,
-                e.minute if e.minute is not None else 999,
-                0 if (e.synthetic_event_id is not None and e.phase in _PHASE_FIRST) else 1,
-                e.created_at,
-            )
+        return q.order_by(
+            TickerEntry.sort_key, TickerEntry.created_at, TickerEntry.id
+        ).all()
+
+    def get_version(self, match_id: int) -> Optional[int]:
+        """matches.ticker_version (None: Match existiert nicht)."""
+        return (
+            self.db.query(Match.ticker_version).filter(Match.id == match_id).scalar()
         )
-        return entries
 
     def get_by_id(self, entry_id: int) -> Optional[TickerEntry]:
         return self.db.query(TickerEntry).filter(TickerEntry.id == entry_id).first()
@@ -78,6 +62,23 @@ class TickerEntryRepository:
         logger.debug("TickerEntry created: id=%s match_id=%s", entry.id, entry.match_id)
         return entry
 
+    def create_many(self, items: list[TickerEntryCreate]) -> list[TickerEntry]:
+        """Mehrere Einträge in einer Transaktion anlegen (ein Commit statt N)."""
+        if not items:
+            return []
+        entries = [TickerEntry(**data.model_dump()) for data in items]
+        self.db.add_all(entries)
+        self.db.flush()
+        ids = [e.id for e in entries]
+        self.db.commit()
+        # Ein SELECT lädt alle nach dem Commit expirierten Objekte nach
+        loaded = {
+            e.id: e
+            for e in self.db.query(TickerEntry).filter(TickerEntry.id.in_(ids)).all()
+        }
+        logger.debug("TickerEntries created: %d", len(ids))
+        return [loaded[i] for i in ids]
+
     def update(self, entry_id: int, data: TickerEntryUpdate) -> Optional[TickerEntry]:
         entry = self.get_by_id(entry_id)
         if not entry:
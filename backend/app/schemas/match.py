@@ -1,12 +1,13 @@
 from datetime import date, datetime
 from enum import Enum
-from math import ceil
 from typing import Any, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
 from pydantic.alias_generators import to_camel
 
+from app.utils.pagination import Page
+
 
 # ------------------------------------------------------------------ #
 # Enums                                                                #
@@ -191,27 +192,18 @@ class PaginatedMatchResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
 
     items: list[MatchResponse]
-    total: int
-    page: int
+    # total/pageCount fehlen bei skipTotal, page im Cursor-Modus
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    page_count: int
+    page_count: Optional[int] = None
     has_previous_page: bool
     has_next_page: bool
+    next_cursor: Optional[str] = None
 
     @classmethod
-    def create(
-        cls, items: list[MatchResponse], total: int, page: int, page_size: int
-    ) -> "PaginatedMatchResponse":
-        page_count = ceil(total / page_size) if page_size > 0 else 0
-        return cls(
-            items=items,
-            total=total,
-            page=page,
-            page_size=page_size,
-            page_count=page_count,
-            has_previous_page=page > 1,
-            has_next_page=page < page_count,
-        )
+    def from_page(cls, items: list[MatchResponse], page: Page) -> "PaginatedMatchResponse":
+        return cls(items=items, **page.meta())
 
 
 # ------------------------------------------------------------------ #
@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+from app.services.thumbnail_cache import thumbnail_cache
 
 
 class MediaClipImport(BaseModel):
@@ -33,6 +35,17 @@ class MediaClipResponse(BaseModel):
     published: bool
     created_at: datetime
 
+    # Verkleinerte Varianten für lokal gecachte Thumbnails (sonst None)
+    @computed_field
+    @property
+    def thumbnail_small_url(self) -> Optional[str]:
+        return thumbnail_cache.variant_url(self.thumbnail_url, "small")
+
+    @computed_field
+    @property
+    def thumbnail_medium_url(self) -> Optional[str]:
+        return thumbnail_cache.variant_url(self.thumbnail_url, "medium")
+
 
 class ClipPublishRequest(BaseModel):
     match_id: int
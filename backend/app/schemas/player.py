@@ -1,10 +1,11 @@
 from datetime import date, datetime
-from math import ceil
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
+from app.utils.pagination import Page
+
 
 # ------------------------------------------------------------------ #
 # Statistics                                                           #
@@ -156,24 +157,15 @@ class PaginatedPlayerResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
 
     items: list[PlayerResponse]
-    total: int
-    page: int
+    # total/pageCount fehlen bei skipTotal, page im Cursor-Modus
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    page_count: int
+    page_count: Optional[int] = None
     has_previous_page: bool
     has_next_page: bool
+    next_cursor: Optional[str] = None
 
     @classmethod
-    def create(
-        cls, items: list[PlayerResponse], total: int, page: int, page_size: int
-    ) -> "PaginatedPlayerResponse":
-        page_count = ceil(total / page_size) if page_size > 0 else 0
-        return cls(
-            items=items,
-            total=total,
-            page=page,
-            page_size=page_size,
-            page_count=page_count,
-            has_previous_page=page > 1,
-            has_next_page=page < page_count,
-        )
+    def from_page(cls, items: list[PlayerResponse], page: Page) -> "PaginatedPlayerResponse":
+        return cls(items=items, **page.meta())
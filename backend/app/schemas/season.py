@@ -82,9 +82,11 @@ class PaginatedSeasonResponse(BaseModel):
     )
 
     items: list[SeasonResponse]
-    total: int
-    page: int
+    # total/pageCount fehlen bei skip_total, page im Cursor-Modus
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    page_count: int
+    page_count: Optional[int] = None
     has_previous_page: bool
     has_next_page: bool
+    next_cursor: Optional[str] = None
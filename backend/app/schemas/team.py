@@ -89,9 +89,11 @@ class PaginatedTeamResponse(BaseModel):
     )
 
     items: list[TeamResponse]
-    total: int
-    page: int
+    # total/pageCount fehlen bei skip_total, page im Cursor-Modus
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    page_count: int
+    page_count: Optional[int] = None
     has_previous_page: bool
-    has_next_page: bool
\ No newline at end of file
+    has_next_page: bool
+    next_cursor: Optional[str] = None
\ No newline at end of file
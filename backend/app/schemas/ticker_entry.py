@@ -46,6 +46,7 @@ class TickerEntryResponse(BaseModel):
     id: int
     match_id: int
     event_id: Optional[int] = None
+    synthetic_event_id: Optional[int] = None
     text: str
     style: Optional[str] = None
     icon: Optional[str] = None
@@ -0,0 +1,223 @@
+"""
+API-Football Client
+===================
+Gemeinsamer async Client für alle Aufrufe gegen API_FOOTBALL_BASE_URL.
+
+- ein gepoolter httpx.AsyncClient (Keep-Alive statt Verbindung pro Request)
+- Token-Bucket mit API_FOOTBALL_RATE_LIMIT Requests pro Minute
+- Response-Cache pro Endpoint mit TTL: Live-Daten (laufende Fixtures, Events,
+  Statistiken) kurz, Stammdaten (Teams, Ligen, Standings …) lang
+- identische gleichzeitige Requests teilen sich einen Upstream-Call (eigener
+  Task – bricht ein Aufrufer ab, bekommen die anderen trotzdem das Ergebnis)
+- Zähler für Upstream-Calls, Cache-Hits, Coalescing und das Tageskontingent
+  (Header x-ratelimit-requests-remaining), abrufbar über stats()
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import Counter
+from typing import Any, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Endpoints, deren Antworten sich während eines Spiels laufend ändern
+_LIVE_ENDPOINTS = {"/fixtures/events", "/fixtures/statistics", "/fixtures/players"}
+_CACHE_MAX_ENTRIES = 1000
+
+
+class ApiFootballError(Exception):
+    """Upstream-Fehler oder von API-Football gemeldeter Fehler im Body."""
+
+
+class ApiFootballClient:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str],
+        requests_per_minute: int,
+        ttl_live: float,
+        ttl_static: float,
+        timeout: float = 10.0,
+    ) -> None:
+        self.base_url = base_url
+        self.api_key = api_key
+        self.ttl_live = ttl_live
+        self.ttl_static = ttl_static
+        self.timeout = timeout
+        self._bucket = TokenBucket(rate=requests_per_minute / 60.0, capacity=10)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._counters: Counter[str] = Counter()
+        self._per_endpoint: Counter[str] = Counter()
+        self.quota_remaining: Optional[int] = None
+        self.quota_limit: Optional[int] = None
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"x-apisports-key": self.api_key or ""},
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def ttl_for(self, endpoint: str, params: dict) -> float:
+        if endpoint in _LIVE_ENDPOINTS:
+            return self.ttl_live
+        if endpoint == "/fixtures" and ({"live", "id", "ids"} & params.keys()):
+            return self.ttl_live
+        return self.ttl_static
+
+    async def get(
+        self, endpoint: str, params: Optional[dict] = None, ttl: Optional[float] = None
+    ) -> list:
+        """
+        GET {endpoint} → Feld "response" der API-Football-Antwort.
+        ttl überschreibt die Standard-TTL des Endpoints (0 = nicht cachen).
+        """
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        key = endpoint + "?" + json.dumps(params, sort_keys=True, default=str)
+        ttl = self.ttl_for(endpoint, params) if ttl is None else ttl
+
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._counters["cache_hits"] += 1
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._counters["coalesced"] += 1
+        else:
+            # Eigener Task statt Fetch im ersten Aufrufer: wird der abgebrochen,
+            # laufen die übrigen Wartenden trotzdem weiter
+            task = asyncio.create_task(self._fetch(key, endpoint, params, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(self._fetch_done)
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: str, endpoint: str, params: dict, ttl: float) -> list:
+        try:
+            data = await self._request(endpoint, params)
+            if ttl > 0:
+                self._store(key, data, ttl)
+            return data
+        finally:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _fetch_done(task: asyncio.Task) -> None:
+        # Haben alle Wartenden abgebrochen, holt sonst niemand die Exception ab
+        if not task.cancelled():
+            task.exception()
+
+    def _store(self, key: str, data: Any, ttl: float) -> None:
+        now = time.monotonic()
+        if len(self._cache) >= _CACHE_MAX_ENTRIES:
+            for k in [k for k, (exp, _) in self._cache.items() if exp <= now]:
+                del self._cache[k]
+            while len(self._cache) >= _CACHE_MAX_ENTRIES:
+                self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (now + ttl, data)
+
+    async def _request(self, endpoint: str, params: dict) -> list:
+        if not self.api_key:
+            raise ApiFootballError("API_FOOTBALL_KEY not configured")
+        await self._bucket.acquire()
+        self._counters["upstream_requests"] += 1
+        self._per_endpoint[endpoint] += 1
+        try:
+            resp = await self._get_client().get(endpoint, params=params)
+        except httpx.HTTPError as exc:
+            self._counters["errors"] += 1
+            raise ApiFootballError(f"{endpoint}: {exc}") from exc
+
+        self._read_quota(resp.headers)
+        if resp.status_code == 429:
+            self._counters["rate_limited"] += 1
+            retry_after = resp.headers.get("retry-after", "")
+            self._bucket.penalize(float(retry_after) if retry_after.isdigit() else 60.0)
+            raise ApiFootballError(f"{endpoint}: rate limited (429)")
+        if resp.is_error:
+            self._counters["errors"] += 1
+            raise ApiFootballError(f"{endpoint}: HTTP {resp.status_code}")
+
+        try:
+            body = resp.json()
+        except ValueError as exc:
+            self._counters["errors"] += 1
+            raise ApiFootballError(f"{endpoint}: ungültiges JSON ({exc})") from exc
+        if not isinstance(body, dict):
+            self._counters["errors"] += 1
+            raise ApiFootballError(
+                f"{endpoint}: unerwartete Antwort {type(body).__name__}"
+            )
+        errors = body.get("errors")
+        if errors:
+            # API-Football meldet Limits/Fehler mit HTTP 200 im Body
+            self._counters["errors"] += 1
+            if isinstance(errors, dict) and "rateLimit" in errors:
+                self._counters["rate_limited"] += 1
+                self._bucket.penalize(60.0)
+            raise ApiFootballError(f"{endpoint}: {errors}")
+        return body.get("response", [])
+
+    def _read_quota(self, headers: httpx.Headers) -> None:
+        remaining = headers.get("x-ratelimit-requests-remaining")
+        limit = headers.get("x-ratelimit-requests-limit")
+        if remaining is not None and remaining.isdigit():
+            self.quota_remaining = int(remaining)
+        if limit is not None and limit.isdigit():
+            self.quota_limit = int(limit)
+        if self.quota_remaining is not None and self.quota_limit:
+            if self.quota_remaining < self.quota_limit * 0.1:
+                logger.warning(
+                    "API-Football: nur noch %d/%d Requests im Tageskontingent",
+                    self.quota_remaining,
+                    self.quota_limit,
+                )
+
+    def stats(self) -> dict:
+        return {
+            **{
+                k: self._counters[k]
+                for k in (
+                    "upstream_requests",
+                    "cache_hits",
+                    "coalesced",
+                    "rate_limited",
+                    "errors",
+                )
+            },
+            "per_endpoint": dict(self._per_endpoint),
+            "quota_remaining": self.quota_remaining,
+            "quota_limit": self.quota_limit,
+            "cache_entries": len(self._cache),
+        }
+
+
+# Singleton – Client wird im lifespan (main.py) geschlossen
+api_football = ApiFootballClient(
+    base_url=settings.API_FOOTBALL_BASE_URL,
+    api_key=settings.API_FOOTBALL_KEY,
+    requests_per_minute=settings.API_FOOTBALL_RATE_LIMIT,
+    ttl_live=settings.API_FOOTBALL_TTL_LIVE,
+    ttl_static=settings.API_FOOTBALL_TTL_STATIC,
+)
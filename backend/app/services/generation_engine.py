@@ -0,0 +1,137 @@
+"""
+Generation Engine
+=================
+Parallele LLM-Generierung für Batch-Endpunkte (generate-bulk, generate-synthetic-batch).
+
+- Semaphore pro Provider: maximal N Calls gleichzeitig in Flight
+- Token-Bucket pro Provider: hält das Requests-pro-Minute-Limit ein
+- 429-Antworten sperren den Bucket (Retry-After) und werden wiederholt
+- Ergebnisse kommen in Job-Reihenfolge zurück (run) oder sobald fertig (as_completed),
+  Fehler jeweils als Exception-Objekt
+"""
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Awaitable, Callable, Optional, Sequence, TypeVar
+
+from app.core.config import settings
+from app.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Job = Callable[[], Awaitable[T]]
+
+# Provider ohne externes Limit (lokal, kostenlos). "simulated" fehlt bewusst:
+# er soll wie ein echter Provider durch Semaphore und Token-Bucket laufen.
+_UNLIMITED_PROVIDERS = {"mock"}
+
+
+def _retry_after(exc: Exception, attempt: int) -> Optional[float]:
+    """Wartezeit in Sekunden bei Rate-Limit-Fehlern, sonst None."""
+    response = getattr(exc, "response", None)
+    status_code = getattr(exc, "status_code", None) or getattr(
+        response, "status_code", None
+    )
+    if status_code != 429:
+        return None
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return float(2**attempt)
+
+
+class GenerationEngine:
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: int,
+        max_attempts: int = 3,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.max_attempts = max_attempts
+        self._limits: dict[str, tuple[asyncio.Semaphore, Optional[TokenBucket]]] = {}
+
+    def _limiter(self, provider: str) -> tuple[asyncio.Semaphore, Optional[TokenBucket]]:
+        limiter = self._limits.get(provider)
+        if limiter is None:
+            bucket = (
+                None
+                if provider in _UNLIMITED_PROVIDERS
+                else TokenBucket(
+                    rate=self.requests_per_minute / 60,
+                    capacity=self.max_concurrency,
+                )
+            )
+            limiter = (asyncio.Semaphore(self.max_concurrency), bucket)
+            self._limits[provider] = limiter
+        return limiter
+
+    async def submit(self, provider: str, job: Job[T]) -> T:
+        """Führt einen Job unter den Limits des Providers aus."""
+        semaphore, bucket = self._limiter(provider)
+        attempt = 1
+        while True:
+            async with semaphore:
+                if bucket:
+                    await bucket.acquire()
+                try:
+                    return await job()
+                except Exception as exc:
+                    wait = _retry_after(exc, attempt)
+                    if wait is None or attempt >= self.max_attempts:
+                        raise
+                    if bucket:
+                        bucket.penalize(wait)
+                    logger.warning(
+                        "Rate-Limit bei %s – Versuch %d/%d, warte %.1fs",
+                        provider,
+                        attempt,
+                        self.max_attempts,
+                        wait,
+                    )
+            if not bucket:
+                await asyncio.sleep(wait)
+            attempt += 1
+
+    async def run(
+        self, provider: str, jobs: Sequence[Job[T]]
+    ) -> list[T | Exception]:
+        """Alle Jobs parallel (gedrosselt) ausführen – Ergebnis in Job-Reihenfolge."""
+        return await asyncio.gather(
+            *(self.submit(provider, job) for job in jobs), return_exceptions=True
+        )
+
+    async def as_completed(
+        self, provider: str, jobs: Sequence[Job[T]]
+    ) -> AsyncIterator[tuple[int, T | Exception, float]]:
+        """
+        Liefert (Index, Ergebnis, Dauer in s) in Fertigstellungs-Reihenfolge.
+        Bricht der Konsument ab (Client-Disconnect), werden offene Jobs gecancelt.
+        """
+
+        async def _timed(index: int, job: Job[T]) -> tuple[int, T | Exception, float]:
+            started = time.perf_counter()
+            try:
+                result: T | Exception = await self.submit(provider, job)
+            except Exception as exc:
+                result = exc
+            return index, result, time.perf_counter() - started
+
+        tasks = [asyncio.create_task(_timed(i, job)) for i, job in enumerate(jobs)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+generation_engine = GenerationEngine(
+    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+    requests_per_minute=settings.LLM_RATE_LIMIT_PER_MINUTE,
+)
@@ -0,0 +1,318 @@
+"""
+Live Stats Monitor
+==================
+Server-seitiger Statistik-Abgleich für alle Live-Spiele.
+
+Bisher hat jeder geöffnete LiveTicker alle 5 Minuten den n8n-Webhook
+/live-stats-monitor ausgelöst – Upstream-Calls und live_stats_update-
+Generierung liefen damit einmal pro Browser. Jetzt gibt es einen Job pro
+Deployment (Leader-Lock, siehe core/locks), der pro Live-Spiel die Kadenz hält:
+
+1. GET /fixtures/statistics?fixture=<external_id> (über services/api_football)
+2. Werte mit match_statistics vergleichen – unverändert → nichts tun
+3. geänderte Werte speichern; bei relevanten Änderungen (Schüsse, Ecken,
+   Karten, Ballbesitz …) ein SyntheticEvent "live_stats_update" anlegen
+4. dazu einen Ticker-Eintrag generieren und über den Ticker-Feed pushen
+
+Spiele, die seit dem letzten Durchlauf nicht mehr live sind, bekommen einen
+letzten Abgleich mit den Endwerten. Da der Vergleich gegen die Datenbank
+läuft, erzeugt auch ein Leader-Wechsel keine doppelten Events.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.locks import LIVE_STATS_LOCK, LeaderLock
+from app.models.synthetic_event import SyntheticEvent
+from app.repositories.match_repository import MatchRepository
+from app.repositories.ticker_entry_repository import TickerEntryRepository
+from app.schemas.match import StatisticsBulkUpdate, TeamStatisticsInput
+from app.schemas.ticker_entry import TickerEntryCreate
+from app.services.api_football import api_football
+from app.services.llm_service import generate_ticker_text
+from app.services.ticker_feed import ticker_feed
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPE = "live_stats_update"
+
+# API-Football statistics[].type → match_statistics-Spalte
+# (identisch zu n8n/05_import_match_statistics.json)
+STAT_MAPPING = {
+    "Shots on Goal": "goal_on_target_scoring_attempt",
+    "Total Shots": "goal_scoring_attempt",
+    "Fouls": "fouls",
+    "Corner Kicks": "corner_taken",
+    "Offsides": "total_offside",
+    "Ball Possession": "possession_percentage",
+    "Yellow Cards": "yellow_cards",
+    "Total passes": "total_pass",
+    "Passes accurate": "accurate_pass",
+}
+
+# Änderungen dieser Werte lösen ein live_stats_update aus (Pässe allein nicht)
+TRIGGER_LABELS = {
+    "goal_on_target_scoring_attempt": "Schüsse aufs Tor",
+    "goal_scoring_attempt": "Torschüsse",
+    "corner_taken": "Ecken",
+    "yellow_cards": "Gelbe Karten",
+    "fouls": "Fouls",
+    "total_offside": "Abseits",
+}
+# Ballbesitz zählt erst ab dieser Verschiebung (Prozentpunkte)
+POSSESSION_SWING = 5
+
+
+def parse_statistics(response: list) -> dict[int, dict]:
+    """/fixtures/statistics → {team_external_id: {spalte: wert}}."""
+    result: dict[int, dict] = {}
+    for team_data in response:
+        team_id = (team_data.get("team") or {}).get("id")
+        if team_id is None:
+            continue
+        stats = {column: 0 for column in STAT_MAPPING.values()}
+        for stat in team_data.get("statistics") or []:
+            column = STAT_MAPPING.get(stat.get("type"))
+            if not column:
+                continue
+            value = stat.get("value")
+            if isinstance(value, str):
+                digits = value.replace("%", "").strip()
+                value = int(digits) if digits.isdigit() else 0
+            stats[column] = value or 0
+        stats["possession_percentage"] = str(stats["possession_percentage"])
+        result[team_id] = stats
+    return result
+
+
+def _possession(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def stat_triggers(prev: dict, curr: dict, team_name: str) -> list[str]:
+    """Lesbare Auslöser für ein Team, z.B. "Eintracht: Ecken 3 → 5"."""
+    triggers = []
+    for column, label in TRIGGER_LABELS.items():
+        before, after = prev.get(column) or 0, curr.get(column) or 0
+        if after != before:
+            triggers.append(f"{team_name}: {label} {before} → {after}")
+    before = _possession(prev.get("possession_percentage"))
+    after = _possession(curr.get("possession_percentage"))
+    if abs(after - before) >= POSSESSION_SWING:
+        triggers.append(f"{team_name}: Ballbesitz {before:.0f}% → {after:.0f}%")
+    return triggers
+
+
+class LiveStatsMonitor:
+    def __init__(self, interval: float, check_interval: float = 30.0) -> None:
+        self.interval = interval
+        self.check_interval = check_interval
+        self._lock = LeaderLock(LIVE_STATS_LOCK)
+        self._task: Optional[asyncio.Task] = None
+        # match_id → monotonic-Zeitpunkt des nächsten Abgleichs
+        self._next_due: dict[int, float] = {}
+
+    @property
+    def active(self) -> bool:
+        """Läuft in diesem Prozess (unabhängig davon, wer den Leader-Lock hält)."""
+        return self._task is not None
+
+    async def start(self) -> None:
+        if not settings.LIVE_STATS_ENABLED:
+            logger.info("Live-Stats-Monitor deaktiviert (LIVE_STATS_ENABLED=false)")
+            return
+        if not api_football.configured:
+            # Laut, weil das Frontend dann auf seinen n8n-Fallback zurückfällt
+            logger.warning("Live-Stats-Monitor inaktiv: API_FOOTBALL_KEY fehlt")
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await asyncio.to_thread(self._lock.release)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await asyncio.to_thread(self._lock.try_acquire):
+                    await self.tick()
+                else:
+                    self._next_due.clear()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Live-Stats-Monitor: Durchlauf fehlgeschlagen")
+            await asyncio.sleep(self.check_interval)
+
+    async def tick(self) -> int:
+        """Fällige Spiele abgleichen; gibt die Zahl neuer live_stats_update zurück."""
+        matches = await asyncio.to_thread(_load_matches, set(self._next_due))
+        now = time.monotonic()
+        emitted = 0
+        for match in matches:
+            live = match["match_state"] == "Live"
+            if live and self._next_due.get(match["id"], 0.0) > now:
+                continue
+            try:
+                if await self.check(match):
+                    emitted += 1
+            except Exception:
+                logger.exception("Live-Stats-Monitor: match_id=%s fehlgeschlagen", match["id"])
+            if live:
+                self._next_due[match["id"]] = now + self.interval
+            else:
+                # letzter Abgleich nach Spielende
+                self._next_due.pop(match["id"], None)
+        return emitted
+
+    async def check(self, match: dict) -> bool:
+        """Ein Spiel abgleichen; True, wenn ein live_stats_update entstanden ist."""
+        response = await api_football.get(
+            "/fixtures/statistics", {"fixture": match["external_id"]}
+        )
+        by_team = parse_statistics(response)
+        home = by_team.get(match["home_external_id"])
+        away = by_team.get(match["away_external_id"])
+        if home is None or away is None:
+            return False
+
+        synthetic_id = await asyncio.to_thread(_apply_statistics, match, home, away)
+        if synthetic_id is None:
+            return False
+        await _generate_entry(match, synthetic_id)
+        return True
+
+
+def _load_matches(extra_ids: set[int]) -> list[dict]:
+    db = SessionLocal()
+    try:
+        return [
+            {
+                "id": m.id,
+                "external_id": m.external_id,
+                "match_state": m.match_state,
+                "minute": m.minute,
+                "home_team_id": m.home_team_id,
+                "away_team_id": m.away_team_id,
+                "home_external_id": m.home_team.external_id if m.home_team else None,
+                "away_external_id": m.away_team.external_id if m.away_team else None,
+                "home_team": m.home_team.name if m.home_team else "",
+                "away_team": m.away_team.name if m.away_team else "",
+                "home_score": m.home_score,
+                "away_score": m.away_score,
+                "league": m.competition.title if m.competition else None,
+            }
+            for m in MatchRepository(db).get_for_stats_monitor(extra_ids)
+            if m.home_team_id and m.away_team_id
+        ]
+    finally:
+        db.close()
+
+
+def _stored(stat) -> dict:
+    if stat is None:
+        return {}
+    return {column: getattr(stat, column) for column in STAT_MAPPING.values()}
+
+
+def _apply_statistics(match: dict, home: dict, away: dict) -> Optional[int]:
+    """
+    Neue Werte speichern, falls geändert. Gibt die ID des angelegten
+    SyntheticEvents zurück (None: unverändert oder keine relevante Änderung).
+    """
+    db = SessionLocal()
+    try:
+        repo = MatchRepository(db)
+        stored = repo.get_statistics_by_team(match["id"])
+        prev_home = _stored(stored.get(match["home_team_id"]))
+        prev_away = _stored(stored.get(match["away_team_id"]))
+        if prev_home == home and prev_away == away:
+            return None
+
+        match_obj = repo.get_by_id(match["id"])
+        repo.upsert_statistics(
+            match["id"],
+            match_obj,
+            StatisticsBulkUpdate(
+                team_home_statistics=TeamStatisticsInput(**home),
+                team_away_statistics=TeamStatisticsInput(**away),
+            ),
+        )
+
+        # Erster Abgleich eines Spiels ist nur die Ausgangsbasis
+        if not prev_home and not prev_away:
+            return None
+        triggers = stat_triggers(prev_home, home, match["home_team"]) + stat_triggers(
+            prev_away, away, match["away_team"]
+        )
+        if not triggers:
+            return None
+
+        synthetic = SyntheticEvent(
+            match_id=match["id"],
+            type=EVENT_TYPE,
+            minute=match["minute"],
+            data={
+                "minute": match["minute"],
+                "home_team": match["home_team"],
+                "away_team": match["away_team"],
+                "triggers": triggers,
+                "prev_stats": {"home": prev_home, "away": prev_away},
+                "curr_stats": {"home": home, "away": away},
+            },
+        )
+        db.add(synthetic)
+        db.commit()
+        return synthetic.id
+    finally:
+        db.close()
+
+
+async def _generate_entry(match: dict, synthetic_id: int) -> None:
+    db = SessionLocal()
+    try:
+        synthetic = db.get(SyntheticEvent, synthetic_id)
+        text, model_used = await generate_ticker_text(
+            event_type=EVENT_TYPE,
+            minute=synthetic.minute,
+            style=settings.LIVE_STATS_STYLE,
+            context_data=synthetic.data or {},
+            match_context={
+                "home_team": match["home_team"],
+                "away_team": match["away_team"],
+                "home_score": match["home_score"],
+                "away_score": match["away_score"],
+                "match_state": match["match_state"],
+                "minute": synthetic.minute,
+                "league": match["league"],
+            },
+            db=db,
+        )
+        entry = TickerEntryRepository(db).create(
+            TickerEntryCreate(
+                match_id=match["id"],
+                synthetic_event_id=synthetic_id,
+                text=text,
+                source="ai",
+                style=settings.LIVE_STATS_STYLE,
+                llm_model=model_used,
+                minute=synthetic.minute,
+                status="published" if settings.LIVE_STATS_AUTO_PUBLISH else "draft",
+            )
+        )
+        ticker_feed.publish(match["id"], "created", entry)
+    finally:
+        db.close()
+
+
+# Singleton – wird im lifespan (main.py) gestartet
+live_stats = LiveStatsMonitor(interval=settings.LIVE_STATS_INTERVAL_SECONDS)
@@ -0,0 +1,186 @@
+"""
+Live Sync
+=========
+Server-seitiger Abgleich von Minute und Phase aller Live-Spiele mit
+API-Football.
+
+Bisher hat jeder geöffnete MatchHeader minütlich selbst synchronisiert – zehn
+Redakteure auf einem Spiel bedeuteten zehn identische Upstream-Calls. Jetzt
+läuft ein Scheduler pro Deployment (Leader-Lock, siehe core/locks):
+
+1. alle Spiele mit match_state == "Live" und external_id laden
+2. Fixtures in Multi-ID-Requests holen (GET /fixtures?ids=a-b-c, max. 20 IDs)
+3. geänderte minute/match_phase in einem executemany-UPDATE schreiben
+4. Änderungen als {"type": "match_update"} über den Ticker-Feed pushen
+
+Upstream-Kosten skalieren damit mit der Zahl der Live-Spiele, nicht mit der
+Zahl der Zuschauer.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.locks import LIVE_SYNC_LOCK, LeaderLock
+from app.repositories.match_repository import MatchRepository
+from app.services.api_football import api_football
+from app.services.ticker_feed import ticker_feed
+
+logger = logging.getLogger(__name__)
+
+# API-Football status.short → match_phase
+PHASE_MAP = {
+    "1H": "FirstHalf",
+    "2H": "SecondHalf",
+    "HT": "FirstHalfBreak",
+    "ET": "SecondHalf",   # extra time – treat as second half for display
+    "BT": "FirstHalfBreak",  # break before extra time
+    "P":  "SecondHalf",
+    "FT": "FullTime",
+    "AET": "FullTime",
+    "PEN": "FullTime",
+}
+
+# API-Football erlaubt bis zu 20 IDs pro /fixtures?ids=…
+MAX_IDS_PER_REQUEST = 20
+
+
+def fixture_update(fixture: dict) -> dict:
+    """minute/match_phase aus einem API-Football-Fixture (nur gesetzte Felder)."""
+    fixture_status = fixture.get("fixture", {}).get("status", {})
+    elapsed: Optional[int] = fixture_status.get("elapsed")
+    short: Optional[str] = fixture_status.get("short")
+
+    update_data: dict = {}
+    if elapsed is not None:
+        update_data["minute"] = elapsed
+    if short and short in PHASE_MAP:
+        update_data["match_phase"] = PHASE_MAP[short]
+    return update_data
+
+
+class LiveSyncScheduler:
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = LeaderLock(LIVE_SYNC_LOCK)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        """Läuft in diesem Prozess (unabhängig davon, wer den Leader-Lock hält)."""
+        return self._task is not None
+
+    async def start(self) -> None:
+        if not settings.LIVE_SYNC_ENABLED:
+            logger.info("Live-Sync deaktiviert (LIVE_SYNC_ENABLED=false)")
+            return
+        if not api_football.configured:
+            # Laut, weil das Frontend dann auf seinen n8n-Fallback zurückfällt
+            logger.warning("Live-Sync inaktiv: API_FOOTBALL_KEY fehlt")
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await asyncio.to_thread(self._lock.release)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await asyncio.to_thread(self._lock.try_acquire):
+                    await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Live-Sync: Durchlauf fehlgeschlagen")
+            await asyncio.sleep(self.interval)
+
+    async def _fetch_fixtures(self, external_ids: list[int]) -> dict[int, dict]:
+        chunks = [
+            external_ids[i : i + MAX_IDS_PER_REQUEST]
+            for i in range(0, len(external_ids), MAX_IDS_PER_REQUEST)
+        ]
+
+        results = await asyncio.gather(
+            *(
+                api_football.get(
+                    "/fixtures", {"ids": "-".join(str(i) for i in sorted(chunk))}
+                )
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        fixtures: dict[int, dict] = {}
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.error("Live-Sync: Fixtures %s fehlgeschlagen: %s", chunk, result)
+                continue
+            for fixture in result:
+                fixture_id = fixture.get("fixture", {}).get("id")
+                if fixture_id is not None:
+                    fixtures[fixture_id] = fixture
+        return fixtures
+
+    async def tick(self) -> int:
+        """Ein Sync-Durchlauf; gibt die Zahl geänderter Spiele zurück."""
+        live = await asyncio.to_thread(_load_live_matches)
+        if not live:
+            return 0
+
+        fixtures = await self._fetch_fixtures(sorted(m["external_id"] for m in live))
+
+        updates: list[dict] = []
+        for match in live:
+            fixture = fixtures.get(match["external_id"])
+            if not fixture:
+                continue
+            new = {**match, **fixture_update(fixture)}
+            if (new["minute"], new["match_phase"]) != (match["minute"], match["match_phase"]):
+                updates.append(new)
+
+        if updates:
+            await asyncio.to_thread(_write_updates, updates)
+            for u in updates:
+                await ticker_feed.notify(
+                    u["id"],
+                    {
+                        "type": "match_update",
+                        "match_id": u["id"],
+                        "minute": u["minute"],
+                        "match_phase": u["match_phase"],
+                    },
+                )
+        logger.debug("Live-Sync: %d live, %d geändert", len(live), len(updates))
+        return len(updates)
+
+
+def _load_live_matches() -> list[dict]:
+    db = SessionLocal()
+    try:
+        return [
+            {
+                "id": m.id,
+                "external_id": m.external_id,
+                "minute": m.minute,
+                "match_phase": m.match_phase,
+            }
+            for m in MatchRepository(db).get_live_for_sync()
+        ]
+    finally:
+        db.close()
+
+
+def _write_updates(updates: list[dict]) -> None:
+    db = SessionLocal()
+    try:
+        MatchRepository(db).bulk_update_live(updates)
+    finally:
+        db.close()
+
+
+# Singleton – wird im lifespan (main.py) gestartet
+live_sync = LiveSyncScheduler(interval=settings.LIVE_SYNC_INTERVAL_SECONDS)
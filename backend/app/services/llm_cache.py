@@ -0,0 +1,191 @@
+"""
+LLM Prompt-Cache
+================
+Content-adressierter Cache vor LLMService.generate_ticker_text.
+
+Key: sha256 über Provider, Modell, Temperatur und normalisierten Prompt.
+Tier 1: In-Process LRU (OrderedDict) mit TTL und Größenlimit.
+Tier 2 (optional, LLM_CACHE_DB_ENABLED): Tabelle llm_cache_entries – überlebt
+Neustarts und wird von allen Workern geteilt.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.llm_cache_entry import LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+
+# Alle N DB-Writes werden abgelaufene / überzählige Zeilen entfernt
+_DB_PRUNE_EVERY = 100
+
+
+class LLMCache:
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        enabled: bool = True,
+        db_enabled: bool = False,
+        db_max_entries: int = 50_000,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.db_enabled = db_enabled
+        self.db_max_entries = db_max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._db_writes = 0
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ──────────────────────────────────────────
+    # Key
+    # ──────────────────────────────────────────
+
+    @staticmethod
+    def make_key(
+        prompt: str, provider: str, model: Optional[str], temperature: float
+    ) -> str:
+        # Whitespace normalisieren: Einrückung/Zeilenumbrüche ändern den Key nicht
+        normalized = " ".join(prompt.split())
+        raw = f"{provider}\x00{model or ''}\x00{temperature}\x00{normalized}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # ──────────────────────────────────────────
+    # Public API
+    # ──────────────────────────────────────────
+
+    async def get(self, key: str) -> Optional[str]:
+        text = self._memory_get(key)
+        if text is not None:
+            self.hits += 1
+            return text
+        if self.db_enabled:
+            try:
+                text = await asyncio.to_thread(self._db_get, key)
+            except Exception:
+                logger.warning("LLM-Cache: DB-Lookup fehlgeschlagen", exc_info=True)
+                text = None
+            if text is not None:
+                self.hits += 1
+                self.db_hits += 1
+                self._memory_set(key, text)
+                return text
+        self.misses += 1
+        return None
+
+    async def set(
+        self, key: str, text: str, provider: str, model: Optional[str]
+    ) -> None:
+        self._memory_set(key, text)
+        if self.db_enabled:
+            try:
+                await asyncio.to_thread(self._db_set, key, text, provider, model)
+            except Exception:
+                logger.warning("LLM-Cache: DB-Write fehlgeschlagen", exc_info=True)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "db_enabled": self.db_enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    # ──────────────────────────────────────────
+    # Tier 1: In-Process LRU
+    # ──────────────────────────────────────────
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        stored_at, text = item
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return text
+
+    def _memory_set(self, key: str, text: str) -> None:
+        self._entries[key] = (time.monotonic(), text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # ──────────────────────────────────────────
+    # Tier 2: PostgreSQL (läuft im Threadpool)
+    # ──────────────────────────────────────────
+
+    def _db_get(self, key: str) -> Optional[str]:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+        with SessionLocal() as db:
+            row = (
+                db.query(LLMCacheEntry.text)
+                .filter(LLMCacheEntry.key == key, LLMCacheEntry.created_at >= cutoff)
+                .first()
+            )
+        return row[0] if row else None
+
+    def _db_set(self, key: str, text: str, provider: str, model: Optional[str]) -> None:
+        stmt = insert(LLMCacheEntry).values(
+            key=key, provider=provider, model=model, text=text
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LLMCacheEntry.key],
+            set_={"text": stmt.excluded.text, "created_at": stmt.excluded.created_at},
+        )
+        with SessionLocal() as db:
+            db.execute(stmt)
+            self._db_writes += 1
+            if self._db_writes % _DB_PRUNE_EVERY == 0:
+                self._db_prune(db)
+            db.commit()
+
+    def _db_prune(self, db) -> None:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+        db.query(LLMCacheEntry).filter(LLMCacheEntry.created_at < cutoff).delete(
+            synchronize_session=False
+        )
+        # Größenlimit: nur die jüngsten db_max_entries behalten
+        keep = (
+            db.query(LLMCacheEntry.key)
+            .order_by(LLMCacheEntry.created_at.desc())
+            .limit(self.db_max_entries)
+            .subquery()
+        )
+        db.query(LLMCacheEntry).filter(
+            LLMCacheEntry.key.not_in(select(keep.c.key))
+        ).delete(synchronize_session=False)
+
+
+llm_cache = LLMCache(
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+    enabled=settings.LLM_CACHE_ENABLED,
+    db_enabled=settings.LLM_CACHE_DB_ENABLED,
+    db_max_entries=settings.LLM_CACHE_DB_MAX_ENTRIES,
+)
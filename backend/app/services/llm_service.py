@@ -1,13 +1,24 @@
 """
 LLM Service für Ticker-Text-Generierung.
-Provider: Mock, OpenAI, Anthropic, Gemini, OpenRouter
+Provider: Mock, Simulated (Last-/Chaos-Tests), OpenAI, Anthropic, Gemini, OpenRouter
 Few-Shot: Stilreferenzen aus PostgreSQL (style_references)
+Alle Provider laufen über native Async-Clients (eigener Pool + Timeout pro Provider).
+Ergebnisse werden prompt-basiert gecacht (siehe llm_cache).
 """
 
+import asyncio
+import functools
 import logging
 import random
+import time
 from typing import Optional, Literal
 
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import LLM_LATENCY, LLM_REQUESTS, LLM_TOKENS
+from app.services.llm_cache import llm_cache
+
 logger = logging.getLogger(__name__)
 
 # ──────────────────────────────────────────────
@@ -110,42 +121,68 @@ class LLMService:
         self,
         api_key: Optional[str] = None,
         provider: Literal[
-            "openai", "anthropic", "gemini", "openrouter", "mock"
+            "openai", "anthropic", "gemini", "openrouter", "mock", "simulated"
         ] = "mock",
         model: Optional[str] = None,
+        timeout: Optional[float] = None,
     ):
         self.provider = provider
         self.api_key = api_key
         self.model = model
+        self.timeout = timeout or settings.LLM_TIMEOUT
+        self.temperature = 0.3
+        self.max_tokens = 200
         self._client = None  # lazy init
+        self._http_client: Optional[httpx.AsyncClient] = None
 
         if provider == "mock":
             logger.warning("LLM Service läuft im MOCK-Modus")
+        elif provider == "simulated":
+            from app.services.llm_simulator import SimulatedLLM
+
+            logger.warning("LLM Service läuft im SIMULATED-Modus (kein echter Provider)")
+            self._client = SimulatedLLM.from_settings()
+            self.model = model or "simulated"
         elif provider == "gemini":
             self._require_key()
             from google import genai
 
+            # Async-Zugriff über client.aio, Timeout via asyncio.wait_for
             self._client = genai.Client(api_key=api_key)
             self.model = model or "gemini-2.0-flash-lite-001"
         elif provider == "openrouter":
             self._require_key()
-            from openai import OpenAI
-
-            self._client = OpenAI(
-                api_key=api_key, base_url="https://openrouter.ai/api/v1"
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
+                api_key=api_key,
+                base_url="https://openrouter.ai/api/v1",
+                http_client=self._build_http_client(),
+                timeout=self.timeout,
+                max_retries=settings.LLM_MAX_RETRIES,
             )
             self.model = model or "google/gemini-2.0-flash-lite-001"
         elif provider == "openai":
             self._require_key()
-            from openai import OpenAI
+            from openai import AsyncOpenAI
 
-            self._client = OpenAI(api_key=api_key)
+            self._client = AsyncOpenAI(
+                api_key=api_key,
+                http_client=self._build_http_client(),
+                timeout=self.timeout,
+                max_retries=settings.LLM_MAX_RETRIES,
+            )
             self.model = model or "gpt-4o-mini"
         elif provider == "anthropic":
             self._require_key()
             import anthropic
 
-            self._client = anthropic.Anthropic(api_key=api_key)
+            self._client = anthropic.AsyncAnthropic(
+                api_key=api_key,
+                http_client=self._build_http_client(),
+                timeout=self.timeout,
+                max_retries=settings.LLM_MAX_RETRIES,
+            )
             self.model = model or "claude-haiku-4-5-20251001"
         else:
             raise ValueError(f"Unbekannter Provider: {provider}")
@@ -154,11 +191,28 @@ class LLMService:
         if not self.api_key:
             raise ValueError(f"{self.provider} API Key erforderlich")
 
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """Eigener Connection-Pool pro Provider – Keep-Alive statt Handshake pro Call."""
+        self._http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_CONNECTIONS,
+            ),
+        )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Schließt den Connection-Pool (App-Shutdown)."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     # ──────────────────────────────────────────
     # Public Entry Point
     # ──────────────────────────────────────────
 
-    def generate_ticker_text(
+    async def generate_ticker_text(
         self,
         event_type: str,
         event_detail: str = "",
@@ -170,6 +224,7 @@ class LLMService:
         language: str = "de",
         context_data: Optional[dict] = None,
         style_references: Optional[list[str]] = None,
+        use_cache: bool = True,
     ) -> str:
         normalized = self._normalize_event_type(event_type)
         kwargs = dict(
@@ -184,14 +239,23 @@ class LLMService:
             context_data=context_data,
             style_references=style_references,
         )
-        dispatch = {
-            "mock": self._generate_mock_text,
-            "gemini": self._generate_gemini_text,
-            "openrouter": self._generate_openrouter_text,
-            "openai": self._generate_openai_text,
-            "anthropic": self._generate_anthropic_text,
-        }
-        return dispatch[self.provider](**kwargs)
+        if self.provider == "mock":
+            return await self._generate_mock_text(**kwargs)
+
+        prompt = self._build_prompt(**kwargs)
+        cache_key = None
+        if use_cache and llm_cache.enabled:
+            cache_key = llm_cache.make_key(
+                prompt, self.provider, self.model, self.temperature
+            )
+            cached = await llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        text = await self._complete(prompt, normalized)
+        if cache_key:
+            await llm_cache.set(cache_key, text, self.provider, self.model)
+        return text
 
     def _normalize_event_type(self, event_type: str) -> str:
         return EVENT_TYPE_MAP.get(event_type, "comment")
@@ -284,9 +348,6 @@ class LLMService:
         if not context_data:
             return ""
 
-        if "home_team" in context_data:
-            return self._ctx_match_info(context_data)
-
         # pre_match_injuries_<team_id> → normalisieren
         normalized_type = event_type
         if event_type.startswith("pre_match_injuries"):
@@ -300,10 +361,15 @@ class LLMService:
             "pre_match_standings": self._ctx_standings,
             "live_stats_update": self._ctx_live_stats,
         }
+        # Typ-spezifische Builder zuerst – live_stats_update trägt home_team
+        # ebenfalls im Payload und landete sonst im Spielkontext
         builder = builders.get(normalized_type)
         if builder:
             return builder(context_data)
 
+        if "home_team" in context_data:
+            return self._ctx_match_info(context_data)
+
         import json
 
         return (
@@ -389,7 +455,7 @@ class LLMService:
     # Provider Implementierungen
     # ──────────────────────────────────────────
 
-    def _generate_mock_text(
+    async def _generate_mock_text(
         self,
         event_type,
         event_detail,
@@ -462,144 +528,90 @@ class LLMService:
         )
         return random.choice(choices)
 
-    def _generate_openrouter_text(
-        self,
-        event_type,
-        event_detail,
-        minute,
-        player_name,
-        assist_name,
-        team_name,
-        style,
-        language,
-        context_data,
-        style_references,
-    ) -> str:
-        prompt = self._build_prompt(
-            event_type,
-            event_detail,
-            minute,
-            player_name,
-            assist_name,
-            team_name,
-            style,
-            language,
-            context_data,
-            style_references,
-        )
-        response = self._client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=200,
-            temperature=0.3,
-        )
-        return response.choices[0].message.content.strip()
-
-    def _generate_openai_text(
-        self,
-        event_type,
-        event_detail,
-        minute,
-        player_name,
-        assist_name,
-        team_name,
-        style,
-        language,
-        context_data,
-        style_references,
-    ) -> str:
-        prompt = self._build_prompt(
-            event_type,
-            event_detail,
-            minute,
-            player_name,
-            assist_name,
-            team_name,
-            style,
-            language,
-            context_data,
-            style_references,
-        )
-        response = self._client.chat.completions.create(
+    async def _complete(self, prompt: str, event_type: str = "comment") -> str:
+        dispatch = {
+            "gemini": self._complete_gemini,
+            "openrouter": self._complete_openai_compatible,
+            "openai": self._complete_openai_compatible,
+            "anthropic": self._complete_anthropic,
+            "simulated": functools.partial(self._complete_simulated, event_type=event_type),
+        }
+        labels = {"provider": self.provider, "model": self.model or ""}
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            text = await dispatch[self.provider](prompt)
+            outcome = "ok"
+            return text
+        except Exception as exc:
+            # SDK-eigene Timeouts (openai.APITimeoutError, …) am Namen erkennen
+            if isinstance(exc, asyncio.TimeoutError) or "Timeout" in type(exc).__name__:
+                outcome = "timeout"
+            raise
+        finally:
+            LLM_LATENCY.observe(time.perf_counter() - started, **labels)
+            LLM_REQUESTS.inc(outcome=outcome, **labels)
+
+    def _record_tokens(
+        self, prompt_tokens: Optional[int], completion_tokens: Optional[int]
+    ) -> None:
+        labels = {"provider": self.provider, "model": self.model or ""}
+        if prompt_tokens is not None:
+            LLM_TOKENS.observe(prompt_tokens, kind="prompt", **labels)
+        if completion_tokens is not None:
+            LLM_TOKENS.observe(completion_tokens, kind="completion", **labels)
+
+    async def _complete_openai_compatible(self, prompt: str) -> str:
+        # OpenAI und OpenRouter sprechen dieselbe Chat-Completions-API
+        response = await self._client.chat.completions.create(
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
-            max_tokens=200,
-            temperature=0.3,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
         )
+        usage = getattr(response, "usage", None)  # OpenRouter liefert nicht immer usage
+        if usage:
+            self._record_tokens(usage.prompt_tokens, usage.completion_tokens)
         return response.choices[0].message.content.strip()
 
-    def _generate_gemini_text(
-        self,
-        event_type,
-        event_detail,
-        minute,
-        player_name,
-        assist_name,
-        team_name,
-        style,
-        language,
-        context_data,
-        style_references,
-    ) -> str:
-        prompt = self._build_prompt(
-            event_type,
-            event_detail,
-            minute,
-            player_name,
-            assist_name,
-            team_name,
-            style,
-            language,
-            context_data,
-            style_references,
-        )
-        response = self._client.models.generate_content(
-            model=self.model, contents=prompt
+    async def _complete_gemini(self, prompt: str) -> str:
+        response = await asyncio.wait_for(
+            self._client.aio.models.generate_content(
+                model=self.model, contents=prompt
+            ),
+            timeout=self.timeout,
         )
+        usage = getattr(response, "usage_metadata", None)
+        if usage:
+            self._record_tokens(usage.prompt_token_count, usage.candidates_token_count)
         return response.text.strip()
 
-    def _generate_anthropic_text(
-        self,
-        event_type,
-        event_detail,
-        minute,
-        player_name,
-        assist_name,
-        team_name,
-        style,
-        language,
-        context_data,
-        style_references,
-    ) -> str:
-        prompt = self._build_prompt(
-            event_type,
-            event_detail,
-            minute,
-            player_name,
-            assist_name,
-            team_name,
-            style,
-            language,
-            context_data,
-            style_references,
-        )
-        response = self._client.messages.create(
+    async def _complete_anthropic(self, prompt: str) -> str:
+        response = await self._client.messages.create(
             model=self.model,
-            max_tokens=200,
-            temperature=0.3,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
             messages=[{"role": "user", "content": prompt}],
         )
+        self._record_tokens(response.usage.input_tokens, response.usage.output_tokens)
         return response.content[0].text.strip()
 
+    async def _complete_simulated(self, prompt: str, event_type: str) -> str:
+        response = await self._client.complete(
+            prompt, event_type, max_tokens=self.max_tokens, timeout=self.timeout
+        )
+        self._record_tokens(response.prompt_tokens, response.completion_tokens)
+        return response.text
+
 
 # ──────────────────────────────────────────────
 # Singleton
 # ──────────────────────────────────────────────
 
-from app.core.config import settings
-
 
 def _build_singleton() -> LLMService:
+    if settings.LLM_SIMULATED:
+        return LLMService(provider="simulated")
     candidates = [
         (
             "openrouter",
@@ -634,9 +646,41 @@ llm_service = _build_singleton()
 _provider = llm_service.provider
 _model = llm_service.model
 
+# Override-Services (Evaluation) werden pro (provider, model) wiederverwendet,
+# damit jeder Provider seinen eigenen Connection-Pool behält.
+_override_services: dict[tuple[str, Optional[str]], LLMService] = {}
+
+
+def get_llm_service(
+    provider: Optional[str] = None, model: Optional[str] = None
+) -> LLMService:
+    if not provider or provider == _provider:
+        return llm_service
+    key = (provider, model)
+    service = _override_services.get(key)
+    if service is None:
+        key_map = {
+            "openrouter": getattr(settings, "OPENROUTER_API_KEY", None),
+            "gemini": getattr(settings, "GEMINI_API_KEY", None),
+            "openai": getattr(settings, "OPENAI_API_KEY", None),
+            "anthropic": getattr(settings, "ANTHROPIC_API_KEY", None),
+        }
+        service = LLMService(
+            provider=provider, api_key=key_map.get(provider), model=model
+        )
+        _override_services[key] = service
+    return service
+
+
+async def close_llm_services() -> None:
+    """Schließt alle Provider-Pools – wird im Lifespan von main.py aufgerufen."""
+    for service in (llm_service, *_override_services.values()):
+        await service.aclose()
+    _override_services.clear()
+
 
 # ──────────────────────────────────────────────
-# Async Wrapper (für Router)
+# Async Entry Point (für Router)
 # ──────────────────────────────────────────────
 
 
@@ -655,6 +699,7 @@ async def generate_ticker_text(
     model: Optional[str] = None,
     db=None,
     instance: str = "ef_whitelabel",
+    use_cache: bool = True,
 ) -> tuple[str, str]:
     # Few-Shot Stilreferenzen aus DB holen
     style_references: list[str] = []
@@ -666,16 +711,25 @@ async def generate_ticker_text(
 
             normalized = llm_service._normalize_event_type(event_type)
             league = match_context.get("league") if match_context else None
-            refs = StyleReferenceRepository(db).get_samples(
+            # Mit Cache: Referenzen deterministisch pro Event wählen, damit ein
+            # erneuter Lauf denselben Prompt (und damit einen Cache-Hit) ergibt.
+            rng = (
+                random.Random(
+                    f"{event_type}|{event_detail}|{minute}|{player_name}|{instance}"
+                )
+                if use_cache
+                else None
+            )
+            style_references = StyleReferenceRepository(db).get_samples(
                 event_type=normalized,
                 instance=instance,
                 limit=3,
                 league=league,
+                rng=rng,
             )
-            style_references = [r.text for r in refs]
             logger.debug(
                 "Stilreferenzen geladen: %d für event_type=%s instance=%s league=%s",
-                len(refs),
+                len(style_references),
                 normalized,
                 instance,
                 league,
@@ -689,20 +743,9 @@ async def generate_ticker_text(
     )
 
     # Provider/Model Override (Evaluation)
-    if provider and provider != _provider:
-        key_map = {
-            "openrouter": getattr(settings, "OPENROUTER_API_KEY", None),
-            "gemini": getattr(settings, "GEMINI_API_KEY", None),
-            "openai": getattr(settings, "OPENAI_API_KEY", None),
-            "anthropic": getattr(settings, "ANTHROPIC_API_KEY", None),
-        }
-        active_service = LLMService(
-            provider=provider, api_key=key_map.get(provider), model=model
-        )
-    else:
-        active_service = llm_service
+    active_service = get_llm_service(provider, model)
 
-    text = active_service.generate_ticker_text(
+    text = await active_service.generate_ticker_text(
         event_type=event_type,
         event_detail=event_detail,
         minute=resolved_minute,
@@ -713,6 +756,7 @@ async def generate_ticker_text(
         language=language,
         context_data=context_data,
         style_references=style_references,
+        use_cache=use_cache,
     )
 
     model_used = model or _model or _provider
@@ -0,0 +1,157 @@
+"""
+Simulierter LLM-Provider
+========================
+Provider "simulated" für Last- und Chaos-Tests ohne echte API: antwortet wie
+ein entfernter Provider mit realistischer Latenz und Fehlerbild.
+
+- Latenz = Time-to-first-Token (Lognormal, Median pro Event-Typ)
+  + Prompt-Verarbeitung + Completion-Tokens / Token-Rate
+- Completion-Länge pro Event-Typ (Normalverteilung, gedeckelt auf max_tokens)
+- Fehler-Injektion: Timeouts (hängt bis zum Provider-Timeout), 429 mit
+  Retry-After (greift in generation_engine._retry_after) und 5xx
+- Deterministisch: jeder Call würfelt aus (Seed, Prompt, n-ter Versuch) –
+  dieselben Prompts ergeben dieselben Latenzen und Fehler, unabhängig davon,
+  in welcher Reihenfolge parallele Calls ankommen
+
+Aktiviert über LLM_SIMULATED=true (Singleton) oder provider="simulated"
+(Override pro Request); Parameter unter LLM_SIMULATED_* in core/config.py.
+"""
+
+import asyncio
+import hashlib
+import math
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+# grobe Faustregel für deutsche Texte
+_CHARS_PER_TOKEN = 4
+
+_FILLER = (
+    "Ball Flanke Strafraum Abschluss Keeper Pfosten Konter Pressing Zweikampf "
+    "Ecke Freistoß Tempo Mittelfeld Abwehr Chance Tribüne Fans Druck Spielzug"
+).split()
+
+
+class SimulatedStatusError(Exception):
+    """HTTP-Fehler des simulierten Providers (429/5xx) inkl. Response für Retry-After."""
+
+    def __init__(self, status_code: int, retry_after: Optional[float] = None) -> None:
+        super().__init__(f"Simulierter Provider: HTTP {status_code}")
+        self.status_code = status_code
+        headers = {"retry-after": f"{retry_after:g}"} if retry_after is not None else {}
+        self.response = httpx.Response(status_code, headers=headers)
+
+
+@dataclass
+class SimulatedCompletion:
+    text: str
+    prompt_tokens: int
+    completion_tokens: int
+
+
+class SimulatedLLM:
+    def __init__(
+        self,
+        seed: int,
+        latency_ms: dict[str, float],
+        latency_sigma: float,
+        completion_tokens: dict[str, float],
+        tokens_per_second: float,
+        prompt_tokens_per_second: float,
+        timeout_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        server_error_rate: float = 0.0,
+        retry_after: float = 1.0,
+    ) -> None:
+        self.seed = seed
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.completion_tokens = completion_tokens
+        self.tokens_per_second = tokens_per_second
+        self.prompt_tokens_per_second = prompt_tokens_per_second
+        self.timeout_rate = timeout_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.server_error_rate = server_error_rate
+        self.retry_after = retry_after
+        # Versuche pro Prompt – Retries würfeln neu, bleiben aber reproduzierbar
+        self._attempts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "SimulatedLLM":
+        return cls(
+            seed=settings.LLM_SIMULATED_SEED,
+            latency_ms=settings.LLM_SIMULATED_LATENCY_MS,
+            latency_sigma=settings.LLM_SIMULATED_LATENCY_SIGMA,
+            completion_tokens=settings.LLM_SIMULATED_COMPLETION_TOKENS,
+            tokens_per_second=settings.LLM_SIMULATED_TOKENS_PER_SECOND,
+            prompt_tokens_per_second=settings.LLM_SIMULATED_PROMPT_TOKENS_PER_SECOND,
+            timeout_rate=settings.LLM_SIMULATED_TIMEOUT_RATE,
+            rate_limit_rate=settings.LLM_SIMULATED_RATE_LIMIT_RATE,
+            server_error_rate=settings.LLM_SIMULATED_SERVER_ERROR_RATE,
+            retry_after=settings.LLM_SIMULATED_RETRY_AFTER_SECONDS,
+        )
+
+    def _rng(self, prompt: str) -> random.Random:
+        digest = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+        with self._lock:
+            self._attempts[digest] += 1
+            attempt = self._attempts[digest]
+        return random.Random(f"{self.seed}|{digest}|{attempt}")
+
+    def _profile(self, table: dict[str, float], event_type: str) -> float:
+        return table.get(event_type, table["default"])
+
+    async def complete(
+        self, prompt: str, event_type: str, max_tokens: int, timeout: float
+    ) -> SimulatedCompletion:
+        rng = self._rng(prompt)
+
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            # Rate-Limit kommt sofort zurück, noch vor der Generierung
+            await asyncio.sleep(rng.uniform(0.02, 0.08))
+            raise SimulatedStatusError(429, retry_after=self.retry_after)
+        roll -= self.rate_limit_rate
+        if roll < self.server_error_rate:
+            await asyncio.sleep(rng.uniform(0.05, 0.5))
+            raise SimulatedStatusError(rng.choice((500, 502, 503)))
+        roll -= self.server_error_rate
+        if roll < self.timeout_rate:
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError()
+
+        prompt_tokens = max(1, len(prompt) // _CHARS_PER_TOKEN)
+        mean_tokens = self._profile(self.completion_tokens, event_type)
+        completion_tokens = min(
+            max_tokens, max(8, round(rng.gauss(mean_tokens, mean_tokens * 0.25)))
+        )
+        first_token = (
+            self._profile(self.latency_ms, event_type)
+            / 1000
+            * math.exp(rng.gauss(0, self.latency_sigma))
+        )
+        latency = (
+            first_token
+            + prompt_tokens / self.prompt_tokens_per_second
+            + completion_tokens / self.tokens_per_second
+        )
+        if latency > timeout:
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError()
+        await asyncio.sleep(latency)
+
+        words = completion_tokens * _CHARS_PER_TOKEN // 7 + 1
+        text = " ".join(rng.choice(_FILLER) for _ in range(words))
+        return SimulatedCompletion(
+            text=f"[simuliert] {text}.",
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
@@ -0,0 +1,208 @@
+"""
+Reference Cache
+===============
+Read-Through-Cache für Stammdaten-Endpunkte (Länder, Teams pro Land,
+Wettbewerbe, Saisons, Spieltage).
+
+Diese Daten ändern sich praktisch nur durch Imports, werden aber bei jedem
+Öffnen des Match-Selektors neu angefragt. Der Cache hält die fertig
+serialisierte JSON-Antwort pro (Scope, Schlüssel) samt ETag (Hash des
+Inhalts) – ein Treffer kostet weder Datenbank noch Serialisierung, ein
+passendes If-None-Match wird mit 304 beantwortet.
+
+Invalidierung pro Scope:
+- Schreib-Routen (countries, teams, competitions, seasons, Zuordnungen,
+  matches) rufen invalidate() mit den betroffenen Scopes auf
+- die n8n-Import-Workflows (01–03) schreiben direkt in Postgres und rufen am
+  Ende POST /reference-cache/invalidate auf
+- Invalidierungen laufen über den Broadcast-Bus an alle Worker
+- REFERENCE_CACHE_TTL_SECONDS als Sicherheitsnetz für Schreibzugriffe an
+  allen anderen Wegen vorbei
+
+Jeder Scope hat eine Generation; ein Ladevorgang, der während einer
+Invalidierung lief, speichert sein (evtl. veraltetes) Ergebnis nicht.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Any, Callable, Hashable, Optional
+
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+
+from app.core.broadcast import Subscription, broadcast, log_publish_errors
+from app.core.config import settings
+from app.utils.http import etag_matches
+
+logger = logging.getLogger(__name__)
+
+# Scopes und was sie abdecken
+SCOPES = {
+    "countries": "Länder (GET /countries, /teams/countries)",
+    "teams": "Teams pro Land (GET /teams/by-country/{country})",
+    "competitions": "Wettbewerbe (GET /competitions, /teams/{id}/competitions)",
+    "seasons": "Saisons (GET /seasons)",
+    "matchdays": "Spieltage (GET /teams/{id}/competitions/{id}/matchdays)",
+}
+
+
+class _Entry:
+    __slots__ = ("body", "etag", "expires")
+
+    def __init__(self, body: bytes, etag: str, expires: float) -> None:
+        self.body = body
+        self.etag = etag
+        self.expires = expires
+
+
+class ReferenceCache:
+    CHANNEL = "reference"
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple[str, Hashable], _Entry] = {}
+        self._generation: Counter[str] = Counter()
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+        self._not_modified: Counter[str] = Counter()
+        self._invalidations: Counter[str] = Counter()
+        # Routen laufen im Threadpool, Bus-Invalidierungen im Event-Loop
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._publishing: set[asyncio.Task] = set()
+        # eigene Meldungen kommen über den Bus zurück und werden übersprungen
+        self._origin = uuid.uuid4().hex
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        subscription = broadcast.subscribe(self.CHANNEL)
+        self._consumer = asyncio.create_task(self._consume(subscription))
+
+    async def stop(self) -> None:
+        if self._consumer:
+            self._consumer.cancel()
+            self._consumer = None
+
+    # ──────────────────────────────────────────
+    # Lesen
+    # ──────────────────────────────────────────
+
+    def respond(
+        self,
+        request: Request,
+        scope: str,
+        key: Hashable,
+        loader: Callable[[], Any],
+    ) -> Response:
+        """
+        JSON-Response aus dem Cache (oder via loader laden und ablegen).
+        loader liefert Pydantic-Modelle / Listen davon wie die Route selbst.
+        """
+        entry = self._get(scope, key)
+        if entry is None:
+            entry = self._load(scope, key, loader)
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            self._not_modified[scope] += 1
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(
+            content=entry.body, media_type="application/json", headers=headers
+        )
+
+    def _get(self, scope: str, key: Hashable) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get((scope, key))
+            if entry is not None and entry.expires > time.monotonic():
+                self._hits[scope] += 1
+                return entry
+        return None
+
+    def _load(self, scope: str, key: Hashable, loader: Callable[[], Any]) -> _Entry:
+        with self._lock:
+            self._misses[scope] += 1
+            generation = self._generation[scope]
+        body = json.dumps(
+            jsonable_encoder(loader()), ensure_ascii=False, separators=(",", ":")
+        ).encode()
+        entry = _Entry(
+            body=body,
+            etag=f'W/"{hashlib.sha1(body).hexdigest()}"',
+            expires=time.monotonic() + self.ttl_seconds,
+        )
+        with self._lock:
+            if self._generation[scope] == generation:
+                self._entries[(scope, key)] = entry
+        return entry
+
+    # ──────────────────────────────────────────
+    # Invalidierung
+    # ──────────────────────────────────────────
+
+    def invalidate(self, *scopes: str) -> None:
+        """Scopes lokal leeren und an die anderen Worker melden (sync + async)."""
+        scopes = tuple(scopes) or tuple(SCOPES)
+        self._invalidate_local(scopes)
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        message = json.dumps({"origin": self._origin, "scopes": list(scopes)})
+        loop.call_soon_threadsafe(self._schedule_publish, message)
+
+    def _schedule_publish(self, message: str) -> None:
+        task = self._loop.create_task(broadcast.publish(self.CHANNEL, message))
+        self._publishing.add(task)
+        task.add_done_callback(self._publishing.discard)
+        task.add_done_callback(log_publish_errors)
+
+    def _invalidate_local(self, scopes: tuple[str, ...]) -> None:
+        with self._lock:
+            for scope in scopes:
+                self._generation[scope] += 1
+                self._invalidations[scope] += 1
+            for cache_key in [k for k in self._entries if k[0] in scopes]:
+                del self._entries[cache_key]
+        logger.debug("Reference-Cache invalidiert: %s", ", ".join(scopes))
+
+    async def _consume(self, subscription: Subscription) -> None:
+        try:
+            while True:
+                raw = await subscription.get()
+                if subscription.overflowed:
+                    # Invalidierungen verloren → vorsichtshalber alles leeren
+                    subscription.overflowed = False
+                    self._invalidate_local(tuple(SCOPES))
+                    continue
+                data = json.loads(raw)
+                if data.get("origin") == self._origin:
+                    continue
+                scopes = data.get("scopes") or []
+                self._invalidate_local(tuple(s for s in scopes if s in SCOPES))
+        finally:
+            subscription.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = Counter(scope for scope, _ in self._entries)
+        result = {}
+        for scope in SCOPES:
+            hits, misses = self._hits[scope], self._misses[scope]
+            result[scope] = {
+                "entries": entries[scope],
+                "hits": hits,
+                "misses": misses,
+                "not_modified": self._not_modified[scope],
+                "invalidations": self._invalidations[scope],
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+            }
+        return result
+
+
+# Singleton – Bus-Abo wird im lifespan (main.py) gestartet
+reference_cache = ReferenceCache(ttl_seconds=settings.REFERENCE_CACHE_TTL_SECONDS)
@@ -0,0 +1,165 @@
+"""
+Score Tracker
+=============
+Laufender Spielstand pro Match als Zeitleiste der Tore.
+
+Statt pro generiertem Event alle Tore neu zu laden und deren description zu
+parsen, hält der Tracker pro Match die Tore (einmal geparst) und daraus
+sortierte Präfixsummen – "Stand bei Event X" ist eine binäre Suche.
+
+Aktualisierung inkrementell über EventRepository (upsert, update, delete).
+Schreibzugriffe außerhalb des Repositories fängt eine TTL ab, nach der die
+Zeitleiste eines Matches neu aus der DB geladen wird.
+"""
+
+import bisect
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+
+from app.core.config import settings
+
+GOAL_TYPES = ("goal", "own_goal")
+
+
+@dataclass(frozen=True)
+class _Goal:
+    event_id: int
+    position: Optional[int]
+    team_id: Optional[int]
+    own_goal: bool
+
+
+@dataclass
+class _Timeline:
+    goals: dict[int, _Goal] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.monotonic)
+    # Abgeleitete Arrays, lazy neu berechnet sobald sich goals/Teams ändern
+    _teams: Optional[tuple[Optional[int], Optional[int]]] = None
+    _by_position: tuple[list[int], list[int], list[int]] = ([], [], [])
+    _by_id: tuple[list[int], list[int], list[int]] = ([], [], [])
+
+    def mark_dirty(self) -> None:
+        self._teams = None
+
+    def _build(self, keyed: list[tuple[int, _Goal]], home_ext, away_ext):
+        keys: list[int] = []
+        home: list[int] = []
+        away: list[int] = []
+        h = a = 0
+        for key, g in sorted(keyed, key=lambda kv: kv[0]):
+            scorer_home = g.team_id == home_ext
+            scorer_away = g.team_id == away_ext
+            if g.own_goal:
+                scorer_home, scorer_away = scorer_away, scorer_home
+            h += scorer_home
+            a += scorer_away
+            keys.append(key)
+            home.append(h)
+            away.append(a)
+        return keys, home, away
+
+    def score(self, home_ext, away_ext, position, event_id) -> str:
+        if self._teams != (home_ext, away_ext):
+            goals = list(self.goals.values())
+            self._by_position = self._build(
+                [(g.position, g) for g in goals if g.position is not None],
+                home_ext,
+                away_ext,
+            )
+            self._by_id = self._build(
+                [(g.event_id, g) for g in goals], home_ext, away_ext
+            )
+            self._teams = (home_ext, away_ext)
+
+        # Gleiche Semantik wie vorher: mit position → nach position (Tore
+        # ohne position zählen nicht), sonst nach id
+        if position is not None:
+            keys, home, away = self._by_position
+            cutoff = position
+        else:
+            keys, home, away = self._by_id
+            cutoff = event_id
+        i = bisect.bisect_right(keys, cutoff)
+        if i == 0:
+            return "0:0"
+        return f"{home[i - 1]}:{away[i - 1]}"
+
+
+def _parse_goal(event) -> Optional[_Goal]:
+    if event.event_type not in GOAL_TYPES:
+        return None
+    try:
+        d = json.loads(event.description or "{}")
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(d, dict):
+        return None
+    return _Goal(
+        event_id=event.id,
+        position=event.position,
+        team_id=d.get("team_id"),
+        own_goal=event.event_type == "own_goal",
+    )
+
+
+class ScoreTracker:
+    def __init__(self, ttl_seconds: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._timelines: dict[int, _Timeline] = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, match_id: int) -> Optional[_Timeline]:
+        tl = self._timelines.get(match_id)
+        if tl and time.monotonic() - tl.loaded_at < self.ttl_seconds:
+            return tl
+        return None
+
+    def score_at(
+        self,
+        match_id: int,
+        home_ext: Optional[int],
+        away_ext: Optional[int],
+        position: Optional[int],
+        event_id: int,
+        loader: Callable[[int], Iterable],
+    ) -> str:
+        """Spielstand "H:A" inklusive des Events an position bzw. event_id."""
+        with self._lock:
+            tl = self._fresh(match_id)
+            if tl is None:
+                tl = _Timeline()
+                for ev in loader(match_id):
+                    goal = _parse_goal(ev)
+                    if goal:
+                        tl.goals[goal.event_id] = goal
+                self._timelines[match_id] = tl
+            return tl.score(home_ext, away_ext, position, event_id)
+
+    def apply(self, event) -> None:
+        """Neues oder geändertes Event einarbeiten (nur wenn Match geladen)."""
+        with self._lock:
+            tl = self._timelines.get(event.match_id)
+            if tl is None:
+                return
+            goal = _parse_goal(event)
+            if goal:
+                tl.goals[event.id] = goal
+            elif tl.goals.pop(event.id, None) is None:
+                return
+            tl.mark_dirty()
+
+    def remove(self, match_id: int, event_id: int) -> None:
+        with self._lock:
+            tl = self._timelines.get(match_id)
+            if tl and tl.goals.pop(event_id, None) is not None:
+                tl.mark_dirty()
+
+    def forget(self, match_id: int) -> None:
+        with self._lock:
+            self._timelines.pop(match_id, None)
+
+
+score_tracker = ScoreTracker(ttl_seconds=settings.SCORE_TRACKER_TTL_SECONDS)
@@ -0,0 +1,104 @@
+"""
+Style-Reference Index
+=====================
+Vorgeladener In-Memory-Index der Few-Shot-Stilreferenzen.
+
+Ersetzt `ORDER BY random() LIMIT n` pro Generierung: Die Tabelle wird einmal
+geladen und nach (instance, event_type, league) sowie (instance, event_type)
+gebucketed. Sampling ist dann random.sample auf einer Liste – O(limit).
+Mit geseedetem rng ist die Auswahl deterministisch (Buckets sind sortiert).
+
+Aktualisierung: TTL (STYLE_REFERENCE_INDEX_TTL_SECONDS) für Änderungen aus
+anderen Workern, sofortige Invalidierung bei bulk_insert im eigenen Prozess.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# (instance, event_type, league, text)
+IndexRow = tuple[str, str, Optional[str], str]
+
+
+class StyleReferenceIndex:
+    def __init__(self, ttl_seconds: int, min_text_length: int = 20) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.min_text_length = min_text_length
+        self._by_league: dict[tuple[str, str, str], list[str]] = {}
+        self._by_type: dict[tuple[str, str], list[str]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    def _ensure_loaded(self, loader: Callable[[int], Iterable[IndexRow]]) -> None:
+        if self._is_fresh():
+            return
+        with self._lock:
+            if self._is_fresh():
+                return
+            by_league: dict[tuple[str, str, str], list[str]] = {}
+            by_type: dict[tuple[str, str], list[str]] = {}
+            count = 0
+            for instance, event_type, league, text in loader(self.min_text_length):
+                by_type.setdefault((instance, event_type), []).append(text)
+                if league:
+                    by_league.setdefault((instance, event_type, league), []).append(
+                        text
+                    )
+                count += 1
+            # Feste Reihenfolge unabhängig von der Zeilenreihenfolge der DB: ein
+            # geseedetes rng wählt so nach jedem Reload und in jedem Worker
+            # dieselben Texte (→ gleicher Prompt, LLM-Cache-Hit)
+            for bucket in (*by_league.values(), *by_type.values()):
+                bucket.sort()
+            # Referenzen atomar austauschen – laufende Samples sehen alt oder neu
+            self._by_league, self._by_type = by_league, by_type
+            self._loaded_at = time.monotonic()
+            logger.info(
+                "Style-Reference-Index geladen: %d Texte in %d Buckets",
+                count,
+                len(by_type),
+            )
+
+    def sample(
+        self,
+        loader: Callable[[int], Iterable[IndexRow]],
+        event_type: str,
+        instance: str = "ef_whitelabel",
+        limit: int = 3,
+        league: Optional[str] = None,
+        rng: Optional[random.Random] = None,
+    ) -> list[str]:
+        """
+        Zufällige Stilreferenzen für einen event_type.
+
+        Falls league angegeben und genug Treffer vorhanden → league-spezifisch.
+        Fallback: ohne league-Filter (alle Ligen).
+        """
+        self._ensure_loaded(loader)
+        rng = rng or random
+        if league:
+            bucket = self._by_league.get((instance, event_type, league), [])
+            if len(bucket) >= limit:
+                return rng.sample(bucket, limit)
+        bucket = self._by_type.get((instance, event_type), [])
+        return rng.sample(bucket, min(limit, len(bucket)))
+
+
+style_reference_index = StyleReferenceIndex(
+    ttl_seconds=settings.STYLE_REFERENCE_INDEX_TTL_SECONDS,
+)
@@ -0,0 +1,385 @@
+"""
+Thumbnail Cache
+===============
+Lokaler Cache für externe Vorschaubilder (Instagram, ScorePlay) unter
+/static/thumbnails.
+
+- ein gemeinsamer, gepoolter httpx.AsyncClient statt eines Clients pro Aufruf
+- Download wird in Chunks auf die Platte gestreamt (kein Puffern im Speicher)
+- Dateiname = SHA-256 des Inhalts → identische Bilder liegen nur einmal vor
+- gleichzeitige Anfragen für dieselbe URL teilen sich einen Download
+- prefetch() lädt einen ganzen Batch parallel (begrenzt per Semaphore)
+
+Öffentliche URLs werden aus PUBLIC_BASE_URL gebaut statt fest localhost und
+zeigen auf GET /api/v1/thumbnails/{filename} (api/v1/thumbnails.py).
+
+Varianten: zu jedem Original werden kleinere JPEGs (small/medium) erzeugt –
+beim Ingest oder beim ersten Abruf, im Thread-Pool (Pillow gibt beim
+Dekodieren/Skalieren den GIL frei). Ohne Pillow wird das Original geliefert.
+
+Quota: der Store hält sich unter THUMBNAIL_DISK_QUOTA_MB. Bei Überschreitung
+werden die am längsten nicht abgerufenen Varianten gelöscht (LRU über mtime,
+wird beim Abruf aktualisiert) – sie sind jederzeit aus dem Original neu
+erzeugbar. Originale werden nie verdrängt: media_clips.thumbnail_url zeigt
+nach dem Caching auf sie, die Upstream-URL ist dann überschrieben. Reichen
+die Originale allein über die Quota, wird nur gewarnt.
+Verzeichnis-Scan und Löschen laufen im Thread, nicht im Event-Loop.
+"""
+
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Hashable, Optional
+
+import anyio
+import httpx
+
+from app.core.config import settings
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow optional – dann nur Originale
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+THUMBNAILS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "static",
+    "thumbnails",
+)
+
+_CHUNK_SIZE = 64 * 1024
+_DEFAULT_EXT = ".jpg"
+
+# Name → maximale Kantenlänge in Pixeln
+VARIANTS = {"small": 160, "medium": 480}
+
+# Originale (Content-Hash, ältere Dateien noch nach vid benannt)
+FILENAME_RE = re.compile(r"^[A-Za-z0-9_-]+\.(jpg|jpeg|png|webp|gif)$")
+
+# LRU-Zeitstempel höchstens so oft auf die Platte schreiben
+_TOUCH_INTERVAL = 3600.0
+
+
+class ThumbnailTooLarge(Exception):
+    pass
+
+
+def _render_variant(src: str, dst: str, max_edge: int) -> None:
+    """Skaliert src auf max_edge und speichert als JPEG (läuft im Thread-Pool)."""
+    with Image.open(src) as im:
+        im = ImageOps.exif_transpose(im)
+        im.thumbnail((max_edge, max_edge))
+        if im.mode not in ("RGB", "L"):
+            im = im.convert("RGB")
+        tmp = f"{dst}.{uuid.uuid4().hex}.part"
+        im.save(tmp, "JPEG", quality=80, optimize=True, progressive=True)
+    os.replace(tmp, dst)
+
+
+def _scan(directory: str) -> list[tuple[float, str, int]]:
+    """(mtime, Pfad, Größe) aller Dateien des Stores, älteste zuerst."""
+    found: list[tuple[float, str, int]] = []
+    for root, _, names in os.walk(directory):
+        for name in names:
+            if name.endswith(".part"):
+                continue
+            path = os.path.join(root, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            found.append((st.st_mtime, path, st.st_size))
+    found.sort()
+    return found
+
+
+def _remove_files(paths: list[str]) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class DiskQuota:
+    """LRU-Buchhaltung über alle Dateien des Stores; verdrängt nur Varianten."""
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        # Pfad → (Größe, letzter persistierter Zugriff); älteste zuerst
+        self._files: Optional[OrderedDict[str, tuple[int, float]]] = None
+        self._load_lock = asyncio.Lock()
+        self._warned_full = False
+
+    async def _load(self) -> OrderedDict[str, tuple[int, float]]:
+        if self._files is None:
+            async with self._load_lock:
+                if self._files is None:
+                    found = await asyncio.to_thread(_scan, self.directory)
+                    self._files = OrderedDict((p, (size, m)) for m, p, size in found)
+                    self.total_bytes = sum(size for _, _, size in found)
+        return self._files
+
+    async def touch(self, path: str) -> None:
+        files = await self._load()
+        if path not in files:
+            return
+        size, persisted = files[path]
+        files.move_to_end(path)
+        now = time.time()
+        if now - persisted > _TOUCH_INTERVAL:
+            # mtime als LRU-Zeitstempel, damit die Reihenfolge einen Neustart übersteht
+            os.utime(path, (now, now))
+            files[path] = (size, now)
+
+    async def add(self, path: str) -> None:
+        files = await self._load()
+        size = os.path.getsize(path)
+        if path in files:
+            self.total_bytes -= files[path][0]
+        files[path] = (size, time.time())
+        files.move_to_end(path)
+        self.total_bytes += size
+        victims = self._select_victims(keep=path)
+        if victims:
+            await asyncio.to_thread(_remove_files, victims)
+
+    def discard(self, path: str) -> None:
+        entry = (self._files or {}).pop(path, None)
+        if entry:
+            self.total_bytes -= entry[0]
+
+    def _select_victims(self, keep: str) -> list[str]:
+        """Nimmt die LRU-Varianten aus der Buchhaltung; Löschen macht der Aufrufer."""
+        if self.total_bytes <= self.max_bytes:
+            self._warned_full = False
+            return []
+        # Auf 90 % herunter, damit nicht jeder Schreibvorgang evicted
+        target = int(self.max_bytes * 0.9)
+        originals_dir = os.path.normpath(self.directory)
+        victims: list[str] = []
+        for path in list(self._files):
+            if self.total_bytes <= target:
+                break
+            if path == keep or os.path.dirname(path) == originals_dir:
+                continue
+            self.discard(path)
+            victims.append(path)
+        if self.total_bytes > self.max_bytes and not self._warned_full:
+            self._warned_full = True
+            logger.warning(
+                "Thumbnail-Quota: Originale allein belegen %d MB (Quota %d MB) – "
+                "THUMBNAIL_DISK_QUOTA_MB erhöhen",
+                self.total_bytes // (1024 * 1024),
+                self.max_bytes // (1024 * 1024),
+            )
+        return victims
+
+
+class ThumbnailCache:
+    def __init__(
+        self,
+        directory: str,
+        public_base_url: str,
+        max_concurrency: int,
+        max_bytes: int,
+        quota_bytes: int,
+        variant_workers: int,
+        timeout: float = 15.0,
+    ) -> None:
+        self.directory = directory
+        self.public_base_url = public_base_url.rstrip("/")
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.quota = DiskQuota(directory, quota_bytes)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=variant_workers, thread_name_prefix="thumb-variant"
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def public_url(self, filename: str, size: Optional[str] = None) -> str:
+        url = f"{self.public_base_url}/api/v1/thumbnails/{filename}"
+        return f"{url}?size={size}" if size else url
+
+    def variant_url(self, url: Optional[str], size: str) -> Optional[str]:
+        """URL der Variante für eine im Cache liegende thumbnail_url, sonst None."""
+        if not url or Image is None:
+            return None
+        for prefix in (
+            f"{self.public_base_url}/api/v1/thumbnails/",
+            f"{self.public_base_url}/static/thumbnails/",
+        ):
+            if url.startswith(prefix):
+                filename = url[len(prefix) :].split("?", 1)[0]
+                if FILENAME_RE.match(filename):
+                    return self.public_url(filename, size)
+        return None
+
+    async def _once(self, key: str, make: Callable[[], Awaitable[str]]) -> str:
+        """Gleichzeitige Aufrufe mit gleichem key teilen sich ein Ergebnis."""
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await make()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Nicht abgeholte Exceptions nicht als "never retrieved" loggen
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def fetch(self, url: str, referer: Optional[str] = None) -> str:
+        """
+        Lädt url in den Cache und gibt den Dateinamen zurück.
+        Läuft für dieselbe URL bereits ein Download, wird dessen Ergebnis geteilt.
+        """
+
+        async def _run() -> str:
+            async with self._semaphore:
+                return await self._download(url, referer)
+
+        return await self._once(f"url:{url}", _run)
+
+    def original_path(self, filename: str) -> Optional[str]:
+        if not FILENAME_RE.match(filename):
+            return None
+        path = os.path.join(self.directory, filename)
+        return path if os.path.exists(path) else None
+
+    async def resolve(self, filename: str, size: Optional[str] = None) -> Optional[str]:
+        """
+        Pfad des Originals bzw. der Variante (wird bei Bedarf erzeugt).
+        None, wenn das Original nicht (mehr) im Cache liegt.
+        """
+        src = self.original_path(filename)
+        if src is None:
+            return None
+        if not size or size not in VARIANTS or Image is None:
+            await self.quota.touch(src)
+            return src
+
+        stem = os.path.splitext(filename)[0]
+        dst = os.path.join(self.directory, size, f"{stem}.jpg")
+        if os.path.exists(dst):
+            await self.quota.touch(dst)
+            return dst
+
+        async def _run() -> str:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(
+                    self._executor, _render_variant, src, dst, VARIANTS[size]
+                )
+            except Exception:
+                logger.warning(
+                    "Variante %s für %s fehlgeschlagen", size, filename, exc_info=True
+                )
+                return src
+            await self.quota.add(dst)
+            return dst
+
+        return await self._once(f"variant:{size}:{filename}", _run)
+
+    async def ensure_variants(self, filename: str) -> None:
+        """Alle Varianten beim Ingest vorab erzeugen."""
+        if Image is None:
+            return
+        await asyncio.gather(*(self.resolve(filename, size) for size in VARIANTS))
+
+    async def _download(self, url: str, referer: Optional[str]) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = os.path.join(self.directory, f".{uuid.uuid4().hex}.part")
+        digest = hashlib.sha256()
+        size = 0
+        headers = {"Referer": referer} if referer else {}
+        try:
+            async with self._get_client().stream("GET", url, headers=headers) as resp:
+                resp.raise_for_status()
+                content_type = resp.headers.get("content-type", "").split(";")[0]
+                async with await anyio.open_file(tmp_path, "wb") as f:
+                    async for chunk in resp.aiter_bytes(_CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > self.max_bytes:
+                            raise ThumbnailTooLarge(
+                                f"Bild größer als {self.max_bytes} Bytes: {url}"
+                            )
+                        digest.update(chunk)
+                        await f.write(chunk)
+
+            ext = mimetypes.guess_extension(content_type) or _DEFAULT_EXT
+            if ext == ".jpe":
+                ext = ".jpg"
+            filename = f"{digest.hexdigest()}{ext}"
+            final_path = os.path.join(self.directory, filename)
+            if os.path.exists(final_path):
+                os.remove(tmp_path)
+                await self.quota.touch(final_path)
+            else:
+                os.replace(tmp_path, final_path)
+                await self.quota.add(final_path)
+            logger.debug("Thumbnail gecacht: %s → %s (%d Bytes)", url, filename, size)
+            return filename
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    async def prefetch(
+        self, items: dict[Hashable, str], referer: Optional[str] = None
+    ) -> dict[Hashable, str | Exception]:
+        """Lädt alle URLs parallel; Ergebnis pro Schlüssel: Dateiname oder Exception."""
+        keys = list(items)
+        outcomes = await asyncio.gather(
+            *(self.fetch(items[k], referer) for k in keys), return_exceptions=True
+        )
+        return dict(zip(keys, outcomes))
+
+
+# Singleton – Client wird im lifespan (main.py) geschlossen
+thumbnail_cache = ThumbnailCache(
+    directory=THUMBNAILS_DIR,
+    public_base_url=settings.PUBLIC_BASE_URL,
+    max_concurrency=settings.THUMBNAIL_MAX_CONCURRENCY,
+    max_bytes=settings.THUMBNAIL_MAX_BYTES,
+    quota_bytes=settings.THUMBNAIL_DISK_QUOTA_MB * 1024 * 1024,
+    variant_workers=settings.THUMBNAIL_VARIANT_WORKERS,
+)
@@ -0,0 +1,210 @@
+"""
+Ticker Feed
+===========
+Push-Kanal pro Match für Ticker-Einträge (WS /ws/ticker/{match_id}).
+
+Statt nach jeder Änderung die komplette Liste neu zu laden, erhalten Clients
+Deltas (created, published, rejected, updated, deleted) mit fortlaufender
+Sequenznummer pro Match. Ein Ringpuffer der letzten Nachrichten erlaubt
+Resume nach Reconnect (?since=<seq>&epoch=<epoch>); ist die Lücke nicht mehr
+im Puffer oder der Server neu gestartet (anderer epoch), bekommt der Client
+ein "resync" und lädt die Liste einmal komplett.
+
+Deltas laufen über den Broadcast-Bus (core/broadcast), damit Änderungen auf
+einem Worker auch die Clients der anderen Worker erreichen. Sequenznummern
+vergibt jeder Worker beim Empfang vom Bus; epoch ist pro Worker, ein Client,
+der nach Reconnect an einem anderen Worker landet, bekommt ein "resync".
+
+Versand pro Client über eigene Ausgangs-Queues (core/websocket): Deltas
+werden nicht zusammengefasst, damit jeder Client die Sequenz lückenlos und in
+Reihenfolge sieht; läuft die Queue eines Clients über, bekommt nur dieser
+Client ein "resync".
+
+publish() ist synchron und thread-safe, damit auch die sync-Routen (laufen im
+Threadpool) Deltas auslösen können.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import deque
+from typing import Optional
+
+from fastapi import WebSocket
+
+from app.core.broadcast import Subscription, broadcast, log_publish_errors
+from app.core.websocket import ClientConnection, ConnectionGroup, encode
+from app.models.ticker_entry import TickerEntry
+from app.schemas.ticker_entry import TickerEntryResponse
+
+logger = logging.getLogger(__name__)
+
+TICKER_OPS = ("created", "published", "rejected", "updated", "deleted")
+
+
+class TickerFeedManager:
+    """Hält WebSocket-Verbindungen pro Match und verteilt Ticker-Deltas."""
+
+    CHANNEL = "ticker"
+
+    def __init__(self, history_size: int = 500) -> None:
+        # Neu pro Prozessstart – Sequenzen aus einem alten Prozess sind ungültig
+        self.epoch = uuid.uuid4().hex[:12]
+        self.history_size = history_size
+        self.active_connections: dict[int, ConnectionGroup] = {}
+        self._history: dict[int, deque[dict]] = {}
+        self._seq: dict[int, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._publishing: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        subscription = broadcast.subscribe(self.CHANNEL)
+        self._consumer = asyncio.create_task(self._consume(subscription))
+
+    async def stop(self) -> None:
+        if self._consumer:
+            self._consumer.cancel()
+            self._consumer = None
+
+    def current_seq(self, match_id: int) -> int:
+        return self._seq.get(match_id, 0)
+
+    async def connect(self, websocket: WebSocket, match_id: int) -> ClientConnection:
+        group = self.active_connections.get(match_id)
+        if group is None:
+            group = ConnectionGroup(
+                "ticker",
+                overflow_message=encode({"type": "resync", "match_id": match_id})
+            )
+            self.active_connections[match_id] = group
+        client = await group.connect(websocket)
+        logger.info(
+            "Ticker WS client connected (match_id=%s). Active: %d",
+            match_id,
+            len(group),
+        )
+        return client
+
+    async def disconnect(self, client: ClientConnection, match_id: int) -> None:
+        group = self.active_connections.get(match_id)
+        if group is None:
+            return
+        await group.disconnect(client)
+        if not group:
+            self.active_connections.pop(match_id, None)
+        logger.info("Ticker WS client disconnected (match_id=%s).", match_id)
+
+    def replay(
+        self, match_id: int, since: int, epoch: Optional[str]
+    ) -> Optional[list[dict]]:
+        """
+        Nachrichten mit seq > since. None = Lücke nicht mehr abgedeckt,
+        Client muss die Liste komplett neu laden.
+        """
+        if epoch != self.epoch:
+            return None
+        current = self._seq.get(match_id, 0)
+        if since > current:
+            return None
+        if since == current:
+            return []
+        history = self._history.get(match_id)
+        if not history or history[0]["seq"] > since + 1:
+            return None
+        return [m for m in history if m["seq"] > since]
+
+    def publish(self, match_id: int, op: str, entry: TickerEntry | dict) -> None:
+        """Delta in den Kanal des Matches stellen (aus sync- und async-Code)."""
+        payload = (
+            entry
+            if isinstance(entry, dict)
+            else TickerEntryResponse.model_validate(entry).model_dump(mode="json")
+        )
+        message = json.dumps(
+            {"match_id": match_id, "op": op, "entry": payload}, ensure_ascii=False
+        )
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._schedule_publish, message)
+
+    async def notify(self, match_id: int, data: dict) -> None:
+        """
+        Zustandsmeldung ohne Sequenznummer an die Clients des Matches (z.B.
+        {"type": "match_update", ...}). Nicht im Ringpuffer – Clients holen den
+        aktuellen Stand nach Reconnect ohnehin neu; mehrere ungesendete
+        Meldungen gleichen Typs werden zusammengefasst.
+        """
+        await broadcast.publish(
+            self.CHANNEL,
+            json.dumps({"match_id": match_id, "notify": data}, ensure_ascii=False),
+        )
+
+    def _schedule_publish(self, message: str) -> None:
+        # Referenz halten, sonst kann der Task vor dem Lauf eingesammelt werden
+        task = self._loop.create_task(broadcast.publish(self.CHANNEL, message))
+        self._publishing.add(task)
+        task.add_done_callback(self._publishing.discard)
+        task.add_done_callback(log_publish_errors)
+
+    async def _consume(self, subscription: Subscription) -> None:
+        try:
+            while True:
+                raw = await subscription.get()
+                if subscription.overflowed:
+                    self._reset_after_overflow(subscription)
+                delta = json.loads(raw)
+                if "notify" in delta:
+                    notice = delta["notify"]
+                    self.broadcast(
+                        delta["match_id"], notice, coalesce_key=notice.get("type")
+                    )
+                    continue
+                self._dispatch(delta["match_id"], delta["op"], delta["entry"])
+        finally:
+            subscription.close()
+
+    def _reset_after_overflow(self, subscription: Subscription) -> None:
+        # Deltas gingen verloren → Sequenzen sind nicht mehr lückenlos.
+        # Neuer epoch zwingt alle Clients beim nächsten Hello/Resume zum Resync.
+        logger.warning(
+            "Ticker-Feed: Bus-Queue übergelaufen (%d verworfen) – Resync",
+            subscription.dropped,
+        )
+        subscription.overflowed = False
+        self.epoch = uuid.uuid4().hex[:12]
+        self._history.clear()
+        for match_id in list(self.active_connections):
+            self.broadcast(match_id, {"type": "resync", "match_id": match_id})
+
+    def _dispatch(self, match_id: int, op: str, entry: dict) -> None:
+        seq = self._seq.get(match_id, 0) + 1
+        self._seq[match_id] = seq
+        message = {
+            "type": "ticker_delta",
+            "match_id": match_id,
+            "epoch": self.epoch,
+            "seq": seq,
+            "op": op,
+            "entry": entry,
+        }
+        self._history.setdefault(match_id, deque(maxlen=self.history_size)).append(
+            message
+        )
+        # Kein coalesce_key: ein ersetztes Delta hinterließe eine Lücke in seq
+        self.broadcast(match_id, message)
+
+    def broadcast(
+        self, match_id: int, data: dict, coalesce_key: Optional[str] = None
+    ) -> None:
+        """Reiht JSON bei allen Clients des Matches ein (einmal kodiert)."""
+        group = self.active_connections.get(match_id)
+        if group:
+            group.broadcast(data, coalesce_key)
+
+
+# Singleton – wird in main.py gestartet
+ticker_feed = TickerFeedManager()
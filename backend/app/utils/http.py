@@ -0,0 +1,23 @@
+"""
+HTTP-Helfer
+===========
+Conditional Requests (ETag / If-None-Match) für lesende Endpunkte.
+"""
+
+from typing import Optional
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    True, wenn der If-None-Match-Header das ETag enthält (Liste, "*" und
+    schwache Vergleiche "W/…" nach RFC 9110 berücksichtigt).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == wanted
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,174 @@
+"""
+Pagination
+==========
+Seitenweises Blättern für Listen-Endpunkte in zwei Modi:
+
+- Offset (page/pageSize): bisheriger Vertrag, bleibt Standard für alte Clients
+- Keyset (cursor): WHERE (sortkey) > (letzter Wert) statt OFFSET – jede
+  Seite kostet gleich viel, egal wie tief geblättert wird
+
+Der Cursor ist opak (base64url-JSON) und enthält die Sortwerte des letzten
+Eintrags plus eine Signatur der Sortierung. Die Sortierung muss mit einer
+eindeutigen Spalte (id) enden, damit die Reihenfolge stabil ist.
+
+Mit with_total=False entfällt das COUNT(*); has_next_page wird dann über
+einen zusätzlichen Datensatz (LIMIT n+1) bestimmt.
+"""
+
+import base64
+import binascii
+import json
+import math
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import and_, false, or_, true
+from sqlalchemy.orm import Query
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.types import Date, DateTime
+
+# (Spalte, absteigend) – z. B. [(Match.starts_at, True), (Match.id, True)]
+SortKey = Sequence[tuple[InstrumentedAttribute, bool]]
+
+
+@dataclass
+class Page:
+    items: list
+    page_size: int
+    total: Optional[int]
+    page: Optional[int]
+    has_previous_page: bool
+    has_next_page: bool
+    next_cursor: Optional[str]
+
+    @property
+    def page_count(self) -> Optional[int]:
+        if self.total is None:
+            return None
+        return math.ceil(self.total / self.page_size) if self.page_size > 0 else 0
+
+    def meta(self) -> dict:
+        """Felder für die Paginated*Response-Schemas (ohne items)."""
+        return {
+            "total": self.total,
+            "page": self.page,
+            "page_size": self.page_size,
+            "page_count": self.page_count,
+            "has_previous_page": self.has_previous_page,
+            "has_next_page": self.has_next_page,
+            "next_cursor": self.next_cursor,
+        }
+
+
+# ──────────────────────────────────────────
+# Cursor
+# ──────────────────────────────────────────
+
+
+def _signature(order: SortKey) -> str:
+    return ",".join(f"{col.key}{'-' if desc else '+'}" for col, desc in order)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(column: InstrumentedAttribute, value: Any) -> Any:
+    if value is None or not isinstance(value, str):
+        return value
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column.type, Date):
+        return date.fromisoformat(value)
+    return value
+
+
+def encode_cursor(order: SortKey, item: Any) -> str:
+    payload = {
+        "o": _signature(order),
+        "v": [_encode_value(getattr(item, col.key)) for col, _ in order],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(order: SortKey, cursor: str) -> list[Any]:
+    """Sortwerte aus dem Cursor; ValueError bei ungültigem/fremdem Cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = payload["v"]
+        signature = payload["o"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+    if signature != _signature(order) or len(values) != len(order):
+        raise ValueError("Cursor does not match the requested sort order")
+    try:
+        return [_decode_value(col, v) for (col, _), v in zip(order, values)]
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+
+def _after(column: InstrumentedAttribute, desc: bool, value: Any):
+    """Zeilen hinter value in Sortierrichtung (Postgres: NULLS LAST bei ASC, FIRST bei DESC)."""
+    if value is None:
+        return column.isnot(None) if desc else false()
+    if desc:
+        return column < value
+    return or_(column > value, column.is_(None))
+
+
+def _equal(column: InstrumentedAttribute, value: Any):
+    return column.is_(None) if value is None else column == value
+
+
+def keyset_filter(order: SortKey, values: Sequence[Any]):
+    """(a, b, id) > (va, vb, vid) für gemischte Richtungen und NULL-Werte."""
+    clauses = []
+    for i, (column, desc) in enumerate(order):
+        prefix = [_equal(col, v) for (col, _), v in zip(order[:i], values[:i])]
+        clauses.append(and_(true(), *prefix, _after(column, desc, values[i])))
+    return or_(*clauses)
+
+
+# ──────────────────────────────────────────
+# Blättern
+# ──────────────────────────────────────────
+
+
+def paginate(
+    query: Query,
+    order: SortKey,
+    page_size: int,
+    page: int = 1,
+    cursor: Optional[str] = None,
+    with_total: bool = True,
+) -> Page:
+    """
+    Eine Seite aus query. Mit cursor wird page ignoriert (Keyset-Modus).
+    next_cursor wird in beiden Modi gesetzt, sodass ein Client nach der
+    ersten Offset-Seite auf Keyset wechseln kann.
+    """
+    total = query.order_by(None).count() if with_total else None
+
+    ordered = query.order_by(*(col.desc() if desc else col.asc() for col, desc in order))
+    if cursor is not None:
+        ordered = ordered.filter(keyset_filter(order, decode_cursor(order, cursor)))
+    else:
+        ordered = ordered.offset((page - 1) * page_size)
+    rows = ordered.limit(page_size + 1).all()
+
+    has_next = len(rows) > page_size
+    items = rows[:page_size]
+    return Page(
+        items=items,
+        page_size=page_size,
+        total=total,
+        page=None if cursor is not None else page,
+        has_previous_page=cursor is not None or page > 1,
+        has_next_page=has_next,
+        next_cursor=encode_cursor(order, items[-1]) if has_next else None,
+    )
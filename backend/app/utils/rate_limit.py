@@ -0,0 +1,52 @@
+"""
+Rate Limiting
+=============
+Async Token-Bucket für ausgehende API-Calls (LLM-Provider, Football API).
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Token-Bucket: `rate` Tokens pro Sekunde, maximal `capacity` auf Vorrat.
+
+    acquire() wartet, bis ein Token frei ist. Wartende werden in
+    Ankunftsreihenfolge bedient (Lock), damit kein Call verhungert.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate muss > 0 sein")
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def penalize(self, seconds: float) -> None:
+        """Nach einem 429: Vorrat verwerfen und Bucket für `seconds` sperren."""
+        self._tokens = 0.0
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
@@ -0,0 +1,31 @@
+"""
+Statistik-Helfer
+================
+Perzentile für Latenz-Auswertungen (Batch-Streams, Benchmarks).
+"""
+
+import math
+from typing import Optional, Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Perzentil nach Nearest-Rank-Methode (q in 0–100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_summary(seconds: Sequence[float]) -> dict[str, Optional[float]]:
+    """p50/p90/p99/max in Millisekunden."""
+
+    def _ms(value: Optional[float]) -> Optional[float]:
+        return round(value * 1000, 1) if value is not None else None
+
+    return {
+        "p50": _ms(percentile(seconds, 50)),
+        "p90": _ms(percentile(seconds, 90)),
+        "p99": _ms(percentile(seconds, 99)),
+        "max": _ms(max(seconds) if seconds else None),
+    }
@@ -0,0 +1,230 @@
+"""
+Benchmark-Harness
+=================
+Bausteine für benchmarks/run.py: App-Client ohne Server, deterministischer
+Fake-LLM, Testdaten in der lokalen Datenbank und Zeitmessung.
+
+Alle Testdaten hängen an einem eigenen Match (Teams "Bench Home"/"Bench
+Away") bzw. an reservierten Schlüsselbereichen (media_id ab MEDIA_ID_BASE,
+vid mit Präfix "bench-") und werden nach jedem Lauf wieder gelöscht.
+"""
+
+import asyncio
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+import httpx
+
+from app.api.v1 import media
+from app.core.broadcast import broadcast
+from app.core.database import SessionLocal
+from app.main import app
+from app.models.event import Event
+from app.models.match import Match
+from app.models.media_clip import MediaClip
+from app.models.media_queue import MediaQueue
+from app.models.synthetic_event import SyntheticEvent
+from app.models.team import Team
+from app.models.ticker_entry import TickerEntry
+from app.services import llm_service as llm_module
+from app.services.ticker_feed import ticker_feed
+from app.utils.stats import latency_summary
+
+MEDIA_ID_BASE = 9_000_000_000
+CLIP_VID_PREFIX = "bench-"
+
+_EVENT_TYPES = ["PartnerGoal", "PartnerYellowCard", "PartnerSubstitution", "PartnerComment"]
+_SYNTHETIC_TYPES = [
+    "pre_match_injuries",
+    "pre_match_prediction",
+    "match_kickoff",
+    "live_stats_update",
+    "match_halftime",
+    "match_second_half",
+    "match_fulltime",
+    "post_match_summary",
+]
+
+
+# ──────────────────────────────────────────
+# Fake-LLM
+# ──────────────────────────────────────────
+
+
+class FakeLLM:
+    """
+    Ersetzt LLMService.generate_ticker_text des Singletons: Text ist eine
+    Funktion der Argumente, die Latenz fest – Läufe sind reproduzierbar.
+    """
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency = latency_ms / 1000
+        self.calls = 0
+
+    async def generate_ticker_text(self, event_type: str, **kwargs) -> str:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        digest = hashlib.sha1(
+            repr((event_type, sorted(kwargs.items(), key=lambda kv: kv[0]))).encode()
+        ).hexdigest()[:8]
+        return f"{kwargs.get('minute') or '?'}. Minute: {event_type} [{digest}]"
+
+    @asynccontextmanager
+    async def installed(self) -> AsyncIterator["FakeLLM"]:
+        service = llm_module.llm_service
+        service.generate_ticker_text = self.generate_ticker_text
+        try:
+            yield self
+        finally:
+            del service.generate_ticker_text
+
+
+# ──────────────────────────────────────────
+# App
+# ──────────────────────────────────────────
+
+
+@asynccontextmanager
+async def app_client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    In-Process-Client (ASGITransport). Gestartet werden nur Bus und Feeds –
+    Live-Sync/Live-Stats würden API-Football ansprechen.
+    """
+    await broadcast.connect()
+    await media.manager.start()
+    await ticker_feed.start()
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=120
+        ) as client:
+            yield client
+    finally:
+        await ticker_feed.stop()
+        await media.manager.stop()
+        await broadcast.disconnect()
+
+
+# ──────────────────────────────────────────
+# Testdaten
+# ──────────────────────────────────────────
+
+
+class BenchMatch:
+    """Ein Match mit events/synthetics/entries; delete() räumt alles ab (CASCADE)."""
+
+    def __init__(self, events: int = 0, synthetics: int = 0, entries: int = 0) -> None:
+        db = SessionLocal()
+        try:
+            home = Team(name="Bench Home", source="bench")
+            away = Team(name="Bench Away", source="bench")
+            db.add_all([home, away])
+            db.flush()
+            match = Match(
+                home_team=home,
+                away_team=away,
+                home_score=0,
+                away_score=0,
+                match_state="Live",
+                match_phase="SecondHalf",
+                starts_at=datetime.now(timezone.utc),
+                source="bench",
+            )
+            db.add(match)
+            db.flush()
+            db.add_all(
+                Event(
+                    match_id=match.id,
+                    position=i,
+                    time=1 + i * 90 // max(events, 1),
+                    event_type=_EVENT_TYPES[i % len(_EVENT_TYPES)],
+                    phase="FirstHalf" if i < events // 2 else "SecondHalf",
+                    description=f"Bench-Event {i}",
+                    source="bench",
+                )
+                for i in range(events)
+            )
+            db.add_all(
+                SyntheticEvent(
+                    match_id=match.id,
+                    type=_SYNTHETIC_TYPES[i % len(_SYNTHETIC_TYPES)],
+                    minute=i * 90 // max(synthetics, 1),
+                    data={"bench": i},
+                )
+                for i in range(synthetics)
+            )
+            db.add_all(
+                TickerEntry(
+                    match_id=match.id,
+                    text=f"Bench-Eintrag {i}",
+                    status="published",
+                    source="manual",
+                    minute=i * 90 // max(entries, 1),
+                    phase="FirstHalf" if i < entries // 2 else "SecondHalf",
+                )
+                for i in range(entries)
+            )
+            db.commit()
+            self.id = match.id
+            self._team_ids = [home.id, away.id]
+        finally:
+            db.close()
+
+    def clear_entries(self) -> None:
+        db = SessionLocal()
+        try:
+            db.query(TickerEntry).filter(TickerEntry.match_id == self.id).delete()
+            db.commit()
+        finally:
+            db.close()
+
+    def delete(self) -> None:
+        db = SessionLocal()
+        try:
+            db.query(Match).filter(Match.id == self.id).delete()
+            db.query(Team).filter(Team.id.in_(self._team_ids)).delete()
+            db.commit()
+        finally:
+            db.close()
+
+
+def delete_ingest_rows() -> None:
+    db = SessionLocal()
+    try:
+        db.query(MediaQueue).filter(MediaQueue.media_id >= MEDIA_ID_BASE).delete()
+        db.query(MediaClip).filter(MediaClip.vid.like(f"{CLIP_VID_PREFIX}%")).delete(
+            synchronize_session=False
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+# ──────────────────────────────────────────
+# Messen
+# ──────────────────────────────────────────
+
+
+async def measure(
+    fn: Callable[[], Awaitable[None]], iterations: int, warmup: int = 3
+) -> dict[str, Optional[float]]:
+    """Latenz-Perzentile (ms) über iterations sequenzielle Aufrufe."""
+    for _ in range(warmup):
+        await fn()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return {"iterations": iterations, **latency_summary(samples)}
+
+
+def check(response: httpx.Response, expected: int) -> None:
+    if response.status_code != expected:
+        raise RuntimeError(
+            f"{response.request.method} {response.request.url.path}: "
+            f"{response.status_code} statt {expected} – {response.text[:200]}"
+        )
@@ -0,0 +1,782 @@
+"""
+Spieltag-Simulator
+==================
+Ein Bundesliga-Samstag im Zeitraffer: mehrere Spiele laufen parallel durch
+die ganze Pipeline, dazu Dutzende Redakteure mit offenem Ticker.
+
+- Server: uvicorn-Subprozess (--workers) gegen die lokale Datenbank; API-Football
+  und n8n zeigen auf lokale Stand-ins (benchmarks/stubs.py), Live-Sync und
+  Live-Stats laufen also mit. Mit --base-url wird stattdessen ein laufender
+  Server verwendet (dessen Env muss selbst auf die Stand-ins zeigen)
+- Replay: aufgezeichnete Timelines (--source-match-ids) oder eine generierte
+  Timeline pro Spiel, beschleunigt um --speed. Events kommen wie vom
+  Partner-Feed über POST /matches/{id}/events, Synthetic Events (schreibt n8n
+  direkt in die DB) per Insert
+- Redakteure: pro Spiel --editors WebSocket-Clients auf /ws/ticker/{id}, die
+  wie das Frontend Spiel, Events und Ticker (mit ETag) pollen. Der erste
+  Redakteur generiert die Entwürfe und löst die n8n-Webhooks des Frontends aus
+- LLM: Mock-Provider (sofortige Antwort) oder mit --simulated-llm der
+  simulierte Provider mit realistischer Latenz (LLM_SIMULATED_* aus der Env)
+
+    cd backend
+    python -m benchmarks.matchday                          # 5 Spiele à 8 Redakteure
+    python -m benchmarks.matchday --source-match-ids 812 815 --speed 60
+    python -m benchmarks.matchday --workers 4 --output matchday.json
+    LLM_SIMULATED_RATE_LIMIT_RATE=0.1 python -m benchmarks.matchday --simulated-llm
+
+Gemessen wird die Event→Entwurf-Latenz (Eingang bis ticker_delta beim
+generierenden bzw. bei allen Redakteuren), Fehlerraten pro Endpunkt,
+WebSocket-Abbrüche und die Aufrufe der Stand-ins. Spiele und Teams des
+Simulators liegen in einem reservierten external_id-Bereich und werden
+nach dem Lauf gelöscht (--keep behält sie).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import aiohttp
+
+os.environ.setdefault("DEBUG", "false")
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.models.event import Event  # noqa: E402
+from app.models.match import Match  # noqa: E402
+from app.models.synthetic_event import SyntheticEvent  # noqa: E402
+from app.models.team import Team  # noqa: E402
+from app.utils.stats import latency_summary  # noqa: E402
+from benchmarks.stubs import HALFTIME_BREAK, ApiFootballStub, N8nStub  # noqa: E402
+
+# Reservierte external_ids: Spiele ab BASE, Teams ab BASE + 1000
+SIM_EXTERNAL_ID_BASE = 2_000_000_000
+SIM_SOURCE = "simulator"
+
+# Simulierte Uhr in Spielminuten, Halbzeitpause eingerechnet (2. HZ = 60–105)
+CLOCK_START = -2.0
+CLOCK_END = 90 + HALFTIME_BREAK + 2.0
+
+_EVENT_TYPES = [
+    ("PartnerComment", 10),
+    ("PartnerGoal", 2),
+    ("PartnerYellowCard", 3),
+    ("PartnerSubstitution", 3),
+    ("PartnerCorner", 4),
+    ("PartnerFreeKick", 3),
+]
+# Phasen-Synthetics: (Minute der simulierten Uhr, Spielminute)
+_PHASE_SYNTHETICS = {
+    "match_kickoff": (0.0, 0),
+    "match_halftime": (45.5, 45),
+    "match_second_half": (45.0 + HALFTIME_BREAK, 46),
+    "match_fulltime": (90.5 + HALFTIME_BREAK, 90),
+}
+# match_phase → Status im match-status-Webhook (wie LiveTicker.jsx)
+_WEBHOOK_STATUS = {
+    "FirstHalf": "1H",
+    "FirstHalfBreak": "HT",
+    "SecondHalf": "2H",
+    "FullTime": "FT",
+}
+
+
+# ──────────────────────────────────────────
+# Timeline
+# ──────────────────────────────────────────
+
+
+@dataclass
+class Step:
+    clock: float  # Minute der simulierten Uhr
+    kind: str  # "event" | "synthetic"
+    data: dict
+
+
+def _clock(phase: Optional[str], minute: Optional[int], additional: Optional[int]) -> float:
+    """Spielminute → simulierte Uhr; Nachspielzeit wird in die Halbzeit gestaucht."""
+    if phase == "Before":
+        return CLOCK_START + 1
+    if phase == "FirstHalfBreak":
+        return 45.0 + HALFTIME_BREAK / 2
+    if phase in ("After", "FullTime"):
+        return CLOCK_END - 1
+    minute = minute or 0
+    stoppage = min(additional or 0, 4) * 0.1
+    if phase == "FirstHalf" or (phase is None and minute <= 45):
+        return min(minute, 45) - 0.5 + stoppage
+    return HALFTIME_BREAK + min(max(minute, 46), 90) - 0.5 + stoppage
+
+
+def _synthetic_clock(synthetic_type: str, minute: Optional[int]) -> float:
+    if synthetic_type.startswith("pre_match"):
+        return CLOCK_START + 1
+    if synthetic_type.startswith("post_match"):
+        return CLOCK_END - 1
+    if synthetic_type in _PHASE_SYNTHETICS:
+        return _PHASE_SYNTHETICS[synthetic_type][0]
+    return _clock(None, minute, None)
+
+
+def recorded_timeline(match_id: int) -> list[Step]:
+    db = SessionLocal()
+    try:
+        events = (
+            db.query(Event)
+            .filter(Event.match_id == match_id)
+            .order_by(Event.position, Event.time, Event.id)
+            .all()
+        )
+        synthetics = (
+            db.query(SyntheticEvent)
+            .filter(SyntheticEvent.match_id == match_id)
+            .order_by(SyntheticEvent.id)
+            .all()
+        )
+    finally:
+        db.close()
+    if not events and not synthetics:
+        raise SystemExit(f"Match {match_id} hat keine Events/Synthetic Events")
+
+    steps = [
+        Step(
+            _clock(e.phase, e.time, e.time_additional),
+            "event",
+            {
+                "position": e.position,
+                "time": e.time,
+                "timeAdditional": e.time_additional,
+                "liveTickerPhaseType": e.phase,
+                "liveTickerEventType": e.event_type,
+                "description": e.description,
+            },
+        )
+        for e in events
+    ]
+    steps += [
+        Step(
+            _synthetic_clock(s.type or "", s.minute),
+            "synthetic",
+            {"type": s.type, "minute": s.minute, "data": s.data},
+        )
+        for s in synthetics
+        # live_stats_update erzeugt der Live-Stats-Monitor des Servers selbst
+        if s.type != "live_stats_update"
+    ]
+    return sorted(steps, key=lambda s: s.clock)
+
+
+def generated_timeline(seed: int) -> list[Step]:
+    """Deterministische Timeline: Vorbericht, Phasen, ~30 Events, Nachbericht."""
+    rng = random.Random(seed)
+    types, weights = zip(*_EVENT_TYPES)
+    steps = [
+        Step(
+            _synthetic_clock(t, None),
+            "synthetic",
+            {
+                "type": t,
+                "minute": _PHASE_SYNTHETICS[t][1] if t in _PHASE_SYNTHETICS else None,
+                "data": {"simulated": True},
+            },
+        )
+        for t in ("pre_match_prediction", *_PHASE_SYNTHETICS, "post_match_summary")
+    ]
+    minutes = sorted(rng.randint(1, 90) for _ in range(rng.randint(24, 36)))
+    for position, minute in enumerate(minutes):
+        phase = "FirstHalf" if minute <= 45 else "SecondHalf"
+        event_type = rng.choices(types, weights)[0]
+        steps.append(
+            Step(
+                _clock(phase, minute, None),
+                "event",
+                {
+                    "position": position,
+                    "time": minute,
+                    "liveTickerPhaseType": phase,
+                    "liveTickerEventType": event_type,
+                    "description": f"Simuliertes {event_type} in Minute {minute}",
+                },
+            )
+        )
+    return sorted(steps, key=lambda s: s.clock)
+
+
+# ──────────────────────────────────────────
+# Spiele in der Datenbank
+# ──────────────────────────────────────────
+
+
+class SimMatch:
+    def __init__(self, index: int, steps: list[Step], speed: float, editors: int) -> None:
+        self.index = index
+        self.steps = steps
+        self.speed = speed
+        self.editors = editors
+        self.external_id = SIM_EXTERNAL_ID_BASE + index
+        self.team_external_ids = (
+            SIM_EXTERNAL_ID_BASE + 1000 + 2 * index,
+            SIM_EXTERNAL_ID_BASE + 1001 + 2 * index,
+        )
+        self.id: Optional[int] = None
+        self.kickoff: Optional[float] = None
+        self.synthetics_pending = asyncio.Event()
+        self.phase: Optional[str] = None  # zuletzt gesehene match_phase (Redakteur 0)
+        self.finished = False
+
+    def clock(self) -> float:
+        if self.kickoff is None:
+            return CLOCK_START
+        return CLOCK_START + (time.monotonic() - self.kickoff) * self.speed / 60
+
+    async def sleep_until(self, clock: float) -> None:
+        delay = (clock - self.clock()) * 60 / self.speed
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def delete_sim_rows() -> None:
+    db = SessionLocal()
+    try:
+        db.query(Match).filter(
+            Match.external_id >= SIM_EXTERNAL_ID_BASE, Match.source == SIM_SOURCE
+        ).delete(synchronize_session=False)
+        db.query(Team).filter(
+            Team.external_id >= SIM_EXTERNAL_ID_BASE, Team.source == SIM_SOURCE
+        ).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def create_sim_rows(matches: list[SimMatch]) -> None:
+    db = SessionLocal()
+    try:
+        for m in matches:
+            home_ext, away_ext = m.team_external_ids
+            home = Team(
+                name=f"Sim Home {m.index + 1}", external_id=home_ext, source=SIM_SOURCE
+            )
+            away = Team(
+                name=f"Sim Away {m.index + 1}", external_id=away_ext, source=SIM_SOURCE
+            )
+            match = Match(
+                external_id=m.external_id,
+                home_team=home,
+                away_team=away,
+                home_score=0,
+                away_score=0,
+                match_state="Live",
+                starts_at=datetime.now(timezone.utc),
+                source=SIM_SOURCE,
+            )
+            db.add_all([home, away, match])
+            db.flush()
+            m.id = match.id
+        db.commit()
+    finally:
+        db.close()
+
+
+def insert_synthetic(match_id: int, data: dict) -> int:
+    db = SessionLocal()
+    try:
+        synthetic = SyntheticEvent(match_id=match_id, **data)
+        db.add(synthetic)
+        db.commit()
+        return synthetic.id
+    finally:
+        db.close()
+
+
+# ──────────────────────────────────────────
+# Messwerte
+# ──────────────────────────────────────────
+
+
+@dataclass
+class _Endpoint:
+    statuses: Counter = field(default_factory=Counter)
+    latencies: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        requests = sum(self.statuses.values())
+        errors = sum(n for s, n in self.statuses.items() if s == "exception" or int(s) >= 400)
+        return {
+            "requests": requests,
+            "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else None,
+            "status": dict(self.statuses),
+            "latency_ms": latency_summary(self.latencies),
+        }
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.http: dict[str, _Endpoint] = defaultdict(_Endpoint)
+        self.ws: Counter[str] = Counter()
+        # ("event"|"synthetic", id) → (Eingang, Redakteure des Spiels)
+        self.ingested: dict[tuple[str, int], tuple[float, int]] = {}
+        # ("event"|"synthetic", id) → {Redakteur-Index: Empfang}
+        self.delivered: dict[tuple[str, int], dict[int, float]] = defaultdict(dict)
+        self.server_entries = 0
+
+    def request(self, label: str, status: int | str, seconds: float) -> None:
+        endpoint = self.http[label]
+        endpoint.statuses[str(status)] += 1
+        endpoint.latencies.append(seconds)
+
+    def entry_created(self, editor: int, entry: dict, at: float) -> None:
+        if entry.get("event_id"):
+            key = ("event", entry["event_id"])
+        elif entry.get("synthetic_event_id"):
+            key = ("synthetic", entry["synthetic_event_id"])
+        else:
+            return
+        if key not in self.ingested:
+            # z. B. live_stats_update des Live-Stats-Monitors
+            if editor == 0:
+                self.server_entries += 1
+            return
+        self.delivered[key].setdefault(editor, at)
+
+    def complete(self) -> bool:
+        return all(
+            len(self.delivered.get(key, ())) >= editors
+            for key, (_, editors) in self.ingested.items()
+        )
+
+    def summary(self) -> dict:
+        latency: dict[str, dict[str, list[float]]] = {
+            kind: {"first_editor": [], "all_editors": []} for kind in ("event", "synthetic")
+        }
+        missing: Counter[str] = Counter()
+        for key, (ingested_at, editors) in self.ingested.items():
+            arrivals = self.delivered.get(key, {})
+            if 0 not in arrivals:
+                missing[key[0]] += 1
+                continue
+            latency[key[0]]["first_editor"].append(arrivals[0] - ingested_at)
+            if len(arrivals) >= editors:
+                latency[key[0]]["all_editors"].append(max(arrivals.values()) - ingested_at)
+        return {
+            "event_to_draft_ms": {
+                kind: {
+                    "ingested": sum(1 for k in self.ingested if k[0] == kind),
+                    "missing": missing[kind],
+                    **{scope: latency_summary(v) for scope, v in scopes.items()},
+                }
+                for kind, scopes in latency.items()
+            },
+            "server_generated_entries": self.server_entries,
+            "http": {label: e.summary() for label, e in sorted(self.http.items())},
+            "websocket": dict(self.ws),
+        }
+
+
+# ──────────────────────────────────────────
+# Simulator
+# ──────────────────────────────────────────
+
+
+class Simulator:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str,
+        n8n_url: str,
+        recorder: Recorder,
+        poll_interval: float,
+    ) -> None:
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.ws_url = self.base_url.replace("http", "ws", 1)
+        self.n8n_url = n8n_url
+        self.recorder = recorder
+        self.poll_interval = poll_interval
+
+    async def call(
+        self, method: str, label: str, url: str, **kwargs: Any
+    ) -> tuple[Optional[int], Any, dict]:
+        """Request mit Messung → (Status, JSON-Body, Header); Status None bei Fehlern."""
+        started = time.perf_counter()
+        try:
+            async with self.session.request(method, url, **kwargs) as resp:
+                is_json = resp.content_type == "application/json"
+                body = await resp.json() if is_json else None
+                self.recorder.request(label, resp.status, time.perf_counter() - started)
+                return resp.status, body, dict(resp.headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError):
+            self.recorder.request(label, "exception", time.perf_counter() - started)
+            return None, None, {}
+
+    def api(self, method: str, label: str, path: str, **kwargs: Any):
+        url = f"{self.base_url}/api/v1{path}"
+        return self.call(method, f"{method} {label}", url, **kwargs)
+
+    def n8n(self, webhook: str, payload: dict):
+        url = f"{self.n8n_url}/webhook/{webhook}"
+        return self.call("POST", f"n8n /{webhook}", url, json=payload)
+
+    # ── Replay ───────────────────────────────────────────────
+
+    async def replay(self, match: SimMatch) -> None:
+        for i, step in enumerate(match.steps):
+            await match.sleep_until(step.clock)
+            ingested_at = time.monotonic()
+            if step.kind == "event":
+                status, body, _ = await self.api(
+                    "POST",
+                    "/matches/{id}/events",
+                    f"/matches/{match.id}/events",
+                    json={**step.data, "sourceId": f"sim-{match.external_id}-{i}"},
+                )
+                if status == 201:
+                    self.recorder.ingested[("event", body["id"])] = (
+                        ingested_at,
+                        match.editors,
+                    )
+            else:
+                synthetic_id = await asyncio.to_thread(insert_synthetic, match.id, step.data)
+                self.recorder.ingested[("synthetic", synthetic_id)] = (
+                    ingested_at,
+                    match.editors,
+                )
+                match.synthetics_pending.set()
+        await match.sleep_until(CLOCK_END)
+        match.finished = True
+
+    # ── Redakteure ───────────────────────────────────────────
+
+    async def listen(self, match: SimMatch, editor: int) -> None:
+        """WebSocket wie im Frontend: bei Abbruch mit since/epoch neu verbinden."""
+        since: Optional[int] = None
+        epoch: Optional[str] = None
+        while True:
+            params = {"since": since, "epoch": epoch} if since is not None else None
+            try:
+                async with self.session.ws_connect(
+                    f"{self.ws_url}/ws/ticker/{match.id}", params=params
+                ) as ws:
+                    self.recorder.ws["connections"] += 1
+                    async for msg in ws:
+                        if msg.type != aiohttp.WSMsgType.TEXT:
+                            break
+                        data = json.loads(msg.data)
+                        self.recorder.ws["messages"] += 1
+                        if data["type"] == "hello":
+                            if since is None or data["epoch"] != epoch:
+                                since, epoch = data["seq"], data["epoch"]
+                        elif data["type"] == "ticker_delta":
+                            since, epoch = data["seq"], data["epoch"]
+                            if data["op"] == "created":
+                                self.recorder.entry_created(
+                                    editor, data["entry"], time.monotonic()
+                                )
+                        elif data["type"] == "resync":
+                            self.recorder.ws["resyncs"] += 1
+                            since = None
+                self.recorder.ws["disconnects"] += 1
+            except aiohttp.ClientError:
+                self.recorder.ws["connect_errors"] += 1
+            await asyncio.sleep(1)
+
+    async def poll(self, match: SimMatch, editor: int, rng: random.Random) -> None:
+        """Polling des Frontends; Redakteur 0 generiert und triggert n8n."""
+        lead = editor == 0
+        etag: Optional[str] = None
+        requested: set[int] = set()
+        generating: set[asyncio.Task] = set()
+        if lead:
+            await self.n8n("Events", {"fixture_id": match.external_id})
+
+        while True:
+            # nach Abpfiff noch eine Runde, damit späte Events/Synthetics drankommen
+            last_round = match.finished
+            await asyncio.sleep(self.poll_interval * rng.uniform(0.8, 1.2))
+            _, match_body, _ = await self.api("GET", "/matches/{id}", f"/matches/{match.id}")
+            _, events, _ = await self.api(
+                "GET",
+                "/matches/{id}/events",
+                f"/matches/{match.id}/events",
+                params={"pageSize": 500},
+            )
+            status, _, headers = await self.api(
+                "GET",
+                "/ticker/match/{id}",
+                f"/ticker/match/{match.id}",
+                headers={"If-None-Match": etag} if etag else None,
+            )
+            if status == 200:
+                etag = headers.get("ETag") or headers.get("etag")
+            if lead:
+                await self._lead(match, events, match_body, requested, generating)
+            if last_round:
+                break
+
+        if generating:
+            await asyncio.gather(*generating)
+
+    async def _lead(
+        self,
+        match: SimMatch,
+        events: Optional[dict],
+        match_body: Optional[dict],
+        requested: set[int],
+        generating: set[asyncio.Task],
+    ) -> None:
+
+        """Redakteur 0: Entwürfe anstoßen und n8n bei Phasenwechseln triggern."""
+        for event in (events or {}).get("items", []):
+            if event["id"] not in requested:
+                requested.add(event["id"])
+                task = asyncio.create_task(self._generate(event["id"], requested))
+                generating.add(task)
+                task.add_done_callback(generating.discard)
+        if match.synthetics_pending.is_set():
+            match.synthetics_pending.clear()
+            status, _, _ = await self.api(
+                "POST",
+                "/ticker/generate-synthetic-batch/{id}",
+                f"/ticker/generate-synthetic-batch/{match.id}",
+                json={},
+            )
+            if status != 201:
+                match.synthetics_pending.set()
+
+        phase = (match_body or {}).get("matchPhase")
+        if phase and phase != match.phase:
+            match.phase = phase
+            await self.n8n(
+                "match-status",
+                {
+                    "fixture_id": match.external_id,
+                    "status": _WEBHOOK_STATUS.get(phase, "1H"),
+                    "minute": match_body.get("minute"),
+                },
+            )
+            if phase in ("FirstHalfBreak", "FullTime"):
+                await self.n8n("match-summary", {"match_id": match.id, "phase": phase})
+
+    async def _generate(self, event_id: int, requested: set[int]) -> None:
+        status, _, _ = await self.api(
+            "POST", "/ticker/generate/{id}", f"/ticker/generate/{event_id}", json={}
+        )
+        if status != 201:
+            # beim nächsten Poll erneut versuchen
+            requested.discard(event_id)
+
+
+# ──────────────────────────────────────────
+# Server
+# ──────────────────────────────────────────
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def spawn_server(
+    args: argparse.Namespace, stub_env: dict[str, str]
+) -> tuple[subprocess.Popen, str]:
+    port = args.port or _free_port()
+    env = {
+        **os.environ,
+        **stub_env,
+        # Scheduler im Zeitraffer: gleiche Aufrufe pro Spielminute wie live
+        "LIVE_SYNC_INTERVAL_SECONDS": str(max(1, round(60 / args.speed))),
+        "LIVE_STATS_INTERVAL_SECONDS": str(max(1, round(300 / args.speed))),
+        "API_FOOTBALL_TTL_LIVE": "1",
+        "OPENAI_API_KEY": "",
+        "ANTHROPIC_API_KEY": "",
+        "GEMINI_API_KEY": "",
+        "OPENROUTER_API_KEY": "",
+        "LLM_CACHE_ENABLED": "false",
+        "LLM_SIMULATED": "true" if args.simulated_llm else "false",
+        "DEBUG": "false",
+    }
+    if args.workers > 1:
+        # Deltas müssen alle Worker erreichen
+        env.setdefault("BROADCAST_BACKEND", "postgres")
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(args.workers), "--log-level", "warning",
+    ]  # fmt: skip
+    return subprocess.Popen(command, env=env), f"http://127.0.0.1:{port}"
+
+
+async def wait_ready(
+    session: aiohttp.ClientSession, base_url: str, server: Optional[subprocess.Popen]
+) -> None:
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server is not None and server.poll() is not None:
+            raise SystemExit(f"Server beendet (Exit-Code {server.returncode})")
+        try:
+            async with session.get(f"{base_url}/health/live") as resp:
+                if resp.status == 200:
+                    return
+        except aiohttp.ClientError:
+            pass
+        await asyncio.sleep(0.5)
+    raise SystemExit(f"Server unter {base_url} nicht erreichbar")
+
+
+# ──────────────────────────────────────────
+# CLI
+# ──────────────────────────────────────────
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _timelines(args: argparse.Namespace) -> list[list[Step]]:
+    if not args.source_match_ids:
+        return [generated_timeline(args.seed + i) for i in range(args.matches)]
+    recorded = [recorded_timeline(match_id) for match_id in args.source_match_ids]
+    return [recorded[i % len(recorded)] for i in range(args.matches)]
+
+
+async def main(args: argparse.Namespace) -> dict:
+    timelines = _timelines(args)
+    matches = [
+        SimMatch(i, steps, args.speed, args.editors) for i, steps in enumerate(timelines)
+    ]
+
+    api_football, n8n = ApiFootballStub(), N8nStub()
+    await api_football.start(port=args.api_football_port)
+    await n8n.start(port=args.n8n_port)
+    stub_env = {
+        "API_FOOTBALL_KEY": "simulator",
+        "API_FOOTBALL_BASE_URL": api_football.url,
+        **n8n.webhook_env(),
+    }
+
+    await asyncio.to_thread(delete_sim_rows)
+    await asyncio.to_thread(create_sim_rows, matches)
+    for m in matches:
+        api_football.register(m.external_id, *m.team_external_ids, clock=m.clock)
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server, base_url = spawn_server(args, stub_env)
+    else:
+        print("Server-Env für die Stand-ins:", file=sys.stderr)
+        for key, value in stub_env.items():
+            print(f"  {key}={value}", file=sys.stderr)
+
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    started = time.monotonic()
+    try:
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0),
+            timeout=aiohttp.ClientTimeout(total=args.timeout),
+        ) as session:
+            await wait_ready(session, base_url, server)
+            sim = Simulator(session, base_url, n8n.url, recorder, args.poll_interval)
+            listeners = [
+                asyncio.create_task(sim.listen(m, e))
+                for m in matches
+                for e in range(m.editors)
+            ]
+            await asyncio.sleep(1)  # WebSockets verbunden, bevor der Anpfiff kommt
+
+            for m in matches:
+                m.kickoff = time.monotonic() + m.index * args.stagger
+            print(
+                f"→ {len(matches)} Spiele, {len(listeners)} Redakteure, "
+                f"~{(CLOCK_END - CLOCK_START) * 60 / args.speed:.0f} s pro Spiel",
+                file=sys.stderr,
+            )
+            await asyncio.gather(
+                *(sim.replay(m) for m in matches),
+                *(
+                    sim.poll(m, e, random.Random(rng.random()))
+                    for m in matches
+                    for e in range(m.editors)
+                ),
+            )
+
+            deadline = time.monotonic() + args.grace
+            while not recorder.complete() and time.monotonic() < deadline:
+                await asyncio.sleep(0.5)
+            for task in listeners:
+                task.cancel()
+            await asyncio.gather(*listeners, return_exceptions=True)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+        await api_football.stop()
+        await n8n.stop()
+        if not args.keep:
+            await asyncio.to_thread(delete_sim_rows)
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "params": {k: v for k, v in vars(args).items() if k != "output"},
+        "wall_s": round(time.monotonic() - started, 1),
+        "results": {
+            **recorder.summary(),
+            "stubs": {
+                "api_football": dict(api_football.calls),
+                "n8n": dict(n8n.calls),
+            },
+        },
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--matches", type=int, default=5, help="parallele Spiele")
+    parser.add_argument("--editors", type=int, default=8, help="Redakteure pro Spiel")
+    parser.add_argument(
+        "--source-match-ids", type=int, nargs="+", help="Timelines aus diesen Spielen"
+    )
+    parser.add_argument("--speed", type=float, default=30.0, help="Zeitraffer-Faktor")
+    parser.add_argument("--stagger", type=float, default=0.0, help="Sekunden zwischen Anpfiffen")
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="Sekunden zwischen Polls")
+    parser.add_argument("--grace", type=float, default=30.0, help="Nachlauf für offene Entwürfe")
+    parser.add_argument("--timeout", type=float, default=60.0, help="HTTP-Timeout in Sekunden")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn-Worker")
+    parser.add_argument(
+        "--simulated-llm", action="store_true", help="simulierter statt Mock-Provider"
+    )
+    parser.add_argument("--port", type=int, default=0, help="Server-Port (0 = frei)")
+    parser.add_argument("--base-url", help="bereits laufenden Server verwenden")
+    parser.add_argument("--api-football-port", type=int, default=0)
+    parser.add_argument("--n8n-port", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="Simulator-Spiele nicht löschen")
+    parser.add_argument("--output", default="matchday-results.json")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = _parse_args()
+    report = asyncio.run(main(arguments))
+    with open(arguments.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(json.dumps(report["results"], indent=2, ensure_ascii=False))
@@ -0,0 +1,303 @@
+"""
+Benchmark-Suite
+===============
+Reproduzierbare Messung der heißen Pfade gegen eine lokale Postgres-Datenbank
+(DATABASE_URL aus .env, Schema per alembic upgrade head). Kein Netzwerk:
+Requests laufen in-process über ASGITransport, der LLM ist ein
+deterministischer Fake (benchmarks/harness.FakeLLM).
+
+    cd backend
+    python -m benchmarks.run                       # alle Fälle
+    python -m benchmarks.run --only ticker_read fanout
+    python -m benchmarks.run --output bench.json --llm-latency-ms 200
+
+Fälle:
+- generate_bulk / generate_synthetic_batch: Einträge pro Sekunde
+- ticker_read: GET /ticker/match/{id} bei 50/500/5000 Einträgen (voll und 304)
+- media_ingest / clips_ingest: Items pro Sekunde für /media/incoming, /clips/import
+- fanout: WebSocket-Broadcast an 10/100/1000 Clients (bis alle empfangen haben)
+
+Das Ergebnis geht als JSON (inkl. Commit und Parametern) nach --output, damit
+Läufe über Commits hinweg verglichen werden können.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+# Vor dem App-Import: keine echten Provider, kein Live-Betrieb, kein SQL-Echo
+for _key in (
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "GEMINI_API_KEY",
+    "OPENROUTER_API_KEY",
+    "API_FOOTBALL_KEY",
+):
+    os.environ[_key] = ""
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+
+from app.core.websocket import ConnectionGroup  # noqa: E402
+from app.utils.stats import latency_summary  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+    CLIP_VID_PREFIX,
+    MEDIA_ID_BASE,
+    BenchMatch,
+    FakeLLM,
+    app_client,
+    check,
+    delete_ingest_rows,
+    measure,
+)
+
+TICKER_SIZES = (50, 500, 5000)
+FANOUT_SIZES = (10, 100, 1000)
+
+
+# ──────────────────────────────────────────
+# Generierung
+# ──────────────────────────────────────────
+
+
+async def bench_generate_bulk(client, args) -> dict:
+    match = BenchMatch(events=args.events)
+    try:
+        runs = []
+        for _ in range(args.repeat):
+            match.clear_entries()
+            started = time.perf_counter()
+            response = await client.post(f"/api/v1/ticker/generate-bulk/{match.id}", json={})
+            check(response, 201)
+            runs.append(time.perf_counter() - started)
+        return _throughput(args.events, runs)
+    finally:
+        match.delete()
+
+
+async def bench_generate_synthetic_batch(client, args) -> dict:
+    match = BenchMatch(synthetics=args.events)
+    try:
+        runs = []
+        for _ in range(args.repeat):
+            match.clear_entries()
+            started = time.perf_counter()
+            response = await client.post(
+                f"/api/v1/ticker/generate-synthetic-batch/{match.id}", json={}
+            )
+            check(response, 201)
+            runs.append(time.perf_counter() - started)
+        return _throughput(args.events, runs)
+    finally:
+        match.delete()
+
+
+def _throughput(items: int, runs: list[float]) -> dict:
+    best = min(runs)
+    return {
+        "items": items,
+        "runs": len(runs),
+        "wall_ms": latency_summary(runs),
+        "items_per_s": round(items / best, 1) if best else None,
+    }
+
+
+# ──────────────────────────────────────────
+# Ticker lesen
+# ──────────────────────────────────────────
+
+
+async def bench_ticker_read(client, args) -> dict:
+    results = {}
+    for size in TICKER_SIZES:
+        match = BenchMatch(entries=size)
+        try:
+            url = f"/api/v1/ticker/match/{match.id}"
+            first = await client.get(url)
+            check(first, 200)
+            etag = first.headers.get("etag")
+
+            async def full() -> None:
+                check(await client.get(url), 200)
+
+            async def not_modified() -> None:
+                check(await client.get(url, headers={"If-None-Match": etag}), 304)
+
+            results[str(size)] = {
+                "full": await measure(full, args.iterations),
+                "not_modified": await measure(not_modified, args.iterations),
+            }
+        finally:
+            match.delete()
+    return results
+
+
+# ──────────────────────────────────────────
+# Ingest
+# ──────────────────────────────────────────
+
+
+async def bench_media_ingest(client, args) -> dict:
+    delete_ingest_rows()
+    try:
+        runs = []
+        for run in range(args.repeat):
+            base = MEDIA_ID_BASE + run * args.batch
+            items = [
+                {"media_id": base + i, "name": f"Bench {i}", "thumbnail_url": None}
+                for i in range(args.batch)
+            ]
+            started = time.perf_counter()
+            check(await client.post("/api/v1/media/incoming", json=items), 200)
+            runs.append(time.perf_counter() - started)
+        return _throughput(args.batch, runs)
+    finally:
+        delete_ingest_rows()
+
+
+async def bench_clips_ingest(client, args) -> dict:
+    delete_ingest_rows()
+    try:
+        runs = []
+        for run in range(args.repeat):
+            clips = [
+                {
+                    "vid": f"{CLIP_VID_PREFIX}{run}-{i}",
+                    "video_url": f"https://example.invalid/{run}/{i}.mp4",
+                    "title": f"Bench-Clip {i}",
+                    "source": "bundesliga",
+                }
+                for i in range(args.batch)
+            ]
+            started = time.perf_counter()
+            check(await client.post("/api/v1/clips/import", json={"clips": clips}), 201)
+            runs.append(time.perf_counter() - started)
+        return _throughput(args.batch, runs)
+    finally:
+        delete_ingest_rows()
+
+
+# ──────────────────────────────────────────
+# WebSocket-Fan-out
+# ──────────────────────────────────────────
+
+
+class _FakeSocket:
+    """Minimaler WebSocket: zählt Empfang, bis alle Clients eine Nachricht haben."""
+
+    def __init__(self, barrier: "_Arrivals") -> None:
+        self.barrier = barrier
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        self.barrier.arrived()
+
+    async def close(self) -> None:
+        pass
+
+
+class _Arrivals:
+    def __init__(self) -> None:
+        self.expected = 0
+        self.count = 0
+        self.done = asyncio.Event()
+
+    def reset(self, expected: int) -> None:
+        self.expected, self.count = expected, 0
+        self.done.clear()
+
+    def arrived(self) -> None:
+        self.count += 1
+        if self.count >= self.expected:
+            self.done.set()
+
+
+async def bench_fanout(client, args) -> dict:
+    payload = {"type": "ticker_delta", "op": "created", "entry": {"text": "x" * 200}}
+    results = {}
+    for size in FANOUT_SIZES:
+        arrivals = _Arrivals()
+        group = ConnectionGroup(queue_size=64, heartbeat_interval=3600)
+        clients = [await group.connect(_FakeSocket(arrivals)) for _ in range(size)]
+        try:
+
+            async def broadcast_once() -> None:
+                arrivals.reset(size)
+                group.broadcast(payload)
+                await arrivals.done.wait()
+
+            results[str(size)] = await measure(broadcast_once, args.iterations)
+        finally:
+            for c in clients:
+                await group.disconnect(c)
+    return results
+
+
+CASES = {
+    "generate_bulk": bench_generate_bulk,
+    "generate_synthetic_batch": bench_generate_synthetic_batch,
+    "ticker_read": bench_ticker_read,
+    "media_ingest": bench_media_ingest,
+    "clips_ingest": bench_clips_ingest,
+    "fanout": bench_fanout,
+}
+
+
+# ──────────────────────────────────────────
+# CLI
+# ──────────────────────────────────────────
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args: argparse.Namespace) -> dict:
+    fake = FakeLLM(latency_ms=args.llm_latency_ms)
+    results = {}
+    async with app_client() as client, fake.installed():
+        for name in args.only or CASES:
+            print(f"→ {name} …", file=sys.stderr)
+            results[name] = await CASES[name](client, args)
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "params": {
+            k: v for k, v in vars(args).items() if k not in ("output", "only")
+        },
+        "llm_calls": fake.calls,
+        "results": results,
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", nargs="+", choices=list(CASES), help="nur diese Fälle")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--events", type=int, default=100, help="Events pro Generierungslauf")
+    parser.add_argument("--batch", type=int, default=500, help="Items pro Ingest-Request")
+    parser.add_argument("--repeat", type=int, default=5, help="Läufe für Durchsatz-Fälle")
+    parser.add_argument("--iterations", type=int, default=50, help="Messungen für Latenz-Fälle")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="feste Fake-LLM-Latenz")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = _parse_args()
+    report = asyncio.run(main(arguments))
+    with open(arguments.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(json.dumps(report["results"], indent=2, ensure_ascii=False))
@@ -0,0 +1,182 @@
+"""
+Stand-ins für den Spieltag-Simulator
+====================================
+Lokale aiohttp-Server statt der externen Dienste, damit ein Lauf nichts nach
+außen schickt und keine API-Quota verbraucht:
+
+- API-Football: GET /fixtures?ids=… und /fixtures/statistics?fixture=… –
+  Status, Minute und Statistiken folgen der simulierten Uhr des Spiels
+  (Live-Sync- und Live-Stats-Scheduler des Servers laufen dagegen)
+- n8n: nimmt jeden Webhook (/webhook/…) an und zählt die Aufrufe
+
+Jeder Aufruf wird in calls gezählt und landet im Report.
+"""
+
+from collections import Counter
+from typing import Callable, Optional
+
+from aiohttp import web
+
+# Dauer der Halbzeitpause in Spielminuten der simulierten Uhr
+HALFTIME_BREAK = 15
+
+
+def fixture_status(clock_minute: float) -> tuple[str, Optional[int]]:
+    """(status.short, elapsed) für eine Minute der simulierten Uhr (inkl. Pause)."""
+    if clock_minute < 0:
+        return "NS", None
+    if clock_minute < 45:
+        return "1H", int(clock_minute) + 1
+    if clock_minute < 45 + HALFTIME_BREAK:
+        return "HT", 45
+    if clock_minute < 90 + HALFTIME_BREAK:
+        return "2H", int(clock_minute) - HALFTIME_BREAK + 1
+    return "FT", 90
+
+
+class _Stub:
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+    def _app(self) -> web.Application:
+        raise NotImplementedError
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self._app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+# ──────────────────────────────────────────
+# API-Football
+# ──────────────────────────────────────────
+
+
+class ApiFootballStub(_Stub):
+    """
+    Fixtures werden über register() bekannt gemacht; clock liefert die aktuelle
+    Minute der simulierten Uhr des Spiels.
+    """
+
+    def __init__(self, daily_limit: int = 7500) -> None:
+        super().__init__()
+        self.daily_limit = daily_limit
+        self._fixtures: dict[int, dict] = {}
+
+    def register(
+        self,
+        fixture_id: int,
+        home_team_id: int,
+        away_team_id: int,
+        clock: Callable[[], float],
+    ) -> None:
+        self._fixtures[fixture_id] = {"teams": (home_team_id, away_team_id), "clock": clock}
+
+    def _app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/fixtures", self._handle_fixtures)
+        app.router.add_get("/fixtures/statistics", self._handle_statistics)
+        return app
+
+    def _respond(self, response: list) -> web.Response:
+        used = sum(self.calls.values())
+        return web.json_response(
+            {"errors": [], "results": len(response), "response": response},
+            headers={
+                "x-ratelimit-requests-limit": str(self.daily_limit),
+                "x-ratelimit-requests-remaining": str(max(self.daily_limit - used, 0)),
+            },
+        )
+
+    async def _handle_fixtures(self, request: web.Request) -> web.Response:
+        self.calls["fixtures"] += 1
+        raw = request.query.get("ids") or request.query.get("id") or ""
+        response = []
+        for part in raw.split("-"):
+            if not part.isdigit() or int(part) not in self._fixtures:
+                continue
+            fixture = self._fixtures[int(part)]
+            short, elapsed = fixture_status(fixture["clock"]())
+            response.append(
+                {
+                    "fixture": {
+                        "id": int(part),
+                        "status": {"short": short, "elapsed": elapsed},
+                    }
+                }
+            )
+        return self._respond(response)
+
+    async def _handle_statistics(self, request: web.Request) -> web.Response:
+        self.calls["statistics"] += 1
+        fixture_id = request.query.get("fixture", "")
+        fixture = self._fixtures.get(int(fixture_id)) if fixture_id.isdigit() else None
+        if fixture is None:
+            return self._respond([])
+        _, elapsed = fixture_status(fixture["clock"]())
+        minute = elapsed or 0
+        return self._respond(
+            [
+                {"team": {"id": team_id}, "statistics": _statistics(minute, side)}
+                for side, team_id in enumerate(fixture["teams"])
+            ]
+        )
+
+
+def _statistics(minute: int, side: int) -> list[dict]:
+    """Monoton wachsende Werte – Änderungen lösen live_stats_update aus."""
+    shots = minute // (7 + side * 2)
+    return [
+        {"type": "Shots on Goal", "value": shots // 3},
+        {"type": "Total Shots", "value": shots},
+        {"type": "Fouls", "value": minute // (9 - side)},
+        {"type": "Corner Kicks", "value": minute // (15 + side * 3)},
+        {"type": "Offsides", "value": minute // 30},
+        {"type": "Ball Possession", "value": f"{55 - side * 10}%"},
+        {"type": "Yellow Cards", "value": minute // (40 - side * 5)},
+        {"type": "Total passes", "value": minute * (6 - side)},
+        {"type": "Passes accurate", "value": minute * (5 - side)},
+    ]
+
+
+# ──────────────────────────────────────────
+# n8n
+# ──────────────────────────────────────────
+
+
+class N8nStub(_Stub):
+    """Beantwortet jeden Webhook sofort mit {"ok": true}."""
+
+    def _app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/webhook/{name:.*}", self._handle)
+        return app
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.calls[request.match_info["name"]] += 1
+        return web.json_response({"ok": True})
+
+    def webhook_env(self) -> dict[str, str]:
+        """N8N_WEBHOOK_*-Overrides für den Server-Prozess."""
+        paths = {
+            "N8N_WEBHOOK_LINEUP": "lineups",
+            "N8N_WEBHOOK_EVENTS": "Events",
+            "N8N_WEBHOOK_STATISTICS": "statistics",
+            "N8N_WEBHOOK_PLAYER_STATISTICS": "Player-Statistics",
+            "N8N_WEBHOOK_PREMATCH": "import-prematch",
+            "N8N_WEBHOOK_COMPETITIONS": "import-team-competitions",
+            "N8N_WEBHOOK_MATCHES": "import-matches",
+            "N8N_WEBHOOK_COUNTRY": "import-country",
+        }
+        return {key: f"{self.url}/webhook/{path}" for key, path in paths.items()}
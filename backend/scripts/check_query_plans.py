@@ -0,0 +1,125 @@
+"""
+Query-Plan-Check
+================
+Prüft per EXPLAIN, dass die heißen Abfragen (Ticker, Events, Medien,
+Clips, Verletzungen) die Indizes aus Migration 5d7b9e1f3a2c nutzen.
+
+Aufruf (aus backend/, gegen eine migrierte Datenbank):
+
+    python -m scripts.check_query_plans
+
+Sequenzielle Scans werden für die Prüfung abgeschaltet – auf kleinen
+Entwicklungs-Datenbanken würde der Planer sonst zu Recht den Seq Scan
+wählen. Geprüft wird also, ob ein passender Index *nutzbar* ist.
+Exit-Code 1, wenn eine Abfrage ihren Index nicht verwendet.
+"""
+
+import json
+import sys
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from app.core.database import engine
+from app.models.event import Event
+from app.models.media_clip import MediaClip
+from app.models.media_queue import MediaQueue
+from app.models.synthetic_event import SyntheticEvent
+from app.models.ticker_entry import TickerEntry
+
+# Beispielwerte – für den Plan zählt nur die Form der Abfrage
+_MATCH_ID = 1
+
+# (Beschreibung, Abfrage, erwarteter Index)
+HOT_QUERIES = [
+    (
+        "Events eines Spiels in Reihenfolge",
+        select(Event)
+        .where(Event.match_id == _MATCH_ID)
+        .order_by(Event.position, Event.time),
+        "ix_events_match_position",
+    ),
+    (
+        "Event per sourceId",
+        select(Event).where(Event.source_id == "sample"),
+        "ix_events_source_id",
+    ),
+    (
+        "Ticker eines Spiels (veröffentlicht)",
+        select(TickerEntry)
+        .where(TickerEntry.match_id == _MATCH_ID, TickerEntry.status == "published")
+        .order_by(TickerEntry.sort_key, TickerEntry.created_at),
+        "ix_ticker_entries_match_status_sort",
+    ),
+    (
+        "Phasen-Eintrag eines Spiels",
+        select(TickerEntry).where(
+            TickerEntry.match_id == _MATCH_ID, TickerEntry.phase == "FirstHalf"
+        ),
+        "ix_ticker_entries_match_phase",
+    ),
+    (
+        "Generierte Synthetic Events eines Spiels",
+        select(TickerEntry.synthetic_event_id).where(
+            TickerEntry.match_id == _MATCH_ID,
+            TickerEntry.synthetic_event_id.isnot(None),
+        ),
+        "ix_ticker_entries_match_synthetic",
+    ),
+    (
+        "Ticker-Eintrag zu einem Event",
+        select(TickerEntry).where(TickerEntry.event_id == 1),
+        "ix_ticker_entries_event_id",
+    ),
+    (
+        "Verletzungen vor dem Spiel",
+        select(SyntheticEvent).where(
+            SyntheticEvent.match_id == _MATCH_ID,
+            SyntheticEvent.type.like("pre_match_injuries%"),
+        ),
+        "ix_synthetic_events_match_type",
+    ),
+    (
+        "Offene Medien, neueste zuerst",
+        select(MediaQueue)
+        .where(MediaQueue.status == "pending")
+        .order_by(MediaQueue.created_at.desc()),
+        "ix_media_queue_pending_created",
+    ),
+    (
+        "Unveröffentlichte YouTube-Clips",
+        select(MediaClip)
+        .where(MediaClip.source == "youtube", MediaClip.published.is_(False))
+        .order_by(MediaClip.created_at.desc()),
+        "ix_media_clips_source_published_created",
+    ),
+]
+
+
+def _index_names(plan: dict) -> set[str]:
+    """Alle im Plan(-Baum) verwendeten Indizes."""
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+def main() -> int:
+    dialect = postgresql.dialect()
+    failures = 0
+    with engine.connect() as conn:
+        conn.execute(text("SET enable_seqscan = off"))
+        for label, query, expected in HOT_QUERIES:
+            sql = str(query.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+            raw = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+            plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+            used = _index_names(plan)
+            ok = expected in used
+            failures += not ok
+            print(f"{'OK  ' if ok else 'FAIL'} {label}: erwartet {expected}, "
+                  f"genutzt {', '.join(sorted(used)) or '–'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Test-Setup
+==========
+Unit-Tests laufen ohne Infrastruktur. Repository-Tests brauchen eine echte
+PostgreSQL-Datenbank (ON CONFLICT, JSONB, executemany-UPDATEs verhalten sich
+nur dort wie in Produktion):
+
+    TEST_DATABASE_URL=postgresql://localhost/liveticker_test pytest
+
+Das Schema wird per Base.metadata.create_all angelegt; jeder Test läuft in
+einer Transaktion, die danach zurückgerollt wird. Ohne TEST_DATABASE_URL
+werden DB-Tests übersprungen.
+"""
+
+import os
+
+# config.py verlangt DATABASE_URL schon beim Import
+os.environ.setdefault(
+    "DATABASE_URL",
+    os.environ.get("TEST_DATABASE_URL") or "postgresql://localhost/liveticker_test",
+)
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+
+# Alle Modelle importieren, damit Base.metadata alle Tabellen kennt (wie alembic/env.py)
+from app.models import (  # noqa: E402,F401
+    competition,
+    competition_team,
+    country,
+    event,
+    lineup,
+    llm_cache_entry,
+    match,
+    match_statistic,
+    media_clip,
+    media_queue,
+    player,
+    player_statistic,
+    season,
+    standing,
+    style_reference,
+    synthetic_event,
+    team,
+    ticker_entry,
+)
+
+
+@pytest.fixture(scope="session")
+def engine():
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL nicht gesetzt")
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """Session in einer äußeren Transaktion; commit() setzt nur Savepoints."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
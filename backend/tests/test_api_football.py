@@ -0,0 +1,57 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.api_football import ApiFootballClient, ApiFootballError
+
+
+def _client(handler) -> ApiFootballClient:
+    client = ApiFootballClient(
+        base_url="https://api-football.invalid",
+        api_key="test",
+        requests_per_minute=600,
+        ttl_live=10,
+        ttl_static=60,
+    )
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_coalesced_waiters():
+    release = asyncio.Event()
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return httpx.Response(200, json={"errors": [], "response": [{"id": 1}]})
+
+    client = _client(handler)
+    leader = asyncio.create_task(client.get("/fixtures", {"id": 1}))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(client.get("/fixtures", {"id": 1}))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == [{"id": 1}]
+    assert leader.cancelled()
+    assert calls == 1
+    assert client.stats()["coalesced"] == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_non_json_body_raises_api_football_error():
+    client = _client(lambda request: httpx.Response(200, text="<html>Wartung</html>"))
+
+    with pytest.raises(ApiFootballError):
+        await client.get("/fixtures", {"id": 1})
+    await client.aclose()
@@ -0,0 +1,33 @@
+import asyncio
+import os
+
+import psycopg2
+import pytest
+import pytest_asyncio
+
+from app.core.broadcast import PostgresBroadcast
+
+
+@pytest_asyncio.fixture
+async def pg_broadcast():
+    dsn = os.environ.get("TEST_DATABASE_URL")
+    if not dsn:
+        pytest.skip("TEST_DATABASE_URL nicht gesetzt")
+    bus = PostgresBroadcast(dsn, queue_size=10)
+    await bus.connect()
+    yield bus
+    await bus.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_publish_reopens_broken_notify_connection(pg_broadcast):
+    sub = pg_broadcast.subscribe("ticker")
+    pid = pg_broadcast._notify_conn.get_backend_pid()
+    with psycopg2.connect(pg_broadcast.dsn) as admin, admin.cursor() as cur:
+        cur.execute("SELECT pg_terminate_backend(%s)", (pid,))
+    admin.close()
+
+    await pg_broadcast.publish("ticker", "nach Abbruch")
+
+    assert await asyncio.wait_for(sub.get(), timeout=5) == "nach Abbruch"
+    assert pg_broadcast._notify_conn.get_backend_pid() != pid
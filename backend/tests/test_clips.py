@@ -0,0 +1,97 @@
+from app.api.v1.clips import _rewrite_thumbnail_urls, import_clips
+from app.models.media_clip import MediaClip
+from app.schemas.media_clip import MediaClipImportRequest
+
+
+def _clip(db, vid: str, thumbnail_url: str) -> MediaClip:
+    clip = MediaClip(
+        vid=vid, video_url=f"https://example.invalid/{vid}", thumbnail_url=thumbnail_url
+    )
+    db.add(clip)
+    db.commit()
+    return clip
+
+
+def test_rewrite_thumbnail_urls_updates_only_given_vids(db):
+    first = _clip(db, "v-1", "https://cdn.invalid/1.jpg")
+    second = _clip(db, "v-2", "https://cdn.invalid/2.jpg")
+    other = _clip(db, "v-3", "https://cdn.invalid/3.jpg")
+
+    _rewrite_thumbnail_urls(
+        db, {"v-1": "/api/v1/thumbnails/aaa.jpg", "v-2": "/api/v1/thumbnails/bbb.jpg"}
+    )
+
+    db.expire_all()
+    assert first.thumbnail_url == "/api/v1/thumbnails/aaa.jpg"
+    assert second.thumbnail_url == "/api/v1/thumbnails/bbb.jpg"
+    assert other.thumbnail_url == "https://cdn.invalid/3.jpg"
+
+
+def _import(db, *clips: dict, match_id=None):
+    return import_clips(
+        MediaClipImportRequest(match_id=match_id, clips=list(clips)), db=db
+    )
+
+
+def test_import_clips_defaults_source_only_for_new_clips(db):
+    [created] = _import(
+        db, {"vid": "v-1", "video_url": "https://x.invalid/1", "source": None}
+    )
+    assert created.source == "bundesliga"
+
+    existing = _clip(db, "v-2", "https://cdn.invalid/2.jpg")
+    existing.source = "dfl"
+    db.commit()
+    [merged] = _import(
+        db, {"vid": "v-2", "video_url": "https://x.invalid/2", "source": None}
+    )
+    assert merged.source == "dfl"
+    db.expire_all()
+    assert existing.source == "dfl"
+
+
+def test_import_clips_keeps_existing_values_for_empty_fields(db):
+    existing = _clip(db, "v-1", "https://cdn.invalid/1.jpg")
+    existing.title = "Tor durch Musiala"
+    db.commit()
+
+    [merged] = _import(
+        db,
+        {
+            "vid": "v-1",
+            "video_url": "https://x.invalid/new",
+            "title": "",
+            "team_name": "FCB",
+        },
+    )
+
+    assert merged.id == existing.id
+    assert merged.title == "Tor durch Musiala"
+    assert merged.thumbnail_url == "https://cdn.invalid/1.jpg"
+    assert merged.team_name == "FCB"
+    # video_url einer bekannten vid bleibt
+    assert merged.video_url == "https://example.invalid/v-1"
+
+
+def test_import_clips_merges_duplicate_vids_in_batch(db):
+    results = _import(
+        db,
+        {
+            "vid": "v-1",
+            "video_url": "https://x.invalid/1",
+            "title": "erst",
+            "source": "dfl",
+        },
+        {
+            "vid": "v-1",
+            "video_url": "https://x.invalid/1",
+            "title": None,
+            "source": None,
+        },
+        {"video_url": "https://x.invalid/ohne-vid", "source": None},
+    )
+
+    assert [r.title for r in results[:2]] == ["erst", "erst"]
+    assert results[0].source == results[1].source == "dfl"
+    assert results[2].vid is None
+    assert results[2].source == "bundesliga"
@@ -0,0 +1,34 @@
+import logging
+
+import pytest
+
+from app.services import live_stats as live_stats_module
+from app.services import live_sync as live_sync_module
+from app.services.live_stats import LiveStatsMonitor
+from app.services.live_sync import LiveSyncScheduler
+
+
+@pytest.mark.asyncio
+async def test_live_sync_without_api_key_is_inactive_and_warns(monkeypatch, caplog):
+    monkeypatch.setattr(live_sync_module.settings, "LIVE_SYNC_ENABLED", True)
+    monkeypatch.setattr(live_sync_module.api_football, "api_key", None)
+    scheduler = LiveSyncScheduler(interval=60)
+
+    with caplog.at_level(logging.WARNING):
+        await scheduler.start()
+
+    assert not scheduler.active
+    assert "API_FOOTBALL_KEY" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_live_stats_without_api_key_is_inactive_and_warns(monkeypatch, caplog):
+    monkeypatch.setattr(live_stats_module.settings, "LIVE_STATS_ENABLED", True)
+    monkeypatch.setattr(live_stats_module.api_football, "api_key", None)
+    monitor = LiveStatsMonitor(interval=300)
+
+    with caplog.at_level(logging.WARNING):
+        await monitor.start()
+
+    assert not monitor.active
+    assert "API_FOOTBALL_KEY" in caplog.text
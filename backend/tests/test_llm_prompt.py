@@ -0,0 +1,28 @@
+from app.services.llm_service import llm_service
+
+
+def test_live_stats_prompt_contains_monitor_triggers():
+    # Payload wie von services/live_stats._apply_statistics
+    data = {
+        "minute": 63,
+        "home_team": "Eintracht Frankfurt",
+        "away_team": "FC Bayern",
+        "triggers": ["Eintracht Frankfurt: Ecken 3 → 5"],
+        "prev_stats": {"home": {"corner_kicks": 3}, "away": {}},
+        "curr_stats": {"home": {"corner_kicks": 5}, "away": {}},
+    }
+
+    prompt = llm_service._build_prompt(
+        event_type="live_stats_update",
+        event_detail="",
+        minute=63,
+        player_name=None,
+        assist_name=None,
+        team_name=None,
+        style="neutral",
+        language="de",
+        context_data=data,
+    )
+
+    assert "Auslöser: Eintracht Frankfurt: Ecken 3 → 5" in prompt
+    assert "'corner_kicks': 5" in prompt
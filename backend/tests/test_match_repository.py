@@ -0,0 +1,45 @@
+from datetime import datetime, timezone
+
+from app.models.match import Match
+from app.models.team import Team
+from app.repositories.match_repository import MatchRepository
+
+
+def _live_match(db, external_id: int) -> Match:
+    home = Team(name=f"Home {external_id}", source="test")
+    away = Team(name=f"Away {external_id}", source="test")
+    match = Match(
+        external_id=external_id,
+        home_team=home,
+        away_team=away,
+        match_state="Live",
+        match_phase="FirstHalf",
+        minute=10,
+        starts_at=datetime.now(timezone.utc),
+        source="test",
+    )
+    db.add_all([home, away, match])
+    db.commit()
+    return match
+
+
+def test_bulk_update_live_writes_minute_and_phase(db):
+    first = _live_match(db, 1001)
+    second = _live_match(db, 1002)
+    untouched = _live_match(db, 1003)
+
+    MatchRepository(db).bulk_update_live(
+        [
+            {"id": first.id, "minute": 46, "match_phase": "SecondHalf"},
+            {"id": second.id, "minute": 45, "match_phase": "FirstHalfBreak"},
+        ]
+    )
+
+    db.expire_all()
+    assert (first.minute, first.match_phase) == (46, "SecondHalf")
+    assert (second.minute, second.match_phase) == (45, "FirstHalfBreak")
+    assert (untouched.minute, untouched.match_phase) == (10, "FirstHalf")
+
+
+def test_bulk_update_live_without_updates_is_noop(db):
+    MatchRepository(db).bulk_update_live([])
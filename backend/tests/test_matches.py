@@ -0,0 +1,37 @@
+import pytest
+
+from app.api.v1 import matches
+from app.services.api_football import api_football
+from tests.test_match_repository import _live_match
+
+
+class _NoCloseSession:
+    """Test-Session für SessionLocal(); close() darf die Test-Transaktion nicht beenden."""
+
+    def __init__(self, db) -> None:
+        self._db = db
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_sync_live_writes_fixture_minute_and_phase(db, monkeypatch):
+    match = _live_match(db, 2001)
+
+    async def fake_get(endpoint, params=None, ttl=None):
+        assert params == {"id": 2001}
+        return [{"fixture": {"id": 2001, "status": {"short": "2H", "elapsed": 52}}}]
+
+    monkeypatch.setattr(matches, "SessionLocal", lambda: _NoCloseSession(db))
+    monkeypatch.setattr(api_football, "api_key", "test")
+    monkeypatch.setattr(api_football, "get", fake_get)
+
+    response = await matches.sync_live(match.id)
+
+    assert (response.minute, response.match_phase) == (52, "SecondHalf")
+    db.expire_all()
+    assert (match.minute, match.match_phase) == (52, "SecondHalf")
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.match import Match
+from app.models.team import Team
+from app.repositories.match_repository import _SORT_KEY, MatchRepository
+from app.utils.pagination import decode_cursor, encode_cursor
+
+KICKOFF = datetime(2026, 5, 16, 15, 30, tzinfo=timezone.utc)
+
+
+def test_cursor_round_trip_restores_typed_values():
+    item = SimpleNamespace(starts_at=KICKOFF, id=42)
+
+    cursor = encode_cursor(_SORT_KEY, item)
+
+    assert decode_cursor(_SORT_KEY, cursor) == [KICKOFF, 42]
+
+
+def test_cursor_round_trip_keeps_null_sort_value():
+    item = SimpleNamespace(starts_at=None, id=7)
+
+    assert decode_cursor(_SORT_KEY, encode_cursor(_SORT_KEY, item)) == [None, 7]
+
+
+@pytest.mark.parametrize("cursor", ["kein-cursor", "", "e30"])
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(_SORT_KEY, cursor)
+
+
+def test_decode_cursor_rejects_other_sort_order():
+    cursor = encode_cursor(_SORT_KEY, SimpleNamespace(starts_at=KICKOFF, id=1))
+    ascending = [(column, False) for column, _ in _SORT_KEY]
+
+    with pytest.raises(ValueError):
+        decode_cursor(ascending, cursor)
+
+
+def test_keyset_pages_match_offset_order(db):
+    home = Team(name="Home", source="test")
+    away = Team(name="Away", source="test")
+    # Gleiche Anstoßzeiten (Tie-Break über id) und Spiele ohne Termin (NULL)
+    kickoffs = [KICKOFF, KICKOFF, KICKOFF - timedelta(days=7), None, KICKOFF, None]
+    db.add_all(
+        [home, away]
+        + [
+            Match(home_team=home, away_team=away, starts_at=k, source="test")
+            for k in kickoffs
+        ]
+    )
+    db.commit()
+    repo = MatchRepository(db)
+    expected = [m.id for m in repo.get_paginated(page_size=100).items]
+
+    seen, cursor = [], None
+    while True:
+        page = repo.get_paginated(page_size=2, cursor=cursor, with_total=False)
+        seen.extend(m.id for m in page.items)
+        if not page.has_next_page:
+            break
+        cursor = page.next_cursor
+
+    assert len(expected) == len(kickoffs)
+    assert seen == expected
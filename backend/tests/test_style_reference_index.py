@@ -0,0 +1,26 @@
+import random
+
+from app.services.style_reference_index import StyleReferenceIndex
+
+_ROWS = [
+    ("ef_whitelabel", "goal", "Bundesliga", f"Tor-Referenz Nummer {i:02d} mit Text")
+    for i in range(20)
+]
+
+
+def _sample(rows, seed: str) -> list[str]:
+    index = StyleReferenceIndex(ttl_seconds=60)
+    return index.sample(
+        lambda min_length: rows,
+        event_type="goal",
+        league="Bundesliga",
+        rng=random.Random(seed),
+    )
+
+
+def test_seeded_sample_does_not_depend_on_row_order():
+    shuffled = list(_ROWS)
+    random.Random(1).shuffle(shuffled)
+
+    assert _sample(_ROWS, "goal|Kopfball|23") == _sample(shuffled, "goal|Kopfball|23")
+
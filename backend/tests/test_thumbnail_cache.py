@@ -0,0 +1,82 @@
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import thumbnails
+from app.services import thumbnail_cache as thumbnail_cache_module
+from app.services.thumbnail_cache import DiskQuota, ThumbnailCache
+
+
+def _write(path, size: int, mtime: float) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_quota_evicts_variants_but_never_originals(tmp_path):
+    old_original = _write(tmp_path / "aaa.jpg", 400, 1000)
+    old_variant = _write(tmp_path / "small" / "aaa.jpg", 300, 1001)
+    new_variant = _write(tmp_path / "medium" / "aaa.jpg", 300, 2000)
+    quota = DiskQuota(str(tmp_path), max_bytes=1300)
+
+    new_original = _write(tmp_path / "bbb.jpg", 400, 3000)
+    await quota.add(new_original)
+
+    assert os.path.exists(old_original)
+    assert os.path.exists(new_original)
+    assert not os.path.exists(old_variant)
+    assert os.path.exists(new_variant)
+    assert quota.total_bytes == 1100
+
+
+@pytest.mark.asyncio
+async def test_quota_keeps_originals_over_quota(tmp_path):
+    first = _write(tmp_path / "aaa.jpg", 400, 1000)
+    quota = DiskQuota(str(tmp_path), max_bytes=500)
+
+    second = _write(tmp_path / "bbb.jpg", 400, 2000)
+    await quota.add(second)
+
+    assert os.path.exists(first) and os.path.exists(second)
+    assert quota.total_bytes == 800
+
+
+@pytest.fixture
+def thumbnails_client(tmp_path, monkeypatch):
+    cache = ThumbnailCache(
+        directory=str(tmp_path),
+        public_base_url="http://testserver",
+        max_concurrency=1,
+        max_bytes=1024,
+        quota_bytes=1024 * 1024,
+        variant_workers=1,
+    )
+    monkeypatch.setattr(thumbnails, "thumbnail_cache", cache)
+    app = FastAPI()
+    app.include_router(thumbnails.router)
+    _write(tmp_path / "abc.jpg", 10, 1000)
+    return TestClient(app)
+
+
+def test_variant_fallback_is_served_as_original(thumbnails_client, monkeypatch):
+    # Ohne Pillow gibt resolve() das Original zurück
+    monkeypatch.setattr(thumbnail_cache_module, "Image", None)
+
+    resp = thumbnails_client.get("/thumbnails/abc.jpg?size=small")
+
+    assert resp.status_code == 200
+    assert resp.headers["etag"] == '"abc.jpg-original"'
+    assert "immutable" not in resp.headers["cache-control"]
+
+
+def test_thumbnail_if_none_match_accepts_weak_etag_lists(thumbnails_client):
+    resp = thumbnails_client.get(
+        "/thumbnails/abc.jpg", headers={"If-None-Match": 'W/"x", W/"abc.jpg-original"'}
+    )
+
+    assert resp.status_code == 304
@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+import pytest
+
+from app.core.websocket import ClientConnection, ConnectionGroup
+from app.services.ticker_feed import TickerFeedManager
+
+
+class FakeWebSocket:
+    """Hält send_text an, bis release() gerufen wird – simuliert einen langsamen Client."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+        self._open = asyncio.Event()
+
+    async def accept(self) -> None:
+        pass
+
+    def release(self) -> None:
+        self._open.set()
+
+    async def send_text(self, text: str) -> None:
+        await self._open.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self) -> None:
+        pass
+
+
+async def _drain(websocket: FakeWebSocket, count: int) -> None:
+    websocket.release()
+    for _ in range(100):
+        if len(websocket.sent) >= count:
+            return
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_message_moves_to_tail():
+    websocket = FakeWebSocket()
+    client = ClientConnection(websocket, queue_size=10, heartbeat_interval=60)
+    client.start()
+    await asyncio.sleep(0)  # Writer hängt jetzt im ersten send_text
+
+    client.send_json({"n": 0})
+    client.send_json({"n": 1}, coalesce_key="a")
+    client.send_json({"n": 2})
+    client.send_json({"n": 3}, coalesce_key="a")
+    await _drain(websocket, 3)
+    await client.close()
+    await asyncio.sleep(0.01)  # abgebrochene Writer-Tasks auslaufen lassen
+
+    assert [m["n"] for m in websocket.sent] == [0, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_ticker_deltas_keep_seq_order_for_a_slow_client():
+    feed = TickerFeedManager()
+    group = ConnectionGroup(queue_size=10, heartbeat_interval=60)
+    feed.active_connections[1] = group
+    websocket = FakeWebSocket()
+    await group.connect(websocket)
+    await asyncio.sleep(0)
+
+    # Zwei Updates desselben Eintrags mit einem anderen dazwischen
+    feed._dispatch(1, "created", {"id": 5})
+    feed._dispatch(1, "created", {"id": 6})
+    feed._dispatch(1, "updated", {"id": 5})
+    await _drain(websocket, 3)
+    for client in list(group.clients):
+        await group.disconnect(client)
+    await asyncio.sleep(0.01)  # abgebrochene Writer-Tasks auslaufen lassen
+
+    assert [m["seq"] for m in websocket.sent] == [1, 2, 3]
@@ -140,6 +140,7 @@ export const triggerMatchPhases = (fixtureId, minute) =>
 export const generateMatchSummary = (matchId, phase, style = "emotional") =>
   n8n.post("/match-summary", { match_id: matchId, phase, style });
 
+// Nur als Fallback, wenn der Live-Stats-Monitor im Backend inaktiv ist
 export const triggerLiveStatsMonitor = (matchId) =>
   n8n.post("/live-stats-monitor", { match_id: matchId });
 
@@ -23,6 +23,7 @@ import { RightPanel } from "./panels/RightPanel";
 import { StartScreen } from "./components/StartScreen";
 import { Breadcrumb } from "./components/Breadcrumb";
 import { useApiStatus, API_STATUS_CFG } from "../../hooks/useApiStatus";
+import { useServerSchedulers } from "../../hooks/useServerSchedulers";
 
 export default function LiveTicker() {
   // ── App Loading ───────────────────────────────────────────
@@ -123,6 +124,7 @@ export default function LiveTicker() {
   const liveMinute = useLiveMinute(match);
   const apiStatus = useApiStatus();
   const apiCfg    = API_STATUS_CFG[apiStatus];
+  const schedulers = useServerSchedulers();
 
   // ── Aktiver Draft ─────────────────────────────────────────
   const [activeDraftId, setActiveDraftId] = useState(null);
@@ -200,8 +202,11 @@ export default function LiveTicker() {
     }
   }, [selMatchId, match?.matchPhase, match?.matchState, tickerTexts]);
 
-  // ── Live Stats Monitor (alle 5 Min bei laufendem oder beendetem Spiel) ───
+  // Live-Statistik-Updates erzeugt der Live-Stats-Monitor im Backend
+  // (services/live_stats) – neue Einträge kommen über den Ticker-Feed.
+  // ── Fallback: Monitor inaktiv → n8n alle 5 Min anstoßen ──────
   useEffect(() => {
+    if (schedulers.liveStats !== false) return;
     if (!selMatchId || !match?.matchState) return;
     if (match.matchState === "PreMatch") return;
     api.triggerLiveStatsMonitor(selMatchId).catch(() => {});
@@ -210,7 +215,7 @@ export default function LiveTicker() {
       api.triggerLiveStatsMonitor(selMatchId).catch(() => {});
     }, 5 * 60 * 1000);
     return () => clearInterval(interval);
-  }, [selMatchId, match?.matchState]);
+  }, [schedulers.liveStats, selMatchId, match?.matchState]);
 
   // ── Match-Status Webhook beim Match-Open ──────────────────
   const matchStatusTriggeredRef = useRef(null);
@@ -603,6 +608,7 @@ export default function LiveTicker() {
           <MatchHeader
             match={match}
             leagueSeason={curCompetition}
+            serverMinuteSync={schedulers.liveSync}
             onMinuteSync={reload.loadMatch}
           />
         )}
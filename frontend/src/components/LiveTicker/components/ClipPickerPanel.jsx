@@ -44,7 +44,7 @@ function VideoOrThumb({ clip }) {
     >
       {clip.thumbnail_url && (
         <img
-          src={clip.thumbnail_url}
+          src={clip.thumbnail_medium_url ?? clip.thumbnail_url}
           alt={clip.title ?? "Clip"}
           style={{ position: "absolute", inset: 0, width: "100%", height: "100%", objectFit: "cover", display: "block" }}
         />
@@ -310,7 +310,7 @@ function ClipThumbnail({ clip, onClick, onDelete }) {
       >
         {clip.thumbnail_url ? (
           <img
-            src={clip.thumbnail_url}
+            src={clip.thumbnail_small_url ?? clip.thumbnail_url}
             alt={clip.player_name ?? "Clip"}
             style={{ width: "100%", height: "100%", objectFit: "cover", display: "block" }}
             loading="lazy"
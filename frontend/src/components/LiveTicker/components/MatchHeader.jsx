@@ -6,25 +6,26 @@ import { normalizeMatchStatus } from "../utils/parseCommand";
 import { useLiveMinute } from "../../../hooks/useLiveMinute";
 import * as api from "../../../api";
 
-export function MatchHeader({ match, leagueSeason, onMinuteSync }) {
+// Minute/Phase synchronisiert der Live-Sync-Scheduler im Backend für alle
+// Live-Spiele und pusht sie über den Ticker-Feed (match_update). Ist er
+// inaktiv (serverMinuteSync === false, z.B. ohne API_FOOTBALL_KEY), stößt der
+// Header wie früher minütlich den n8n-Minuten-Sync an.
+export function MatchHeader({ match, leagueSeason, serverMinuteSync, onMinuteSync }) {
   const status = normalizeMatchStatus(match?.matchState);
   const liveMinute = useLiveMinute(match);
 
   useEffect(() => {
-    console.log("[MatchHeader] sync effect", { status, externalId: match?.externalId, currentMinute: match?.minute });
+    if (serverMinuteSync !== false) return;
     if (status !== "live" || !match?.externalId) return;
     const sync = () =>
       api.triggerMinuteUpdate(match.externalId)
-        .then((res) => {
-          console.log("[MatchHeader] webhook ok, calling loadMatch", res?.data);
-          return onMinuteSync?.();
-        })
-        .then(() => console.log("[MatchHeader] loadMatch done, match.minute =", match?.minute))
+        .then(() => onMinuteSync?.())
         .catch((e) => console.error("[MatchHeader] sync error", e));
     sync();
     const id = setInterval(sync, 60000);
     return () => clearInterval(id);
-  }, [status, match?.externalId]);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [serverMinuteSync, status, match?.externalId]);
 
   if (!match || !match.homeTeam || !match.awayTeam) return null;
   const homeAbbr = match.homeTeam.name.substring(0, 3).toUpperCase();
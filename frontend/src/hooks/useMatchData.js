@@ -1,5 +1,6 @@
 import { useState, useEffect, useCallback, useRef } from "react";
 import * as api from "../api";
+import { applyTickerDelta, useTickerFeed } from "./useTickerFeed";
 
 export function useMatchData(selectedMatchId) {
   const [match, setMatch] = useState(null);
@@ -39,8 +40,13 @@ export function useMatchData(selectedMatchId) {
     }
   }, [selectedMatchId]);
 
-  const loadTickerTexts = useCallback(async () => {
+  // Solange der Ticker-Feed verbunden ist, kommen Änderungen als Deltas –
+  // Neuladen nur noch erzwungen (Initial-Load, Resync).
+  const feedConnectedRef = useRef(false);
+
+  const loadTickerTexts = useCallback(async (force = false) => {
     if (!selectedMatchId) return;
+    if (feedConnectedRef.current && force !== true) return;
     try {
       const res = await api.fetchTickerTexts(selectedMatchId);
       setTickerTexts(res.data);
@@ -49,6 +55,26 @@ export function useMatchData(selectedMatchId) {
     }
   }, [selectedMatchId]);
 
+  const handleTickerDelta = useCallback((msg) => {
+    setTickerTexts((prev) => applyTickerDelta(prev, msg));
+  }, []);
+  const handleTickerResync = useCallback(() => loadTickerTexts(true), [loadTickerTexts]);
+  // Minute/Phase kommen vom Live-Sync-Scheduler im Backend
+  const handleMatchUpdate = useCallback((msg) => {
+    setMatch((prev) => {
+      if (!prev || prev.id !== msg.match_id) return prev;
+      const next = { ...prev, minute: msg.minute, matchPhase: msg.match_phase };
+      matchRef.current = next;
+      return next;
+    });
+  }, []);
+  feedConnectedRef.current = useTickerFeed(
+    selectedMatchId,
+    handleTickerDelta,
+    handleTickerResync,
+    handleMatchUpdate,
+  );
+
   const loadPrematch = useCallback(async () => {
     if (!selectedMatchId) return;
     try {
@@ -147,7 +173,7 @@ export function useMatchData(selectedMatchId) {
     Promise.all([
       matchAndPlayers,
       loadEvents(),
-      loadTickerTexts(),
+      loadTickerTexts(true),
       loadPrematch(),
       loadLiveStats(),
       loadLineups(),
@@ -171,7 +197,7 @@ export function useMatchData(selectedMatchId) {
 
     intervalRef.current = setInterval(() => {
       loadEvents();
-      loadTickerTexts();
+      loadTickerTexts(); // Fallback, übersprungen solange der Feed verbunden ist
       loadLiveStats();
       loadInjuries();
       loadMatch();
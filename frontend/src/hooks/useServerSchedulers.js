@@ -0,0 +1,40 @@
+import { useState, useEffect } from "react";
+import config from "../config/whitelabel";
+
+const HEALTH_URL = config.apiBase.split("/api")[0] + "/health";
+
+/**
+ * useServerSchedulers
+ *
+ * Welche Live-Scheduler laufen im Backend (GET /health → schedulers)?
+ * Fehlt dort z.B. API_FOOTBALL_KEY, sind sie inaktiv und das Frontend
+ * übernimmt wie früher per n8n-Trigger.
+ *
+ * @returns {{liveSync: boolean|null, liveStats: boolean|null}}
+ *          null = (noch) unbekannt, false = inaktiv → Fallback
+ */
+export function useServerSchedulers() {
+  const [schedulers, setSchedulers] = useState({ liveSync: null, liveStats: null });
+
+  useEffect(() => {
+    let cancelled = false;
+    async function check() {
+      try {
+        const res = await fetch(HEALTH_URL, { signal: AbortSignal.timeout(4000) });
+        if (!res.ok) return;
+        const data = await res.json().catch(() => null);
+        if (cancelled || !data) return;
+        // Backend ohne schedulers-Feld → keine Server-Scheduler
+        const s = data.schedulers ?? {};
+        setSchedulers({ liveSync: !!s.live_sync, liveStats: !!s.live_stats });
+      } catch {
+        // Backend nicht erreichbar – letzten Stand behalten
+      }
+    }
+    check();
+    const id = setInterval(check, 60000);
+    return () => { cancelled = true; clearInterval(id); };
+  }, []);
+
+  return schedulers;
+}
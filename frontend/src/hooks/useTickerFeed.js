@@ -0,0 +1,178 @@
+import { useEffect, useRef, useState } from "react";
+import config from "../config/whitelabel";
+
+// http://localhost:8001/api/v1 → ws://localhost:8001/ws/ticker/{matchId}
+const WS_BASE = config.apiBase.replace(/^http/, "ws").replace(/\/api\/v1.*$/, "") + "/ws/ticker";
+
+// Exponential Backoff: 1s → 2s → 4s → 8s → max 30s
+const BASE_DELAY_MS = 1000;
+const MAX_DELAY_MS = 30_000;
+
+// Gleiche Reihenfolge wie TickerEntryRepository.get_by_match im Backend
+const PHASE_ORDER = {
+  Before: 0,
+  FirstHalf: 1,
+  FirstHalfBreak: 2,
+  SecondHalf: 3,
+  SecondHalfBreak: 4,
+  ExtraFirstHalf: 5,
+  ExtraBreak: 6,
+  ExtraSecondHalf: 7,
+  ExtraSecondHalfBreak: 8,
+  PenaltyShootout: 9,
+  After: 10,
+};
+const PHASE_FIRST = new Set(["FirstHalf", "SecondHalf", "ExtraFirstHalf", "ExtraSecondHalf", "PenaltyShootout"]);
+
+function sortKey(e) {
+  return [
+    e.phase ? PHASE_ORDER[e.phase] ?? 5 : 5,
+    e.minute ?? 999,
+    e.synthetic_event_id != null && PHASE_FIRST.has(e.phase) ? 0 : 1,
+    new Date(e.created_at).getTime(),
+  ];
+}
+
+function compareEntries(a, b) {
+  const ka = sortKey(a);
+  const kb = sortKey(b);
+  for (let i = 0; i < ka.length; i++) {
+    if (ka[i] !== kb[i]) return ka[i] - kb[i];
+  }
+  return 0;
+}
+
+/**
+ * Wendet ein Ticker-Delta ({op, entry}) auf die Liste an.
+ */
+export function applyTickerDelta(list, msg) {
+  const rest = list.filter((e) => e.id !== msg.entry.id);
+  if (msg.op === "deleted") return rest;
+  return [...rest, msg.entry].sort(compareEntries);
+}
+
+/**
+ * useTickerFeed
+ *
+ * Abonniert /ws/ticker/{matchId} und liefert Ticker-Deltas statt Polling.
+ * Nach Reconnect wird mit ?since=<seq>&epoch=<epoch> fortgesetzt; kann der
+ * Server die Lücke nicht nachliefern (oder beim ersten Verbinden), wird
+ * onResync aufgerufen → Liste einmal komplett laden. Ebenso bei einer Lücke
+ * in seq während der Verbindung.
+ *
+ * @param {number|null} matchId
+ * @param {(msg: object) => void} onDelta   – Callback pro Delta
+ * @param {() => void} onResync            – Liste komplett neu laden
+ * @param {(msg: object) => void} [onNotify] – Zustandsmeldungen ohne seq (z.B. match_update)
+ * @returns {boolean} connected
+ */
+export function useTickerFeed(matchId, onDelta, onResync, onNotify) {
+  const [connected, setConnected] = useState(false);
+  const onDeltaRef = useRef(onDelta);
+  const onResyncRef = useRef(onResync);
+  const onNotifyRef = useRef(onNotify);
+
+  // Refs aktuell halten ohne reconnect zu triggern
+  useEffect(() => {
+    onDeltaRef.current = onDelta;
+    onResyncRef.current = onResync;
+    onNotifyRef.current = onNotify;
+  }, [onDelta, onResync, onNotify]);
+
+  useEffect(() => {
+    if (!matchId) return undefined;
+
+    let ws = null;
+    let retryCount = 0;
+    let retryTimer = null;
+    let active = true;
+    let epoch = null;
+    let seq = null;
+
+    const connect = () => {
+      const params = seq != null && epoch ? `?since=${seq}&epoch=${epoch}` : "";
+      try {
+        ws = new WebSocket(`${WS_BASE}/${matchId}${params}`);
+      } catch (err) {
+        console.error("[TickerWS] Verbindung fehlgeschlagen:", err);
+        return;
+      }
+
+      ws.onopen = () => {
+        if (!active) return;
+        retryCount = 0;
+        setConnected(true);
+      };
+
+      ws.onmessage = (evt) => {
+        if (!active) return;
+        let msg;
+        try {
+          msg = JSON.parse(evt.data);
+        } catch (e) {
+          console.warn("[TickerWS] Nachricht konnte nicht geparst werden:", e);
+          return;
+        }
+        if (msg.type === "hello") {
+          const resumed = seq != null && msg.epoch === epoch;
+          epoch = msg.epoch;
+          if (!resumed) {
+            seq = msg.seq;
+            onResyncRef.current();
+          }
+        } else if (msg.type === "resync") {
+          seq = null;
+          onResyncRef.current();
+        } else if (msg.type === "ticker_delta") {
+          if (msg.epoch !== epoch) {
+            epoch = msg.epoch;
+            seq = null;
+          }
+          // Duplikate (Replay + Live) über die Sequenznummer verwerfen
+          if (seq != null && msg.seq <= seq) return;
+          // Lücke → Delta verpasst, Liste komplett neu laden
+          const gap = seq != null && msg.seq > seq + 1;
+          seq = msg.seq;
+          if (gap) {
+            onResyncRef.current();
+            return;
+          }
+          onDeltaRef.current(msg);
+        } else if (msg.type === "match_update") {
+          onNotifyRef.current?.(msg);
+        }
+      };
+
+      ws.onclose = () => {
+        if (!active) return;
+        ws = null;
+        setConnected(false);
+        const delay = Math.min(BASE_DELAY_MS * 2 ** retryCount, MAX_DELAY_MS);
+        retryCount += 1;
+        console.debug(`[TickerWS] Verbindung getrennt – Reconnect in ${delay}ms`);
+        retryTimer = setTimeout(() => {
+          if (active) connect();
+        }, delay);
+      };
+
+      ws.onerror = (err) => {
+        console.warn("[TickerWS] Fehler:", err);
+        ws.close(); // löst onclose → reconnect aus
+      };
+    };
+
+    connect();
+
+    return () => {
+      active = false;
+      setConnected(false);
+      clearTimeout(retryTimer);
+      if (ws) {
+        ws.onclose = null; // verhindert Reconnect beim Unmount
+        ws.close();
+      }
+    };
+  }, [matchId]);
+
+  return connected;
+}